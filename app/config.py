@@ -21,6 +21,7 @@ class Settings(BaseSettings):
     # ===========================
     model_load_mode: str = "s3"  # "local" 또는 "s3"
     local_model_path: str = "./temp"
+    prefer_int8_model: bool = True  # 같은 모델의 int8 양자화 버전(*.int8.onnx)이 있으면 우선 사용
     
     @field_validator('model_load_mode')
     @classmethod
@@ -131,6 +132,13 @@ class Settings(BaseSettings):
             )
         return v.lower()
     
+    # ===========================
+    # 응답 캐시 설정
+    # ===========================
+    # GET /api/predictions 응답 캐시 TTL (초) - API로 저장 시 즉시 무효화,
+    # 배치 서버가 DB에 직접 쓰는 경우에는 TTL 이후 반영
+    predictions_cache_ttl_seconds: int = 60
+    
     # ===========================
     # 기타 설정
     # ===========================
@@ -1,10 +1,75 @@
-from sqlalchemy.orm import Session, defer
-from sqlalchemy import func, and_
+from sqlalchemy.orm import Session, defer, load_only
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, and_, insert, select, lambda_stmt, exists, literal, values, column, Date, Float, Numeric
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from datetime import date, datetime, timedelta
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Union
+import csv
+import io
+import threading
 
-from . import datatable, dataschemas
+from cachetools import TTLCache
+
+from . import datatable, dataschemas, response_cache
+
+# 자주 호출되는 단순 조회는 lambda_stmt로 작성하여 SQL 구성/컴파일 결과를 재사용합니다.
+# (클로저 변수인 commodity/날짜 등은 자동으로 바인드 파라미터가 됨)
+
+
+# ===========================
+# 조회 결과 캐시 (TTL)
+# ===========================
+# 대시보드가 반복 조회하는 단건 예측/설명을 짧게 캐싱하여 DB 왕복을 줄입니다.
+# 쓰기/삭제 시 무효화되며, 배치 서버가 DB에 직접 쓰는 경우에도 TTL 이후 반영됩니다.
+
+_CACHE_TTL_SECONDS = 60
+_cache_lock = threading.Lock()
+# 세션/스레드 간에 공유되므로 ORM 엔티티(세션 종료 후 detached) 대신 응답 스키마(DTO)로 변환해 저장합니다.
+_prediction_cache: TTLCache = TTLCache(maxsize=256, ttl=_CACHE_TTL_SECONDS)   # {(commodity, target_date): TftPredResponse}
+_explanation_cache: TTLCache = TTLCache(maxsize=256, ttl=_CACHE_TTL_SECONDS)  # {(commodity, target_date): ExpPredResponse}
+
+
+def _cache_get(cache: TTLCache, key: tuple):
+    with _cache_lock:
+        return cache.get(key)
+
+
+def _cache_set(cache: TTLCache, key: tuple, record) -> None:
+    """조회 결과 캐싱 (None은 캐싱하지 않음 → 더미 fallback 경로가 새 데이터를 바로 보도록)"""
+    if record is None:
+        return
+    with _cache_lock:
+        cache[key] = record
+
+
+def _to_prediction_dto(record: Optional[datatable.TftPred]) -> Optional[dataschemas.TftPredResponse]:
+    """TftPred 엔티티 → 캐시/응답용 스키마 (세션과 분리된 값 복사본)"""
+    return dataschemas.TftPredResponse.model_validate(record) if record is not None else None
+
+
+def _to_explanation_dto(record: Optional[datatable.ExpPred]) -> Optional[dataschemas.ExpPredResponse]:
+    """ExpPred 엔티티 → 캐시/응답용 스키마 (세션과 분리된 값 복사본)"""
+    return dataschemas.ExpPredResponse.model_validate(record) if record is not None else None
+
+
+def _invalidate_prediction_cache(commodity: Optional[str] = None, target_date: Optional[date] = None) -> None:
+    """예측/설명 캐시 무효화 (키를 모르면 전체 비움)"""
+    with _cache_lock:
+        if commodity is not None and target_date is not None:
+            key = (commodity.lower(), target_date)
+            _prediction_cache.pop(key, None)
+            _explanation_cache.pop(key, None)
+        else:
+            _prediction_cache.clear()
+            _explanation_cache.clear()
+    # API 응답 캐시(/api/predictions)도 함께 무효화
+    response_cache.invalidate_predictions(commodity)
+
+
+def _invalidate_explanation_cache() -> None:
+    """설명 캐시 전체 무효화 (설명은 pred_id만 알 수 있으므로)"""
+    with _cache_lock:
+        _explanation_cache.clear()
 
 
 # ===========================
@@ -30,19 +95,21 @@ def get_tft_predictions(
         TftPred 레코드 리스트 (최신순)
     """
     commodity = commodity.lower()  # 소문자로 변환
-    return db.query(datatable.TftPred)\
-        .filter(datatable.TftPred.commodity == commodity)\
-        .filter(datatable.TftPred.target_date >= start_date)\
-        .filter(datatable.TftPred.target_date <= end_date)\
-        .order_by(datatable.TftPred.target_date.desc())\
-        .all()
+    stmt = lambda_stmt(
+        lambda: select(datatable.TftPred)
+        .where(datatable.TftPred.commodity == commodity)
+        .where(datatable.TftPred.target_date >= start_date)
+        .where(datatable.TftPred.target_date <= end_date)
+        .order_by(datatable.TftPred.target_date.desc())
+    )
+    return db.execute(stmt).scalars().all()
 
 
 def get_prediction_by_date(
     db: Session, 
     commodity: str, 
     target_date: date
-) -> Optional[datatable.TftPred]:
+) -> Optional[dataschemas.TftPredResponse]:
     """
     특정 품목의 특정 날짜 예측값 조회
     
@@ -52,13 +119,23 @@ def get_prediction_by_date(
         target_date: 목표 날짜
     
     Returns:
-        TftPred 레코드 또는 None
+        TftPredResponse 또는 None (TTL 캐시 적용)
     """
     commodity = commodity.lower()  # 소문자로 변환
-    return db.query(datatable.TftPred)\
-        .filter(datatable.TftPred.commodity == commodity)\
-        .filter(datatable.TftPred.target_date == target_date)\
-        .first()
+    key = (commodity, target_date)
+    cached = _cache_get(_prediction_cache, key)
+    if cached is not None:
+        return cached
+
+    stmt = lambda_stmt(
+        lambda: select(datatable.TftPred)
+        .where(datatable.TftPred.commodity == commodity)
+        .where(datatable.TftPred.target_date == target_date)
+        .limit(1)
+    )
+    record = _to_prediction_dto(db.execute(stmt).scalars().first())
+    _cache_set(_prediction_cache, key, record)
+    return record
 
 
 def get_latest_predictions(
@@ -125,16 +202,19 @@ def get_explanation_by_pred_id(
     Returns:
         ExpPred 레코드 또는 None
     """
-    return db.query(datatable.ExpPred)\
-        .filter(datatable.ExpPred.pred_id == pred_id)\
-        .first()
+    stmt = lambda_stmt(
+        lambda: select(datatable.ExpPred)
+        .where(datatable.ExpPred.pred_id == pred_id)
+        .limit(1)
+    )
+    return db.execute(stmt).scalars().first()
 
 
 def get_explanation_by_date(
     db: Session, 
     commodity: str, 
     target_date: date
-) -> Optional[datatable.ExpPred]:
+) -> Optional[dataschemas.ExpPredResponse]:
     """
     특정 품목의 특정 날짜 예측 설명 조회
     
@@ -144,14 +224,25 @@ def get_explanation_by_date(
         target_date: 목표 날짜
     
     Returns:
-        ExpPred 레코드 또는 None
+        ExpPredResponse 또는 None (TTL 캐시 적용)
     """
     commodity = commodity.lower()  # 소문자로 변환
-    return db.query(datatable.ExpPred)\
-        .join(datatable.TftPred, datatable.ExpPred.pred_id == datatable.TftPred.id)\
-        .filter(datatable.TftPred.commodity == commodity)\
-        .filter(datatable.TftPred.target_date == target_date)\
-        .first()
+    key = (commodity, target_date)
+    cached = _cache_get(_explanation_cache, key)
+    if cached is not None:
+        return cached
+
+    # 같은 target_date에 여러 배치의 예측이 있을 수 있으므로 JOIN 유지
+    stmt = lambda_stmt(
+        lambda: select(datatable.ExpPred)
+        .join(datatable.TftPred, datatable.ExpPred.pred_id == datatable.TftPred.id)
+        .where(datatable.TftPred.commodity == commodity)
+        .where(datatable.TftPred.target_date == target_date)
+        .limit(1)
+    )
+    record = _to_explanation_dto(db.execute(stmt).scalars().first())
+    _cache_set(_explanation_cache, key, record)
+    return record
 
 
 # ===========================
@@ -202,10 +293,18 @@ def get_market_metrics(
         MarketMetrics 레코드 리스트
     """
     commodity = commodity.lower()  # 소문자로 변환
-    return db.query(datatable.MarketMetrics)\
-        .filter(datatable.MarketMetrics.commodity == commodity)\
-        .filter(datatable.MarketMetrics.date == target_date)\
-        .all()
+    stmt = lambda_stmt(
+        lambda: select(datatable.MarketMetrics)
+        .options(load_only(
+            # 응답에 필요한 컬럼만 조회 (+ PK id) - 커버링 인덱스의 INCLUDE 컬럼과 일치 → index-only scan
+            datatable.MarketMetrics.metric_id, datatable.MarketMetrics.label,
+            datatable.MarketMetrics.value, datatable.MarketMetrics.numeric_value,
+            datatable.MarketMetrics.trend, datatable.MarketMetrics.impact,
+        ))
+        .where(datatable.MarketMetrics.commodity == commodity)
+        .where(datatable.MarketMetrics.date == target_date)
+    )
+    return db.execute(stmt).scalars().all()
 
 
 def get_historical_features(
@@ -365,33 +464,190 @@ def get_historical_prices(
         HistoricalPrices 레코드 리스트 (날짜순)
     """
     commodity = commodity.lower()  # 소문자로 변환
-    return db.query(datatable.HistoricalPrices)\
-        .filter(datatable.HistoricalPrices.commodity == commodity)\
-        .filter(datatable.HistoricalPrices.date >= start_date)\
-        .filter(datatable.HistoricalPrices.date <= end_date)\
-        .order_by(datatable.HistoricalPrices.date.asc())\
-        .all()
+    stmt = lambda_stmt(
+        lambda: select(datatable.HistoricalPrices)
+        .where(datatable.HistoricalPrices.commodity == commodity)
+        .where(datatable.HistoricalPrices.date >= start_date)
+        .where(datatable.HistoricalPrices.date <= end_date)
+        .order_by(datatable.HistoricalPrices.date.asc())
+    )
+    return db.execute(stmt).scalars().all()
+
+
+# ===========================
+# 비동기 조회 (AsyncSession)
+# ===========================
+# async 라우트용 조회 함수. 쿼리/캐시 동작은 위의 동기 버전과 동일합니다.
+# 쓰기는 동기 함수를 `await db.run_sync(crud.create_..., ...)`로 재사용합니다.
+
+async def get_prediction_by_date_async(
+    db: AsyncSession,
+    commodity: str,
+    target_date: date
+) -> Optional[dataschemas.TftPredResponse]:
+    """특정 품목의 특정 날짜 예측값 조회 (비동기, TTL 캐시 공유)"""
+    commodity = commodity.lower()  # 소문자로 변환
+    key = (commodity, target_date)
+    cached = _cache_get(_prediction_cache, key)
+    if cached is not None:
+        return cached
+
+    stmt = lambda_stmt(
+        lambda: select(datatable.TftPred)
+        .where(datatable.TftPred.commodity == commodity)
+        .where(datatable.TftPred.target_date == target_date)
+        .limit(1)
+    )
+    record = _to_prediction_dto((await db.execute(stmt)).scalars().first())
+    _cache_set(_prediction_cache, key, record)
+    return record
+
+
+async def get_latest_predictions_async(
+    db: AsyncSession,
+    commodity: str
+) -> List[datatable.TftPred]:
+    """최신 예측값 조회 (비동기) - 범위/로직은 get_latest_predictions와 동일"""
+    commodity = commodity.lower()  # 소문자로 변환
+    today = datetime.now().date()
+    start_date = today - timedelta(days=30)
+    end_date = today + timedelta(days=60)
+
+    # 서브쿼리: 각 target_date별 최신 created_at
+    subquery = select(
+        datatable.TftPred.target_date,
+        func.max(datatable.TftPred.created_at).label('max_created_at')
+    ).where(
+        datatable.TftPred.commodity == commodity,
+        datatable.TftPred.target_date >= start_date,
+        datatable.TftPred.target_date <= end_date
+    ).group_by(datatable.TftPred.target_date).subquery()
+
+    # 메인 쿼리: 서브쿼리 결과와 조인
+    stmt = select(datatable.TftPred).join(
+        subquery,
+        (datatable.TftPred.target_date == subquery.c.target_date) &
+        (datatable.TftPred.created_at == subquery.c.max_created_at)
+    ).where(
+        datatable.TftPred.commodity == commodity
+    ).order_by(datatable.TftPred.target_date.asc())
+    return (await db.execute(stmt)).scalars().all()
+
+
+async def get_market_metrics_async(
+    db: AsyncSession,
+    commodity: str,
+    target_date: date
+) -> List[datatable.MarketMetrics]:
+    """특정 품목의 특정 날짜 시장 지표 조회 (비동기)"""
+    commodity = commodity.lower()  # 소문자로 변환
+    stmt = lambda_stmt(
+        lambda: select(datatable.MarketMetrics)
+        .options(load_only(
+            # 응답에 필요한 컬럼만 조회 (+ PK id) - 커버링 인덱스의 INCLUDE 컬럼과 일치 → index-only scan
+            datatable.MarketMetrics.metric_id, datatable.MarketMetrics.label,
+            datatable.MarketMetrics.value, datatable.MarketMetrics.numeric_value,
+            datatable.MarketMetrics.trend, datatable.MarketMetrics.impact,
+        ))
+        .where(datatable.MarketMetrics.commodity == commodity)
+        .where(datatable.MarketMetrics.date == target_date)
+    )
+    return (await db.execute(stmt)).scalars().all()
+
+
+async def get_historical_prices_async(
+    db: AsyncSession,
+    commodity: str,
+    start_date: date,
+    end_date: date
+) -> List[datatable.HistoricalPrices]:
+    """특정 품목의 기간별 실제 가격 조회 (비동기, 날짜순)"""
+    commodity = commodity.lower()  # 소문자로 변환
+    stmt = lambda_stmt(
+        lambda: select(datatable.HistoricalPrices)
+        .where(datatable.HistoricalPrices.commodity == commodity)
+        .where(datatable.HistoricalPrices.date >= start_date)
+        .where(datatable.HistoricalPrices.date <= end_date)
+        .order_by(datatable.HistoricalPrices.date.asc())
+    )
+    return (await db.execute(stmt)).scalars().all()
+
+
+async def get_historical_prices_projection_async(
+    db: AsyncSession,
+    commodity: str,
+    start_date: date,
+    end_date: date
+) -> List[Any]:
+    """
+    특정 품목의 기간별 (date, actual_price) 행만 조회 (비동기, 날짜순)
+
+    ORM 객체를 만들지 않고 두 컬럼만 가져옵니다 (가격은 DB에서 float8로 변환).
+    dict(rows)로 {date: price} 매핑을 바로 만들 수 있습니다.
+    """
+    commodity = commodity.lower()  # 소문자로 변환
+    stmt = lambda_stmt(
+        lambda: select(
+            datatable.HistoricalPrices.date,
+            datatable.HistoricalPrices.actual_price.cast(Float)
+        )
+        .where(datatable.HistoricalPrices.commodity == commodity)
+        .where(datatable.HistoricalPrices.date >= start_date)
+        .where(datatable.HistoricalPrices.date <= end_date)
+        .order_by(datatable.HistoricalPrices.date.asc())
+    )
+    return (await db.execute(stmt)).all()
 
 
 # ===========================
 # TFT 예측 - Create / Delete
 # ===========================
 
-def create_tft_prediction(db: Session, data: dataschemas.TftPredCreate) -> datatable.TftPred:
-    """TFT 예측 단건 저장"""
-    record = datatable.TftPred(**data.model_dump())
-    db.add(record)
+TftPredRow = Dict[str, Any]  # 이미 검증된 tft_pred 컬럼 dict (내부 호출용)
+
+
+def _tft_pred_row(item: Union[dataschemas.TftPredCreate, TftPredRow]) -> TftPredRow:
+    """
+    DB 경계에서의 변환: pydantic 모델은 model_dump 한 번, 검증된 dict는 그대로 사용
+    (API 진입점에서 이미 검증했으므로 재검증하지 않음)
+    """
+    return item if isinstance(item, dict) else item.model_dump()
+
+
+def create_tft_prediction(
+    db: Session, data: Union[dataschemas.TftPredCreate, TftPredRow]
+) -> Dict[str, Any]:
+    """
+    TFT 예측 단건 저장
+
+    INSERT ... RETURNING 으로 id/created_at까지 한 번에 받아오므로 refresh SELECT가 필요 없습니다.
+    """
+    stmt = insert(datatable.TftPred)\
+        .values(**_tft_pred_row(data))\
+        .returning(*datatable.TftPred.__table__.columns)
+    record = dict(db.execute(stmt).mappings().one())
     db.commit()
-    db.refresh(record)
+    _invalidate_prediction_cache(record['commodity'], record['target_date'])
     return record
 
 
-def create_tft_predictions_bulk(db: Session, items: List[dataschemas.TftPredCreate]) -> int:
-    """TFT 예측 벌크 저장 (7일치 등)"""
-    records = [datatable.TftPred(**item.model_dump()) for item in items]
-    db.add_all(records)
+def create_tft_predictions_bulk(
+    db: Session, items: List[Union[dataschemas.TftPredCreate, TftPredRow]]
+) -> int:
+    """
+    TFT 예측 벌크 저장 (7일치 등)
+
+    ORM 객체를 만들지 않고 Core INSERT ... VALUES (...), (...) RETURNING id 한 번으로 저장합니다.
+    """
+    if not items:
+        return 0
+    stmt = insert(datatable.TftPred)\
+        .values([_tft_pred_row(item) for item in items])\
+        .returning(datatable.TftPred.id)
+    inserted_ids = db.execute(stmt).scalars().all()
     db.commit()
-    return len(records)
+    _invalidate_prediction_cache()
+    return len(inserted_ids)
 
 
 def delete_tft_predictions(db: Session, commodity: str, start_date: date, end_date: date) -> int:
@@ -403,6 +659,7 @@ def delete_tft_predictions(db: Session, commodity: str, start_date: date, end_da
         datatable.TftPred.target_date <= end_date
     ).delete(synchronize_session=False)
     db.commit()
+    _invalidate_prediction_cache()
     return count
 
 
@@ -416,15 +673,27 @@ def create_explanation(db: Session, data: dataschemas.ExpPredCreate) -> datatabl
     db.add(record)
     db.commit()
     db.refresh(record)
+    _invalidate_explanation_cache()
     return record
 
 
+def create_explanations_bulk(db: Session, items: List[dataschemas.ExpPredCreate]) -> int:
+    """예측 설명 벌크 저장 (bulk_insert_mappings 사용)"""
+    if not items:
+        return 0
+    db.bulk_insert_mappings(datatable.ExpPred, [item.model_dump() for item in items])
+    db.commit()
+    _invalidate_explanation_cache()
+    return len(items)
+
+
 def delete_explanation_by_pred_id(db: Session, pred_id: int) -> int:
     """특정 예측의 설명 삭제"""
     count = db.query(datatable.ExpPred).filter(
         datatable.ExpPred.pred_id == pred_id
     ).delete(synchronize_session=False)
     db.commit()
+    _invalidate_explanation_cache()
     return count
 
 
@@ -448,20 +717,28 @@ def create_news(db: Session, data: dataschemas.NewsCreate) -> datatable.DocEmbed
 
 
 def create_news_bulk(db: Session, items: List[dataschemas.NewsCreate]) -> int:
-    """뉴스 벌크 저장"""
-    records = [
-        datatable.DocEmbeddings(
-            title=item.title,
-            content=item.content,
-            source_url=item.source_url,
-            created_at=item.created_at,
-            embedding=item.embedding
-        )
+    """
+    뉴스 벌크 저장
+
+    ORM 객체 대신 Core INSERT executemany로 저장합니다.
+    psycopg2 dialect의 insertmanyvalues가 여러 행을 multi-row VALUES 문으로 묶어
+    (execute_values와 동일한 방식) 1536차원 임베딩도 행 단위 INSERT 없이 저장됩니다.
+    """
+    if not items:
+        return 0
+    rows = [
+        {
+            'title': item.title,
+            'content': item.content,
+            'source_url': item.source_url,
+            'created_at': item.created_at,
+            'embedding': item.embedding
+        }
         for item in items
     ]
-    db.add_all(records)
+    db.execute(insert(datatable.DocEmbeddings), rows)
     db.commit()
-    return len(records)
+    return len(rows)
 
 
 def delete_news_by_date(db: Session, before_date: date) -> int:
@@ -508,30 +785,90 @@ def create_market_metric(db: Session, data: dataschemas.MarketMetricCreate) -> d
     db.add(record)
     db.commit()
     db.refresh(record)
+    response_cache.invalidate_market_metrics(record.commodity, record.date)
     return record
 
 
-def create_market_metrics_bulk(
-    db: Session, commodity: str, target_date: date, metrics: List[dataschemas.MarketMetricItem]
-) -> int:
-    """시장 지표 벌크 저장 (날짜당 46개 feature 등)"""
-    commodity = commodity.lower()  # 소문자로 변환
-    records = [
-        datatable.MarketMetrics(
-            commodity=commodity,
-            date=target_date,
-            metric_id=m.metric_id,
-            label=m.label,
-            value=m.value,
-            numeric_value=m.numeric_value,
-            trend=m.trend,
-            impact=m.impact
-        )
+# 한 번의 INSERT 문에 담는 최대 행 수
+_BULK_BATCH_SIZE = 10_000
+
+MarketMetricRow = Dict[str, Any]  # market_metrics 컬럼 dict (commodity, date, metric_id, label, ...)
+
+
+def _market_metric_rows(
+    commodity: str, target_date: date, metrics: List[dataschemas.MarketMetricItem]
+) -> List[MarketMetricRow]:
+    """MarketMetricItem 리스트 → market_metrics 행 dict 리스트"""
+    return [
+        {
+            'commodity': commodity,
+            'date': target_date,
+            'metric_id': m.metric_id,
+            'label': m.label,
+            'value': m.value,
+            'numeric_value': m.numeric_value,
+            'trend': m.trend,
+            'impact': m.impact
+        }
         for m in metrics
     ]
-    db.add_all(records)
+
+
+def upsert_market_metric_rows(db: Session, rows: List[MarketMetricRow], overwrite: bool = True) -> int:
+    """
+    시장 지표 행 벌크 Upsert (여러 날짜 가능)
+
+    INSERT ... VALUES (다중 행) ON CONFLICT (commodity, date, metric_id) DO UPDATE를
+    최대 _BULK_BATCH_SIZE 행 단위로 실행하고 한 번만 커밋합니다.
+    overwrite=False면 ON CONFLICT DO NOTHING으로 이미 있는 지표는 건드리지 않습니다 (백필용).
+    (uq_market_metrics_commodity_date_metric 유니크 인덱스 필요 - migrations/005)
+
+    Returns:
+        저장(또는 갱신)된 행 수
+    """
+    if not rows:
+        return 0
+
+    # 같은 키가 한 문장에 두 번 나오면 ON CONFLICT DO UPDATE가 실패하므로 마지막 값만 유지
+    deduped = {}
+    for row in rows:
+        row = {**row, 'commodity': row['commodity'].lower()}  # 소문자로 변환
+        deduped[(row['commodity'], row['date'], row['metric_id'])] = row
+    rows = list(deduped.values())
+
+    saved = 0
+    for start in range(0, len(rows), _BULK_BATCH_SIZE):
+        stmt = pg_insert(datatable.MarketMetrics).values(rows[start:start + _BULK_BATCH_SIZE])
+        if overwrite:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=['commodity', 'date', 'metric_id'],
+                set_={
+                    'label': stmt.excluded.label,
+                    'value': stmt.excluded.value,
+                    'numeric_value': stmt.excluded.numeric_value,
+                    'trend': stmt.excluded.trend,
+                    'impact': stmt.excluded.impact,
+                }
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=['commodity', 'date', 'metric_id'])
+        saved += db.execute(stmt).rowcount
     db.commit()
-    return len(records)
+
+    keys = {(row['commodity'], row['date']) for row in rows}
+    if len(keys) == 1:
+        response_cache.invalidate_market_metrics(*next(iter(keys)))
+    else:
+        for commodity in {commodity for commodity, _ in keys}:
+            response_cache.invalidate_market_metrics(commodity)
+    return saved
+
+
+def create_market_metrics_bulk(
+    db: Session, commodity: str, target_date: date, metrics: List[dataschemas.MarketMetricItem]
+) -> int:
+    """시장 지표 벌크 저장 (날짜당 46개 feature 등) - 같은 지표가 이미 있으면 갱신"""
+    return upsert_market_metric_rows(db, _market_metric_rows(commodity.lower(), target_date, metrics))
 
 
 def upsert_market_metrics(
@@ -539,38 +876,9 @@ def upsert_market_metrics(
 ) -> int:
     """
     시장 지표 Upsert (commodity + date + metric_id 기준)
-    - 기존 데이터 있으면 Update, 없으면 Insert
+    - 기존 데이터 있으면 Update, 없으면 Insert (단일 INSERT ... ON CONFLICT 문)
     """
-    commodity = commodity.lower()  # 소문자로 변환
-    count = 0
-    for m in metrics:
-        existing = db.query(datatable.MarketMetrics).filter(
-            datatable.MarketMetrics.commodity == commodity,
-            datatable.MarketMetrics.date == target_date,
-            datatable.MarketMetrics.metric_id == m.metric_id
-        ).first()
-
-        if existing:
-            existing.label = m.label
-            existing.value = m.value
-            existing.numeric_value = m.numeric_value
-            existing.trend = m.trend
-            existing.impact = m.impact
-        else:
-            db.add(datatable.MarketMetrics(
-                commodity=commodity,
-                date=target_date,
-                metric_id=m.metric_id,
-                label=m.label,
-                value=m.value,
-                numeric_value=m.numeric_value,
-                trend=m.trend,
-                impact=m.impact
-            ))
-        count += 1
-
-    db.commit()
-    return count
+    return upsert_market_metric_rows(db, _market_metric_rows(commodity.lower(), target_date, metrics))
 
 
 def delete_market_metrics(db: Session, commodity: str, start_date: date, end_date: date) -> int:
@@ -582,6 +890,7 @@ def delete_market_metrics(db: Session, commodity: str, start_date: date, end_dat
         datatable.MarketMetrics.date <= end_date
     ).delete(synchronize_session=False)
     db.commit()
+    response_cache.invalidate_market_metrics(commodity)
     return count
 
 
@@ -595,25 +904,73 @@ def create_historical_price(db: Session, data: dataschemas.HistoricalPriceCreate
     db.add(record)
     db.commit()
     db.refresh(record)
+    response_cache.invalidate_predictions(record.commodity)
     return record
 
 
+def _as_date(value: Union[str, date]) -> date:
+    """HistoricalPriceItem.date ('YYYY-MM-DD' 문자열) → date (asyncpg는 문자열 날짜를 받지 않음)"""
+    return date.fromisoformat(value) if isinstance(value, str) else value
+
+
 def create_historical_prices_bulk(
     db: Session, commodity: str, prices: List[dataschemas.HistoricalPriceItem]
 ) -> int:
-    """실제 가격 벌크 저장"""
+    """
+    실제 가격 벌크 저장
+
+    ORM 객체 대신 Core INSERT executemany (multi-row VALUES)로 _BULK_BATCH_SIZE 행 단위 저장
+    """
+    if not prices:
+        return 0
     commodity = commodity.lower()  # 소문자로 변환
-    records = [
-        datatable.HistoricalPrices(
-            commodity=commodity,
-            date=p.date,
-            actual_price=p.actual_price
-        )
+    rows = [
+        {'commodity': commodity, 'date': _as_date(p.date), 'actual_price': p.actual_price}
         for p in prices
     ]
-    db.add_all(records)
+    for start in range(0, len(rows), _BULK_BATCH_SIZE):
+        db.execute(insert(datatable.HistoricalPrices), rows[start:start + _BULK_BATCH_SIZE])
     db.commit()
-    return len(records)
+    response_cache.invalidate_predictions(commodity)
+    return len(rows)
+
+
+def insert_missing_historical_prices(
+    db: Session, commodity: str, prices: List[dataschemas.HistoricalPriceItem]
+) -> int:
+    """
+    아직 없는 날짜의 실제 가격만 저장 (이미 있는 날짜는 건너뜀)
+
+    날짜별 존재 여부를 조회하지 않고 한 문장으로 처리합니다:
+    INSERT INTO historical_prices (...) SELECT ... FROM (VALUES ...) WHERE NOT EXISTS (...)
+    (historical_prices에는 유니크 제약이 없어 ON CONFLICT 대신 NOT EXISTS 사용)
+
+    Returns:
+        새로 저장된 행 수
+    """
+    commodity = commodity.lower()  # 소문자로 변환
+    # 같은 날짜가 여러 번 들어오면 마지막 값만 유지
+    deduped = {_as_date(p.date): p.actual_price for p in prices}
+    if not deduped:
+        return 0
+
+    hp = datatable.HistoricalPrices
+    saved = 0
+    items = list(deduped.items())
+    for start in range(0, len(items), _BULK_BATCH_SIZE):
+        src = values(
+            column('date', Date), column('actual_price', Numeric(10, 2)), name='src'
+        ).data(items[start:start + _BULK_BATCH_SIZE])
+        missing = select(literal(commodity), src.c.date, src.c.actual_price).where(
+            ~exists().where(hp.commodity == commodity, hp.date == src.c.date)
+        )
+        stmt = insert(hp).from_select(['commodity', 'date', 'actual_price'], missing)
+        saved += db.execute(stmt).rowcount
+    db.commit()
+
+    if saved:
+        response_cache.invalidate_predictions(commodity)
+    return saved
 
 
 def upsert_historical_prices(
@@ -624,24 +981,34 @@ def upsert_historical_prices(
     - 기존 데이터 있으면 Update, 없으면 Insert
     """
     commodity = commodity.lower()  # 소문자로 변환
-    count = 0
-    for p in prices:
-        existing = db.query(datatable.HistoricalPrices).filter(
+    dates = [_as_date(p.date) for p in prices]
+
+    # 기존 행을 (commodity, date) 인덱스로 한 번에 조회 (행마다 조회하지 않음)
+    existing = {
+        record.date: record
+        for record in db.query(datatable.HistoricalPrices).filter(
             datatable.HistoricalPrices.commodity == commodity,
-            datatable.HistoricalPrices.date == p.date
-        ).first()
+            datatable.HistoricalPrices.date.in_(set(dates))
+        )
+    }
 
-        if existing:
-            existing.actual_price = p.actual_price
+    count = 0
+    for p, price_date in zip(prices, dates):
+        record = existing.get(price_date)
+        if record is not None:
+            record.actual_price = p.actual_price
         else:
-            db.add(datatable.HistoricalPrices(
+            # 같은 요청 안의 중복 날짜는 방금 추가한 행을 갱신
+            existing[price_date] = datatable.HistoricalPrices(
                 commodity=commodity,
-                date=p.date,
+                date=price_date,
                 actual_price=p.actual_price
-            ))
+            )
+            db.add(existing[price_date])
         count += 1
 
     db.commit()
+    response_cache.invalidate_predictions(commodity)
     return count
 
 
@@ -654,4 +1021,122 @@ def delete_historical_prices(db: Session, commodity: str, start_date: date, end_
         datatable.HistoricalPrices.date <= end_date
     ).delete(synchronize_session=False)
     db.commit()
+    response_cache.invalidate_predictions(commodity)
     return count
+
+
+# ===========================
+# COPY 기반 백필 (PostgreSQL)
+# ===========================
+# 수백~수천 행 백필은 COPY FROM STDIN으로 임시 테이블에 한 번에 적재한 뒤
+# INSERT ... SELECT 한 문장으로 본 테이블에 반영합니다 (이미 있는 행은 건너뜀).
+# COPY는 psycopg2 커서(copy_expert)가 필요하므로, 다른 드라이버에서는 INSERT 경로로 대체합니다.
+
+_MARKET_METRIC_COPY_COLUMNS = (
+    'commodity', 'date', 'metric_id', 'label', 'value', 'numeric_value', 'trend', 'impact'
+)
+_HISTORICAL_PRICE_COPY_COLUMNS = ('commodity', 'date', 'actual_price')
+
+
+def _copy_to_temp_table(cursor, table: str, ddl: str, columns: tuple, records: List[tuple]) -> None:
+    """임시 테이블 생성 (커밋 시 삭제) 후 records를 CSV COPY로 적재"""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(records)  # None → 빈 값 (CSV에서 NULL)
+    buffer.seek(0)
+    cursor.execute(f"CREATE TEMP TABLE {table} ({ddl}) ON COMMIT DROP")
+    cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buffer)
+
+
+def copy_market_metric_rows(db: Session, rows: List[MarketMetricRow]) -> int:
+    """
+    시장 지표 행 백필 (COPY → INSERT ... SELECT ... ON CONFLICT DO NOTHING)
+
+    이미 있는 (commodity, date, metric_id)는 건드리지 않습니다.
+
+    Returns:
+        새로 저장된 행 수
+    """
+    if not rows:
+        return 0
+
+    cursor = db.connection().connection.cursor()
+    if not hasattr(cursor, 'copy_expert'):
+        cursor.close()
+        return upsert_market_metric_rows(db, rows, overwrite=False)
+
+    columns = ', '.join(_MARKET_METRIC_COPY_COLUMNS)
+    records = [
+        (row['commodity'].lower(), *(row[col] for col in _MARKET_METRIC_COPY_COLUMNS[1:]))
+        for row in rows
+    ]
+    try:
+        _copy_to_temp_table(
+            cursor, 'tmp_market_metrics',
+            "commodity varchar(50), date date, metric_id varchar(50), label varchar(255), "
+            "value varchar(50), numeric_value double precision, trend double precision, impact varchar(20)",
+            _MARKET_METRIC_COPY_COLUMNS, records
+        )
+        # 같은 키가 여러 번 들어와도 한 행만 반영
+        cursor.execute(
+            f"INSERT INTO market_metrics ({columns}) "
+            f"SELECT DISTINCT ON (commodity, date, metric_id) {columns} FROM tmp_market_metrics "
+            "ON CONFLICT (commodity, date, metric_id) DO NOTHING"
+        )
+        saved = cursor.rowcount
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        cursor.close()
+
+    for commodity in {commodity for commodity, *_ in records}:
+        response_cache.invalidate_market_metrics(commodity)
+    return saved
+
+
+def copy_missing_historical_prices(
+    db: Session, commodity: str, prices: List[dataschemas.HistoricalPriceItem]
+) -> int:
+    """
+    실제 가격 백필 (COPY → INSERT ... SELECT ... WHERE NOT EXISTS)
+
+    이미 있는 날짜는 건너뜁니다 (insert_missing_historical_prices와 동일한 동작).
+
+    Returns:
+        새로 저장된 행 수
+    """
+    if not prices:
+        return 0
+
+    cursor = db.connection().connection.cursor()
+    if not hasattr(cursor, 'copy_expert'):
+        cursor.close()
+        return insert_missing_historical_prices(db, commodity, prices)
+
+    commodity = commodity.lower()  # 소문자로 변환
+    records = [(commodity, _as_date(p.date), p.actual_price) for p in prices]
+    try:
+        _copy_to_temp_table(
+            cursor, 'tmp_historical_prices',
+            "commodity varchar(50), date date, actual_price numeric(10, 2)",
+            _HISTORICAL_PRICE_COPY_COLUMNS, records
+        )
+        cursor.execute(
+            "INSERT INTO historical_prices (commodity, date, actual_price) "
+            "SELECT DISTINCT ON (t.date) t.commodity, t.date, t.actual_price FROM tmp_historical_prices t "
+            "WHERE NOT EXISTS ("
+            "SELECT 1 FROM historical_prices h WHERE h.commodity = t.commodity AND h.date = t.date"
+            ")"
+        )
+        saved = cursor.rowcount
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        cursor.close()
+
+    if saved:
+        response_cache.invalidate_predictions(commodity)
+    return saved
@@ -4,16 +4,61 @@
 외부 API를 통해 market_metrics에 필요한 데이터를 실시간으로 가져옵니다.
 """
 
+import asyncio
 import logging
 import numpy as np
 import pandas as pd
 from datetime import date, datetime, timedelta
 from typing import Dict, List, Optional
-from functools import lru_cache
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from cachetools import TTLCache
+from cachetools.keys import hashkey
 
 logger = logging.getLogger(__name__)
 
 
+# EMA(span=20) 평활 계수 - 모듈 로드 시 한 번만 계산
+_EMA20_ALPHA = 2.0 / (20 + 1)
+# EMA 닫힌 형태 계산의 블록 길이 (beta^-64 ≈ 600 수준으로 유지하여 정밀도 보존)
+_EMA_BLOCK = 64
+
+# 외부 API(yfinance/FRED) 호출 전용 공유 스레드 풀
+# - 동시 외부 요청 수를 8개로 제한 (요청마다 풀을 새로 만들지 않음)
+# - 데드락 방지를 위해 풀 안에서는 다른 작업을 기다리지 않는 단일 HTTP 호출만 실행
+_UPSTREAM_MAX_WORKERS = 8
+_upstream_executor = ThreadPoolExecutor(max_workers=_UPSTREAM_MAX_WORKERS, thread_name_prefix="upstream")
+
+
+def ema20(x: np.ndarray, alpha: float = _EMA20_ALPHA) -> np.ndarray:
+    """
+    pandas ``ewm(span=20, adjust=False).mean()``과 동일한 EMA 계산
+    
+    재귀식 y[t] = alpha * x[t] + (1 - alpha) * y[t-1] (y[0] = x[0])을 닫힌 형태로 풀어
+    블록 단위 cumsum으로 계산합니다 (원소별 Python 루프 없음).
+    블록 j번째 값: y = beta^(j+1) * y_prev + alpha * beta^(j+1) * cumsum(x / beta^(k+1))
+    beta^-k가 커지지 않도록 _EMA_BLOCK 길이마다 직전 값(y_prev)에서 다시 시작합니다.
+    """
+    values = np.asarray(x, dtype=np.float64)
+    out = np.empty(len(values), dtype=np.float64)
+    if len(values) == 0:
+        return out
+    
+    powers = (1.0 - alpha) ** np.arange(1, _EMA_BLOCK + 1, dtype=np.float64)  # beta^1 .. beta^B
+    prev = out[0] = values[0]
+    for start in range(1, len(values), _EMA_BLOCK):
+        block = values[start:start + _EMA_BLOCK]
+        p = powers[:len(block)]
+        segment = out[start:start + len(block)]
+        np.cumsum(block / p, out=segment)
+        segment *= alpha
+        segment += prev
+        segment *= p
+        prev = segment[-1]
+    return out
+
+
 class DataFetcher:
     """실시간 데이터 수집 클래스"""
     
@@ -26,20 +71,36 @@ class DataFetcher:
         """
         self.fred_api_key = fred_api_key
         self._fred_client = None
+        # yfinance Ticker 캐시 {symbol: Ticker} 및 가격 데이터 캐시 {(symbol, end_date, days): DataFrame}
+        self._tickers: Dict[str, object] = {}
+        self._price_cache: TTLCache = TTLCache(maxsize=64, ttl=300)
+        self._lock = threading.Lock()
+        self._fred_lock = threading.Lock()
         
     def _get_fred_client(self):
-        """FRED API 클라이언트 지연 로딩"""
+        """FRED API 클라이언트 지연 로딩 (double-checked lock으로 1회만 생성)"""
         if self._fred_client is None and self.fred_api_key:
-            try:
-                from fredapi import Fred
-                self._fred_client = Fred(api_key=self.fred_api_key)
-                logger.info("FRED API 클라이언트 초기화 완료")
-            except ImportError:
-                logger.warning("fredapi 패키지가 설치되지 않았습니다. 경제 지표는 더미 데이터로 대체됩니다.")
-            except Exception as e:
-                logger.warning(f"FRED API 클라이언트 초기화 실패: {e}. 더미 데이터로 대체됩니다.")
+            with self._fred_lock:
+                if self._fred_client is None:
+                    try:
+                        from fredapi import Fred
+                        self._fred_client = Fred(api_key=self.fred_api_key)
+                        logger.info("FRED API 클라이언트 초기화 완료")
+                    except ImportError:
+                        logger.warning("fredapi 패키지가 설치되지 않았습니다. 경제 지표는 더미 데이터로 대체됩니다.")
+                    except Exception as e:
+                        logger.warning(f"FRED API 클라이언트 초기화 실패: {e}. 더미 데이터로 대체됩니다.")
         return self._fred_client
     
+    def _get_ticker(self, yf, symbol: str):
+        """yfinance Ticker 재사용 (심볼별 1개)"""
+        with self._lock:
+            ticker = self._tickers.get(symbol)
+            if ticker is None:
+                ticker = yf.Ticker(symbol)
+                self._tickers[symbol] = ticker
+        return ticker
+    
     def fetch_price_data(self, commodity: str, end_date: date, days: int) -> tuple[pd.DataFrame, bool]:
         """
         yfinance로 가격 데이터 수집
@@ -67,13 +128,21 @@ class DataFetcher:
             
             symbol = symbol_map.get(commodity.lower(), 'ZC=F')
             
+            # 같은 (심볼, 날짜, 일수) 요청은 TTL 동안 네트워크 호출 생략
+            cache_key = (symbol, end_date, days)
+            with self._lock:
+                cached_df = self._price_cache.get(cache_key)
+            if cached_df is not None:
+                logger.info(f"가격 데이터 캐시 사용: {symbol} ({len(cached_df)}일)")
+                return cached_df.copy(), True
+            
             # 넉넉하게 추가 일수를 더해서 다운로드 (휴장일 고려)
             start_date = end_date - timedelta(days=days + 30)
             
             logger.info(f"yfinance로 {symbol} 데이터 다운로드: {start_date} ~ {end_date}")
             
-            # 데이터 다운로드
-            ticker = yf.Ticker(symbol)
+            # 데이터 다운로드 (Ticker 재사용 → yfinance 내부 세션/쿠키 재사용)
+            ticker = self._get_ticker(yf, symbol)
             df = ticker.history(start=start_date, end=end_date + timedelta(days=1))
             
             if df.empty:
@@ -100,7 +169,10 @@ class DataFetcher:
             
             logger.info(f"가격 데이터 수집 완료: {len(df)}일 (실제 데이터)")
             
-            return df, True  # 실제 yfinance 데이터
+            with self._lock:
+                self._price_cache[cache_key] = df
+            
+            return df.copy(), True  # 실제 yfinance 데이터
             
         except ImportError:
             logger.error("yfinance 패키지가 설치되지 않았습니다.")
@@ -133,12 +205,14 @@ class DataFetcher:
             
             logger.info(f"FRED API로 경제 지표 다운로드: {start_date} ~ {end_date}")
             
-            # 10년물 국채 금리
-            treasury_10y = fred.get_series('DGS10', start_date, end_date)
-            
+            # 10년물 국채 금리 + 달러 인덱스 - 서로 독립적인 시리즈이므로 동시 요청
+            treasury_future = _upstream_executor.submit(fred.get_series, 'DGS10', start_date, end_date)
             # 달러 인덱스 (구 심볼이 deprecated되어 새로운 심볼 사용)
+            usd_future = _upstream_executor.submit(fred.get_series, 'DTWEXBGS', start_date, end_date)
+            
+            treasury_10y = treasury_future.result()
             try:
-                usd_index = fred.get_series('DTWEXBGS', start_date, end_date)
+                usd_index = usd_future.result()
             except:
                 # 새로운 심볼로 시도
                 usd_index = fred.get_series('DTWEXEMEGS', start_date, end_date)
@@ -154,7 +228,7 @@ class DataFetcher:
             df['date'] = pd.to_datetime(df['date']).dt.date
             
             # 결측치 처리 (forward fill)
-            df = df.fillna(method='ffill').fillna(method='bfill')
+            df = df.ffill().bfill()
             
             # 최근 N일만 선택
             df = df.tail(days)
@@ -171,26 +245,23 @@ class DataFetcher:
         """더미 가격 데이터 생성"""
         logger.warning(f"더미 가격 데이터 생성 ({days}일)")
         
-        dates = [end_date - timedelta(days=days-1-i) for i in range(days)]
+        dates = pd.date_range(end=end_date, periods=days, freq='D').date
+        rng = np.random.default_rng()
         
         # 현실적인 옥수수 가격 범위 (센트/부셸)
         base_price = 450.0
-        prices = []
-        current_price = base_price
         
-        for _ in range(days):
-            # 작은 랜덤 변화
-            change = np.random.normal(0, 5)
-            current_price = max(400, min(500, current_price + change))
-            prices.append(current_price)
+        # 작은 랜덤 변화의 누적합 (랜덤워크) → 400~500 범위로 제한
+        changes = rng.normal(0, 5, size=days)
+        prices = np.clip(base_price + np.cumsum(changes), 400, 500)
         
         df = pd.DataFrame({
             'date': dates,
             'close': prices,
-            'open': [p + np.random.uniform(-2, 2) for p in prices],
-            'high': [p + np.random.uniform(2, 5) for p in prices],
-            'low': [p - np.random.uniform(2, 5) for p in prices],
-            'volume': [np.random.randint(50000, 150000) for _ in range(days)]
+            'open': prices + rng.uniform(-2, 2, size=days),
+            'high': prices + rng.uniform(2, 5, size=days),
+            'low': prices - rng.uniform(2, 5, size=days),
+            'volume': rng.integers(50000, 150000, size=days)
         })
         
         return df
@@ -199,7 +270,7 @@ class DataFetcher:
         """더미 경제 지표 데이터 생성"""
         logger.warning(f"더미 경제 지표 데이터 생성 ({days}일)")
         
-        dates = [end_date - timedelta(days=days-1-i) for i in range(days)]
+        dates = pd.date_range(end=end_date, periods=days, freq='D').date
         
         df = pd.DataFrame({
             'date': dates,
@@ -209,7 +280,7 @@ class DataFetcher:
         
         return df
     
-    def generate_dummy_features(self, days: int) -> Dict[str, List[float]]:
+    def generate_dummy_features(self, days: int) -> Dict[str, np.ndarray]:
         """
         더미 feature 데이터 생성
         
@@ -219,31 +290,29 @@ class DataFetcher:
             days: 조회할 일수
             
         Returns:
-            feature별 시계열 데이터
+            feature별 시계열 데이터 (numpy 배열)
         """
-        features = {}
+        rng = np.random.default_rng()
         
         # 뉴스 PCA (32개) - 정규분포
-        for i in range(32):
-            # 시계열 연속성을 위해 랜덤워크 방식
-            values = []
-            current = np.random.normal(0, 1)
-            for _ in range(days):
-                current += np.random.normal(0, 0.1)  # 작은 변화
-                values.append(current)
-            features[f'news_pca_{i}'] = values
+        # 시계열 연속성을 위해 랜덤워크 방식: 시작값 + 작은 변화의 누적합 (32개 한 번에 생성)
+        starts = rng.normal(0, 1, size=(32, 1))
+        steps = rng.normal(0, 0.1, size=(32, days))
+        walks = starts + np.cumsum(steps, axis=1)
+        
+        features = {f'news_pca_{i}': walks[i] for i in range(32)}
         
         # 기후 지수
-        features['pdsi'] = list(np.random.uniform(-3, 3, days))  # -6~6 범위, 중간값 사용
-        features['spi30d'] = list(np.random.uniform(-1, 1, days))  # -3~3 범위, 중간값 사용
-        features['spi90d'] = list(np.random.uniform(-1, 1, days))
+        features['pdsi'] = rng.uniform(-3, 3, days)  # -6~6 범위, 중간값 사용
+        features['spi30d'] = rng.uniform(-1, 1, days)  # -3~3 범위, 중간값 사용
+        features['spi90d'] = rng.uniform(-1, 1, days)
         
         # Hawkes Intensity
-        features['lambda_price'] = list(np.random.uniform(0.1, 0.5, days))
-        features['lambda_news'] = list(np.random.uniform(0.1, 0.5, days))
+        features['lambda_price'] = rng.uniform(0.1, 0.5, days)
+        features['lambda_news'] = rng.uniform(0.1, 0.5, days)
         
         # 뉴스 카운트
-        features['news_count'] = list(np.random.randint(5, 15, days).astype(float))
+        features['news_count'] = rng.integers(5, 15, days).astype(float)
         
         return features
     
@@ -264,9 +333,9 @@ class DataFetcher:
         Returns:
             {
                 'dates': [date1, date2, ...],
-                'features': {
-                    'close': [v1, v2, ...],
-                    'open': [v1, v2, ...],
+                'features': {                # feature별 numpy 배열
+                    'close': array([v1, v2, ...]),
+                    'open': array([v1, v2, ...]),
                     ...
                 },
                 'is_real_data': bool  # 실제 API 데이터 여부
@@ -274,47 +343,44 @@ class DataFetcher:
         """
         logger.info(f"실시간 데이터 수집 시작: {commodity}, {end_date}, {days}일")
         
-        # 1. 가격 데이터
-        price_df, is_real_price_data = self.fetch_price_data(commodity, end_date, days)
-        
-        # 2. 경제 지표
+        # 1~2. 가격 데이터(yfinance) + 경제 지표(FRED) - 서로 독립적인 외부 호출이므로 동시 실행
+        # (가격은 공유 풀에서, 경제 지표는 현재 스레드에서 FRED 시리즈들을 풀에 제출하고 대기)
+        # → 전체 대기 시간은 외부 호출 지연의 합이 아닌 최댓값
+        price_future = _upstream_executor.submit(self.fetch_price_data, commodity, end_date, days)
         econ_df, is_real_econ_data = self.fetch_economic_data(end_date, days)
+        price_df, is_real_price_data = price_future.result()
         
         # 3. 날짜 정렬 및 병합
         # 가격 데이터의 날짜를 기준으로 사용
         dates = price_df['date'].tolist()
         
-        # 경제 지표를 가격 날짜에 맞춰 매핑 (forward fill)
-        econ_dict = econ_df.set_index('date').to_dict('index')
+        # 경제 지표를 가격 날짜에 맞춰 매핑 (가격 날짜 이전의 가장 최근 값 → forward fill)
+        econ = econ_df.set_index('date')[['10Y_Yield', 'USD_Index']]
+        econ.index = pd.to_datetime(econ.index)
+        econ = econ[~econ.index.duplicated(keep='last')].sort_index()
+        aligned_econ = econ.reindex(pd.to_datetime(dates), method='ffill')\
+            .bfill()\
+            .fillna({'10Y_Yield': 4.0, 'USD_Index': 105.0})  # 데이터가 전혀 없을 때 기본값
         
         features = {}
         
         # 🔥 수정: 로그 변환은 prediction_service에서 수행하도록 변경
         # 여기서는 원본 값(Raw Value)을 반환해야 market_metrics API에서 정상적으로 사용 가능
+        # 캐시에는 numpy 배열로 보관하고, 리스트 변환은 fetch_realtime_features에서 한 번만 수행
         
         # 가격/거래량 feature (6개) - 원본 값 사용
-        features['close'] = price_df['close'].tolist()
-        features['open'] = price_df['open'].tolist()
-        features['high'] = price_df['high'].tolist()
-        features['low'] = price_df['low'].tolist()
-        features['volume'] = price_df['volume'].tolist()
+        features['close'] = price_df['close'].to_numpy()
+        features['open'] = price_df['open'].to_numpy()
+        features['high'] = price_df['high'].to_numpy()
+        features['low'] = price_df['low'].to_numpy()
+        features['volume'] = price_df['volume'].to_numpy()
         
         # EMA 계산 - 원본 값으로 계산 (필요시 prediction_service에서 다시 계산)
-        features['EMA'] = price_df['close'].ewm(span=20, adjust=False).mean().tolist()
+        features['EMA'] = ema20(features['close'])
         
         # 경제 지표 (2개) - 날짜 매칭
-        features['10Y_Yield'] = []
-        features['USD_Index'] = []
-        
-        last_10y = 4.0  # 기본값
-        last_usd = 105.0  # 기본값
-        
-        for d in dates:
-            if d in econ_dict:
-                last_10y = econ_dict[d].get('10Y_Yield', last_10y)
-                last_usd = econ_dict[d].get('USD_Index', last_usd)
-            features['10Y_Yield'].append(last_10y)
-            features['USD_Index'].append(last_usd)
+        features['10Y_Yield'] = aligned_econ['10Y_Yield'].to_numpy()
+        features['USD_Index'] = aligned_econ['USD_Index'].to_numpy()
         
         # 더미 feature (39개)
         dummy_features = self.generate_dummy_features(len(dates))
@@ -343,36 +409,49 @@ class DataFetcher:
 
 # 전역 인스턴스 (캐싱용)
 _fetcher_instance: Optional[DataFetcher] = None
+_fetcher_lock = threading.Lock()
 
 
 def get_data_fetcher(fred_api_key: Optional[str] = None) -> DataFetcher:
-    """DataFetcher 싱글톤 인스턴스 반환"""
+    """DataFetcher 싱글톤 인스턴스 반환 (동시 요청에서도 1개만 생성)"""
     global _fetcher_instance
     if _fetcher_instance is None:
-        _fetcher_instance = DataFetcher(fred_api_key=fred_api_key)
+        with _fetcher_lock:
+            if _fetcher_instance is None:
+                _fetcher_instance = DataFetcher(fred_api_key=fred_api_key)
     return _fetcher_instance
 
 
-@lru_cache(maxsize=128)
+# 실시간 feature 캐시: (commodity, end_date_str, days, fred_api_key) → 결과 dict
+# 시장 데이터가 계속 바뀌므로 5분 후 만료, 품목/날짜가 늘어나도 메모리는 maxsize로 제한
+_realtime_cache: TTLCache = TTLCache(maxsize=128, ttl=300)
+_realtime_cache_lock = threading.Lock()
+
+
 def fetch_realtime_features_cached(
     commodity: str, 
     end_date_str: str, 
     days: int,
     fred_api_key: Optional[str] = None
-) -> str:
+) -> Dict[str, any]:
     """
     캐싱된 실시간 feature 조회
     
-    Note: lru_cache는 hashable 인자만 받으므로 date를 str로 변환
-    반환값도 JSON 문자열로 변환하여 캐싱
+    Note: 결과 dict를 그대로 캐싱합니다 (호출자는 fetch_realtime_features의 복사본을 사용)
     """
-    import json
+    key = hashkey(commodity, end_date_str, days, fred_api_key)
+    with _realtime_cache_lock:
+        cached = _realtime_cache.get(key)
+    if cached is not None:
+        return cached
     
     end_date = datetime.strptime(end_date_str, '%Y-%m-%d').date()
     fetcher = get_data_fetcher(fred_api_key)
     result = fetcher.build_features_dict(commodity, end_date, days)
     
-    return json.dumps(result)
+    with _realtime_cache_lock:
+        _realtime_cache[key] = result
+    return result
 
 
 def fetch_realtime_features(
@@ -396,14 +475,58 @@ def fetch_realtime_features(
             'features': {...}
         }
     """
-    import json
-    
     # 캐싱된 함수 호출
-    result_str = fetch_realtime_features_cached(
+    result = fetch_realtime_features_cached(
         commodity, 
         end_date.strftime('%Y-%m-%d'), 
         days,
         fred_api_key
     )
     
-    return json.loads(result_str)
+    # 캐시의 numpy 배열을 새 리스트로 변환하여 반환 (호출자가 수정해도 캐시가 오염되지 않음)
+    return {
+        **result,
+        'dates': list(result['dates']),
+        'features': {name: np.asarray(values).tolist() for name, values in result['features'].items()}
+    }
+
+
+# 진행 중인 비동기 수집 {(commodity, end_date, days, fred_api_key): Task}
+# 캐시가 비어 있을 때 같은 키로 동시에 들어온 요청은 외부 API를 한 번만 호출합니다.
+_inflight_fetches: Dict[tuple, asyncio.Task] = {}
+
+
+async def fetch_realtime_features_async(
+    commodity: str,
+    end_date: date,
+    days: int,
+    fred_api_key: Optional[str] = None
+) -> Dict[str, any]:
+    """
+    fetch_realtime_features의 async 버전 (async 라우트용)
+    
+    블로킹 수집은 워커 스레드에서 실행하여 이벤트 루프를 막지 않으며,
+    동일 키의 동시 요청은 하나의 수집 작업을 공유합니다.
+    """
+    key = (commodity, end_date, days, fred_api_key)
+    task = _inflight_fetches.get(key)
+    if task is None:
+        task = asyncio.ensure_future(asyncio.to_thread(
+            fetch_realtime_features_cached,
+            commodity,
+            end_date.strftime('%Y-%m-%d'),
+            days,
+            fred_api_key
+        ))
+        _inflight_fetches[key] = task
+        task.add_done_callback(lambda _: _inflight_fetches.pop(key, None))
+    
+    # 취소되어도 공유 작업은 계속 진행되도록 shield
+    result = await asyncio.shield(task)
+    
+    # 호출자별 복사본 반환 (fetch_realtime_features와 동일)
+    return {
+        **result,
+        'dates': list(result['dates']),
+        'features': {name: np.asarray(values).tolist() for name, values in result['features'].items()}
+    }
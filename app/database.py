@@ -1,19 +1,97 @@
 import os
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import sessionmaker, declarative_base
 from dotenv import load_dotenv
 
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
+# 읽기 전용 복제본 (선택) - 없으면 주 DB 커넥션 풀을 공유
+DATABASE_READ_URL = os.getenv("DATABASE_READ_URL")
 
-engine = create_engine(DATABASE_URL)
+
+def _to_async_url(url: str) -> str:
+    """동기(psycopg2) DATABASE_URL을 asyncpg 드라이버 URL로 변환"""
+    for prefix in ("postgresql+psycopg2://", "postgresql://", "postgres://"):
+        if url.startswith(prefix):
+            url = "postgresql+asyncpg://" + url[len(prefix):]
+            break
+    # asyncpg는 sslmode 대신 ssl 파라미터를 사용
+    return url.replace("sslmode=", "ssl=")
+
+
+# 커넥션 풀 설정 (환경 변수로 조정 가능)
+# 동시 요청이 풀 크기를 넘으면 커넥션 대기로 직렬화되므로 기본값보다 크게 잡습니다.
+# 두 엔진의 최대 커넥션 합(pool_size + max_overflow)이 Postgres max_connections(기본 100)를 넘지 않도록 유지
+# - async 엔진: 대시보드 조회 등 대부분의 요청 (20 + 40)
+# - sync 엔진: 배치 저장/동기 라우트/스케줄러 (10 + 20)
+_POOL_PRE_PING = True        # 끊어진 커넥션 사용 방지 (체크아웃 시 확인)
+_POOL_RECYCLE_SECONDS = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # 서버/프록시 idle timeout 이전에 재연결
+
+
+def _pool_options(size_env: str, default_size: int, overflow_env: str, default_overflow: int) -> dict:
+    return {
+        "pool_size": int(os.getenv(size_env, str(default_size))),
+        "max_overflow": int(os.getenv(overflow_env, str(default_overflow))),
+        "pool_pre_ping": _POOL_PRE_PING,
+        "pool_recycle": _POOL_RECYCLE_SECONDS,
+    }
+
+
+engine = create_engine(DATABASE_URL, **_pool_options("DB_POOL_SIZE", 10, "DB_MAX_OVERFLOW", 20))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+# 비동기 엔진 (asyncpg) - I/O 대기 중 이벤트 루프를 막지 않는 async 라우트용
+# expire_on_commit=False: 커밋 후에도 조회한 객체를 응답 직렬화에 그대로 사용 (lazy load 방지)
+async_engine = create_async_engine(
+    _to_async_url(DATABASE_URL),
+    **_pool_options("DB_ASYNC_POOL_SIZE", 20, "DB_ASYNC_MAX_OVERFLOW", 40)
+)
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
+# 조회(GET) 전용 엔진/세션
+# - DATABASE_READ_URL이 있으면 복제본에 별도 풀을 만들고, 없으면 주 DB 엔진의 풀을 공유
+# - AUTOCOMMIT: 조회만 하므로 트랜잭션 스냅샷을 잡고 있지 않음
+# - 쓰기는 반드시 SessionLocal/AsyncSessionLocal(주 DB)로 수행
+_READ_OPTIONS = {"isolation_level": "AUTOCOMMIT"}
+
+if DATABASE_READ_URL:
+    read_engine = create_engine(
+        DATABASE_READ_URL, **_READ_OPTIONS,
+        **_pool_options("DB_READ_POOL_SIZE", 10, "DB_READ_MAX_OVERFLOW", 20)
+    )
+    read_async_engine = create_async_engine(
+        _to_async_url(DATABASE_READ_URL), **_READ_OPTIONS,
+        **_pool_options("DB_READ_ASYNC_POOL_SIZE", 30, "DB_READ_ASYNC_MAX_OVERFLOW", 30)
+    )
+else:
+    read_engine = engine.execution_options(**_READ_OPTIONS)
+    read_async_engine = async_engine.execution_options(**_READ_OPTIONS)
+
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+AsyncReadSessionLocal = async_sessionmaker(read_async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+def get_read_db():
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+async def get_async_read_db():
+    async with AsyncReadSessionLocal() as db:
+        yield db
@@ -257,6 +257,10 @@ class SimulationResponse(BaseModel):
 class TftPredBulkCreate(BaseModel):
     predictions: List[TftPredCreate]
 
+# --- 예측 설명 Bulk ---
+class ExpPredBulkCreate(BaseModel):
+    explanations: List[ExpPredCreate]
+
 # --- 뉴스 Bulk ---
 class NewsBulkCreate(BaseModel):
     news_list: List[NewsCreate]
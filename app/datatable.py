@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, BigInteger, String, Date, Numeric, Text, ForeignKey, ARRAY, TIMESTAMP, Float, JSON
+from sqlalchemy import Column, Integer, BigInteger, String, Date, Numeric, Text, ForeignKey, ARRAY, TIMESTAMP, Float, JSON, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from sqlalchemy.types import UserDefinedType
@@ -32,9 +32,10 @@ class TftPred(Base):
     target_date = Column(Date, index=True)
     commodity = Column(String(50), index=True)
     
-    price_pred = Column(Numeric(10, 2))
-    conf_lower = Column(Numeric(10, 2))
-    conf_upper = Column(Numeric(10, 2))
+    # DB 타입은 NUMERIC(10,2) 유지, 조회 시 Decimal 대신 float로 반환 (스키마가 float)
+    price_pred = Column(Numeric(10, 2, asdecimal=False))
+    conf_lower = Column(Numeric(10, 2, asdecimal=False))
+    conf_upper = Column(Numeric(10, 2, asdecimal=False))
 
     top1_factor = Column(String(255))
     top1_impact = Column(Float)
@@ -83,11 +84,16 @@ class TftPred(Base):
 
     explanation = relationship("ExpPred", back_populates="prediction", uselist=False)
 
+    __table_args__ = (
+        # commodity 필터 + target_date 정렬 조회를 인덱스 범위 스캔으로 처리
+        Index("idx_tft_pred_commodity_target_date", "commodity", target_date.desc()),
+    )
+
 class ExpPred(Base):
     __tablename__ = "exp_pred"
 
     id = Column(Integer, primary_key=True, index=True)
-    pred_id = Column(Integer, ForeignKey("tft_pred.id"))
+    pred_id = Column(Integer, ForeignKey("tft_pred.id"), index=True)
     content = Column(Text)  # Executive Summary
     llm_model = Column(String(50))
     impact_news = Column(JSON)  # high_impact_news
@@ -111,6 +117,16 @@ class MarketMetrics(Base):
     impact = Column(String(20))
     created_at = Column(TIMESTAMP, server_default=func.now())
 
+    __table_args__ = (
+        # 벌크 Upsert (INSERT ... ON CONFLICT)의 충돌 대상 - 품목/날짜별 지표는 하나만 유지
+        Index("uq_market_metrics_commodity_date_metric", "commodity", "date", "metric_id", unique=True),
+        # (commodity, date) 조회용 커버링 인덱스 - 응답 컬럼을 INCLUDE하여 index-only scan
+        Index(
+            "ix_market_metrics_commodity_date_covering", "commodity", "date",
+            postgresql_include=["id", "metric_id", "label", "value", "numeric_value", "trend", "impact"],
+        ),
+    )
+
 class HistoricalPrices(Base):
     __tablename__ = "historical_prices"
 
@@ -118,4 +134,9 @@ class HistoricalPrices(Base):
     commodity = Column(String(50), index=True)
     date = Column(Date, index=True)
     actual_price = Column(Numeric(10, 2))
-    created_at = Column(TIMESTAMP, server_default=func.now())
\ No newline at end of file
+    created_at = Column(TIMESTAMP, server_default=func.now())
+
+    __table_args__ = (
+        # (commodity, date 범위) 조회용 복합 인덱스 - 가격을 INCLUDE하여 heap 접근 최소화
+        Index("ix_historical_prices_commodity_date", "commodity", "date", postgresql_include=["actual_price"]),
+    )
\ No newline at end of file
@@ -0,0 +1,80 @@
+"""
+HTTP 캐시 헤더 (Cache-Control + ETag) 미들웨어
+
+대시보드가 반복 조회하는 GET 응답에 Cache-Control과 ETag를 붙입니다.
+- 브라우저/CDN은 max-age 동안 재요청하지 않고, 이후에는 If-None-Match로 재검증
+- 응답 본문이 같으면 304 (본문 없음)로 응답하여 전송/직렬화 이후 비용을 줄임
+GZip 미들웨어보다 안쪽에 등록하여 압축 전 본문으로 ETag를 계산합니다 (압축 여부와 무관하게 동일한 weak ETag).
+"""
+
+import hashlib
+from typing import Iterable
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class ETagMiddleware:
+    """지정한 경로의 GET 200 응답에 ETag/Cache-Control을 설정하고 If-None-Match 일치 시 304 반환"""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        path_prefixes: Iterable[str],
+        max_age: int = 30,
+        stale_while_revalidate: int = 60,
+    ) -> None:
+        self.app = app
+        self.path_prefixes = tuple(path_prefixes)
+        self.cache_control = f"public, max-age={max_age}, stale-while-revalidate={stale_while_revalidate}"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or not scope["path"].startswith(self.path_prefixes)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        start_message: Message = {}
+        body_parts = []
+
+        async def send_with_etag(message: Message) -> None:
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                # 본문을 다 받은 뒤 ETag를 계산해야 하므로 시작 메시지는 보류
+                start_message = message
+                return
+
+            if message["type"] != "http.response.body" or start_message.get("status") != 200:
+                # 200이 아닌 응답(404/500 등)은 그대로 전달
+                if start_message:
+                    await send(start_message)
+                    start_message = {}
+                await send(message)
+                return
+
+            body_parts.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(body_parts)
+            etag = f'W/"{hashlib.md5(body, usedforsecurity=False).hexdigest()}"'
+            headers = MutableHeaders(scope=start_message)
+            headers["ETag"] = etag
+            headers["Cache-Control"] = self.cache_control
+
+            if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+                # 변경 없음: 본문 없이 304
+                del headers["Content-Length"]
+                start_message["status"] = 304
+                await send(start_message)
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+            await send(start_message)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_with_etag)
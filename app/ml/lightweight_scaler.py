@@ -13,10 +13,52 @@ Usage:
 """
 
 import json
+import logging
+import math
 import numpy as np
 from typing import Union, Optional, Dict, Any
 from pathlib import Path
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    _json_loads = json.loads
+
+logger = logging.getLogger(__name__)
+
+
+def _scalar_log(x: float) -> float:
+    """np.log와 동일하게 동작하는 스칼라 log (0 → -inf, 음수 → nan)"""
+    if x > 0:
+        return math.log(x)
+    return -math.inf if x == 0 else math.nan
+
+
+def _scalar_log1p(x: float) -> float:
+    """np.log1p와 동일하게 동작하는 스칼라 log1p (-1 → -inf, -1 미만 → nan)"""
+    if x > -1:
+        return math.log1p(x)
+    return -math.inf if x == -1 else math.nan
+
+
+def _scalar_expm1(x: float) -> float:
+    """np.expm1과 동일하게 동작하는 스칼라 expm1 (overflow → inf)"""
+    try:
+        return math.expm1(x)
+    except OverflowError:
+        return math.inf
+
+
+def _scalar_softplus(x: float) -> float:
+    """스칼라 softplus (x > 20이면 linear approximation)"""
+    return x if x > 20 else math.log1p(math.exp(x))
+
+
+def _scalar_inverse_softplus(y: float) -> float:
+    """스칼라 softplus 역변환"""
+    return y if y > 20 else _scalar_log(math.expm1(y))
+
 
 class LightweightScaler:
     """
@@ -41,10 +83,117 @@ class LightweightScaler:
         self.scale = self.normalizer_params.get('scale')
         self.group_statistics = self.normalizer_params.get('group_statistics', {})
         
-        print(f"✅ LightweightScaler initialized")
-        print(f"   Transformation: {self.transformation}")
-        print(f"   Groups: {self.groups}")
-        print(f"   Target: {self.target}")
+        # 호출마다 반복되던 center/scale/그룹 통계 해석을 초기화 시 한 번만 수행
+        self._center_val = self._resolve_param(self.center)
+        self._scale_val = self._resolve_param(self.scale)
+        self._inv_scale_val = None
+        if self._scale_val is not None:
+            # 0으로 나누기 방지 후 역수로 보관 (나눗셈 → 곱셈)
+            self._inv_scale_val = 1.0 / np.where(np.abs(self._scale_val) < 1e-8, 1.0, self._scale_val)
+            if np.ndim(self._inv_scale_val) == 0:
+                self._inv_scale_val = float(self._inv_scale_val)
+        
+        # 그룹별 (mean, std, 1/std) - 없는 항목은 None
+        self._group_mean_std: Dict[str, tuple] = {}
+        for group_key, group_stats in self.group_statistics.items():
+            mean_val = group_stats.get('mean')
+            std_val = group_stats.get('std')
+            inv_std_val = None
+            if std_val is not None:
+                inv_std_val = 1.0 / (std_val if abs(std_val) > 1e-8 else 1.0)
+            self._group_mean_std[str(group_key)] = (mean_val, std_val, inv_std_val)
+        
+        # (group_key, use_center, use_scale, inverse) → 하나로 합친 affine 계수 (mul, add)
+        self._affine_cache: Dict[tuple, tuple] = {}
+        # center/scale이 스칼라면 affine 계수도 항상 스칼라 → float 경로 사용 가능
+        self._scalar_affine = not isinstance(self._center_val, np.ndarray) \
+            and not isinstance(self._scale_val, np.ndarray)
+        
+        # transformation별 처리 함수를 초기화 시 한 번만 선택 (호출마다 문자열 비교 제거)
+        if self.transformation == 'softplus':
+            self._forward_scalar, self._inverse_scalar = _scalar_softplus, _scalar_inverse_softplus
+            self._forward_array, self._inverse_array = self.softplus, self.inverse_softplus
+        elif self.transformation in ('log', 'log1p'):
+            self._forward_scalar, self._inverse_scalar = _scalar_log1p, _scalar_expm1
+            self._forward_array, self._inverse_array = np.log1p, np.expm1
+        else:
+            # 'none'이나 None인 경우 변환 없음
+            self._forward_scalar = self._inverse_scalar = None
+            self._forward_array = self._inverse_array = None
+        
+        logger.debug(
+            "LightweightScaler initialized: transformation=%s groups=%s target=%s",
+            self.transformation, self.groups, self.target
+        )
+    
+    @staticmethod
+    def _resolve_param(param: Any) -> Optional[Union[float, np.ndarray]]:
+        """center/scale 파라미터를 스칼라(길이 1) 또는 배열로 변환 (없으면 None)"""
+        if isinstance(param, (list, np.ndarray)) and len(param) > 0:
+            return float(param[0]) if len(param) == 1 else np.asarray(param, dtype=np.float64)
+        return None
+    
+    def _get_affine(
+        self,
+        group_id: Optional[str],
+        use_center: bool,
+        use_scale: bool,
+        inverse: bool = False
+    ) -> tuple:
+        """
+        center/scale/그룹 통계 단계를 하나의 affine 변환(value * mul + add)으로 합친 계수 반환
+        
+        transform:         ((v - center) / scale - mean) / std
+        inverse_transform: ((v * std + mean) * scale) + center
+        """
+        group_key = str(group_id) if group_id else None
+        cache_key = (group_key, use_center, use_scale, inverse)
+        affine = self._affine_cache.get(cache_key)
+        if affine is not None:
+            return affine
+        
+        center_val = self._center_val if use_center else None
+        group_stats = self._group_mean_std.get(group_key) if group_key else None
+        mean_val, std_val, inv_std_val = group_stats if group_stats else (None, None, None)
+        mul, add = 1.0, 0.0
+        
+        if not inverse:
+            if center_val is not None:
+                add = add - center_val
+            if use_scale and self._inv_scale_val is not None:
+                mul = mul * self._inv_scale_val
+                add = add * self._inv_scale_val
+            if mean_val is not None:
+                add = add - mean_val
+            if inv_std_val is not None:
+                mul = mul * inv_std_val
+                add = add * inv_std_val
+        else:
+            if std_val is not None:
+                mul = mul * std_val
+            if mean_val is not None:
+                add = add + mean_val
+            if use_scale and self._scale_val is not None:
+                mul = mul * self._scale_val
+                add = add * self._scale_val
+            if center_val is not None:
+                add = add + center_val
+        
+        affine = (mul, add)
+        self._affine_cache[cache_key] = affine
+        return affine
+    
+    @staticmethod
+    def _apply_affine(value: np.ndarray, mul: Any, add: Any) -> np.ndarray:
+        """value * mul + add를 임시 배열 하나로 계산"""
+        if np.ndim(mul) == 0 and mul == 1.0 and np.ndim(add) == 0 and add == 0.0:
+            return value
+        out = np.multiply(value, mul, dtype=np.float64)
+        if np.ndim(add) == 0 and isinstance(out, np.ndarray) and out.ndim > 0:
+            out += add
+        else:
+            out = out + add
+        return out
     
     @classmethod
     def from_json(cls, json_path: str) -> 'LightweightScaler':
@@ -57,8 +206,9 @@ class LightweightScaler:
         Returns:
             LightweightScaler 인스턴스
         """
-        with open(json_path, 'r', encoding='utf-8') as f:
-            scaler_params = json.load(f)
+        # orjson은 bytes를 직접 파싱하므로 바이너리 모드로 읽음 (json.loads도 UTF-8 bytes 지원)
+        with open(json_path, 'rb') as f:
+            scaler_params = _json_loads(f.read())
         
         return cls(scaler_params)
     
@@ -68,17 +218,33 @@ class LightweightScaler:
         
         pytorch-forecasting의 GroupNormalizer에서 사용하는 변환
         """
-        x = np.asarray(x)
+        out = np.array(x, dtype=np.float64)
         # 수치 안정성을 위해 큰 값은 linear approximation
-        return np.where(x > 20, x, np.log1p(np.exp(x)))
+        # (x <= 20인 원소에만 exp/log1p를 계산하여 버려지는 연산과 임시 배열을 제거)
+        mask = out <= 20
+        np.exp(out, out=out, where=mask)
+        np.log1p(out, out=out, where=mask)
+        return out
     
-    def inverse_softplus(self, y: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+    def inverse_softplus(
+        self,
+        y: Union[float, np.ndarray],
+        out: Optional[np.ndarray] = None
+    ) -> Union[float, np.ndarray]:
         """
         Softplus 역변환: log(exp(y) - 1)
+        
+        out이 주어지면 새 배열을 만들지 않고 out에 결과를 씁니다 (y와 같은 배열도 가능).
         """
-        y = np.asarray(y)
-        # 수치 안정성
-        return np.where(y > 20, y, np.log(np.expm1(y)))
+        if out is None:
+            out = np.array(y, dtype=np.float64)
+        elif out is not y:
+            np.copyto(out, y, casting='same_kind')
+        # 수치 안정성 (y <= 20인 원소에만 expm1/log 계산)
+        mask = out <= 20
+        np.expm1(out, out=out, where=mask)
+        np.log(out, out=out, where=mask)
+        return out
     
     def transform(
         self, 
@@ -99,41 +265,23 @@ class LightweightScaler:
         Returns:
             스케일링된 값
         """
-        value = np.asarray(value)
+        mul, add = self._get_affine(group_id, use_center, use_scale)
         
-        # 1. Transformation 적용 (softplus 등)
-        if self.transformation == 'softplus':
-            value = self.softplus(value)
-        elif self.transformation == 'log':
-            value = np.log1p(value)
-        elif self.transformation == 'log1p':
-            value = np.log1p(value)
-        # 'none'이나 None인 경우 변환 없음
+        # 단일 값(서빙 시 가장 흔한 경우)은 numpy를 거치지 않고 float 연산으로 처리
+        if self._scalar_affine and isinstance(value, (int, float, np.floating)):
+            v = float(value)
+            if self._forward_scalar is not None:
+                v = self._forward_scalar(v)
+            return v * mul + add
         
-        # 2. 정규화 (center & scale)
-        if self.center is not None and use_center:
-            if isinstance(self.center, (list, np.ndarray)) and len(self.center) > 0:
-                center_val = self.center[0] if len(self.center) == 1 else self.center
-                value = value - center_val
+        value = np.asarray(value)
         
-        if self.scale is not None and use_scale:
-            if isinstance(self.scale, (list, np.ndarray)) and len(self.scale) > 0:
-                scale_val = self.scale[0] if len(self.scale) == 1 else self.scale
-                # 0으로 나누기 방지
-                scale_val = np.where(np.abs(scale_val) < 1e-8, 1.0, scale_val)
-                value = value / scale_val
+        # 1. Transformation 적용 (softplus 등)
+        if self._forward_array is not None:
+            value = self._forward_array(value)
         
-        # 3. 그룹별 통계 적용 (있는 경우)
-        if group_id and self.group_statistics:
-            group_key = str(group_id)
-            if group_key in self.group_statistics:
-                group_stats = self.group_statistics[group_key]
-                if 'mean' in group_stats:
-                    value = value - group_stats['mean']
-                if 'std' in group_stats:
-                    std_val = group_stats['std']
-                    std_val = std_val if abs(std_val) > 1e-8 else 1.0
-                    value = value / std_val
+        # 2~3. 정규화 (center & scale) + 그룹별 통계 - 하나의 affine 변환으로 한 번에 적용
+        value = self._apply_affine(value, mul, add)
         
         return value if isinstance(value, np.ndarray) else float(value)
     
@@ -142,7 +290,8 @@ class LightweightScaler:
         scaled_value: Union[float, np.ndarray],
         group_id: Optional[str] = None,
         use_center: bool = True,
-        use_scale: bool = True
+        use_scale: bool = True,
+        out: Optional[np.ndarray] = None
     ) -> Union[float, np.ndarray]:
         """
         스케일링된 값을 원본 값으로 역변환
@@ -152,38 +301,34 @@ class LightweightScaler:
             group_id: 그룹 ID
             use_center: 중심화 역변환 여부
             use_scale: 스케일 역변환 여부
+            out: 결과를 쓸 배열 (scaled_value와 같은 배열이면 in-place 역변환)
+            
+        scaled_value는 다차원 배열도 가능하며 center/scale은 마지막 축 기준으로 broadcast 됩니다.
             
         Returns:
-            원본 값
+            원본 값 (out이 주어지면 out)
         """
-        value = np.asarray(scaled_value)
+        # 1~2. 그룹별 통계 역변환 + 정규화 역변환 (scale & center) - 하나의 affine 변환으로 적용
+        mul, add = self._get_affine(group_id, use_center, use_scale, inverse=True)
         
-        # 1. 그룹별 통계 역변환 (있는 경우)
-        if group_id and self.group_statistics:
-            group_key = str(group_id)
-            if group_key in self.group_statistics:
-                group_stats = self.group_statistics[group_key]
-                if 'std' in group_stats:
-                    value = value * group_stats['std']
-                if 'mean' in group_stats:
-                    value = value + group_stats['mean']
+        if out is not None:
+            np.multiply(scaled_value, mul, out=out, casting='same_kind')
+            np.add(out, add, out=out, casting='same_kind')
+            # 3. Transformation 역변환 (in-place)
+            if self._inverse_array is not None:
+                self._inverse_array(out, out=out)
+            return out
         
-        # 2. 정규화 역변환 (scale & center)
-        if self.scale is not None and use_scale:
-            if isinstance(self.scale, (list, np.ndarray)) and len(self.scale) > 0:
-                scale_val = self.scale[0] if len(self.scale) == 1 else self.scale
-                value = value * scale_val
+        if self._scalar_affine and isinstance(scaled_value, (int, float, np.floating)):
+            v = float(scaled_value) * mul + add
+            return self._inverse_scalar(v) if self._inverse_scalar is not None else v
         
-        if self.center is not None and use_center:
-            if isinstance(self.center, (list, np.ndarray)) and len(self.center) > 0:
-                center_val = self.center[0] if len(self.center) == 1 else self.center
-                value = value + center_val
+        value = np.asarray(scaled_value)
+        value = self._apply_affine(value, mul, add)
         
         # 3. Transformation 역변환
-        if self.transformation == 'softplus':
-            value = self.inverse_softplus(value)
-        elif self.transformation in ['log', 'log1p']:
-            value = np.expm1(value)
+        if self._inverse_array is not None:
+            value = self._inverse_array(value)
         
         return value if isinstance(value, np.ndarray) else float(value)
     
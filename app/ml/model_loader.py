@@ -1,3 +1,4 @@
+import os
 import re
 import onnxruntime as ort
 import pickle
@@ -10,6 +11,7 @@ logger = logging.getLogger(__name__)
 
 # S3 파일명 패턴  (예: 60d_20260206.onnx, 60d_preprocessing_20260206.pkl)
 _ONNX_PATTERN = re.compile(r"60d_(\d{8})\.onnx$")
+_ONNX_INT8_PATTERN = re.compile(r"60d_(\d{8})\.int8\.onnx$")
 _PKL_PATTERN = re.compile(r"60d_preprocessing_(\d{8})\.pkl$")
 
 
@@ -104,6 +106,38 @@ class ONNXModelLoader:
         self._load_from_s3(commodity)
         return True
 
+    # ===========================================
+    # 세션 생성
+    # ===========================================
+
+    @staticmethod
+    def _create_session(model_path: Path) -> ort.InferenceSession:
+        """
+        ONNX 세션 생성 (그래프 최적화 + 최적화 모델 저장)
+
+        - 최초 로드: ORT_ENABLE_ALL로 최적화하고 `<model>.opt.onnx`로 저장
+        - 이후 로드: 원본보다 최신인 `.opt.onnx`가 있으면 재최적화 없이 바로 로드
+        """
+        opt_path = model_path.with_name(model_path.name + ".opt.onnx")
+
+        sess_options = ort.SessionOptions()
+        sess_options.intra_op_num_threads = max(1, (os.cpu_count() or 2) // 2)
+        sess_options.execution_mode = ort.ExecutionMode.ORT_PARALLEL
+
+        if opt_path.exists() and opt_path.stat().st_mtime >= model_path.stat().st_mtime:
+            sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_DISABLE_ALL
+            load_path = opt_path
+            logger.info(f"최적화된 모델 사용: {opt_path.name}")
+        else:
+            sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+            sess_options.optimized_model_filepath = str(opt_path)
+            load_path = model_path
+            logger.info(f"그래프 최적화 후 저장: {opt_path.name}")
+
+        return ort.InferenceSession(
+            str(load_path), sess_options=sess_options, providers=["CPUExecutionProvider"]
+        )
+
     # ===========================================
     # Local 모드
     # ===========================================
@@ -116,9 +150,7 @@ class ONNXModelLoader:
         onnx_file, pkl_file = self._find_local_files()
 
         logger.info(f"ONNX 세션 생성 중... {onnx_file.name}")
-        session = ort.InferenceSession(
-            str(onnx_file), providers=["CPUExecutionProvider"]
-        )
+        session = self._create_session(onnx_file)
         self.sessions[commodity] = session
         logger.info(f"✅ ONNX 세션 생성 완료: {onnx_file.name}")
 
@@ -144,7 +176,11 @@ class ONNXModelLoader:
 
     def _find_local_files(self) -> Tuple[Path, Optional[Path]]:
         """로컬 경로에서 ONNX, PKL 파일 찾기 (파일명 정렬 → 마지막 = 최신)"""
-        onnx_files = sorted(self.local_path.glob("*.onnx"))
+        # .opt.onnx(최적화 산출물) / .int8.onnx(양자화 버전)는 원본 후보에서 제외
+        onnx_files = sorted(
+            f for f in self.local_path.glob("*.onnx")
+            if not f.name.endswith((".opt.onnx", ".int8.onnx"))
+        )
         pkl_files = sorted(self.local_path.glob("*.pkl"))
 
         if not onnx_files:
@@ -155,6 +191,12 @@ class ONNXModelLoader:
         onnx_file = onnx_files[-1]
         pkl_file = pkl_files[-1] if pkl_files else None
 
+        # 같은 모델의 int8 양자화 버전이 있으면 우선 사용
+        int8_file = onnx_file.with_name(f"{onnx_file.stem}.int8.onnx")
+        if settings.prefer_int8_model and int8_file.exists():
+            logger.info(f"int8 양자화 모델 사용: {int8_file.name}")
+            onnx_file = int8_file
+
         logger.info(f"로컬 모델 파일 발견: {onnx_file.name}")
         if pkl_file:
             logger.info(f"전처리 정보 파일 발견: {pkl_file.name}")
@@ -210,9 +252,7 @@ class ONNXModelLoader:
 
         # ONNX 세션 생성
         logger.info(f"[{commodity}] ONNX 세션 생성 중...")
-        session = ort.InferenceSession(
-            str(model_local), providers=["CPUExecutionProvider"]
-        )
+        session = self._create_session(model_local)
         self.sessions[commodity] = session
         logger.info(f"✅ [{commodity}] ONNX 세션 생성 완료 (from {latest_onnx_key})")
 
@@ -254,6 +294,7 @@ class ONNXModelLoader:
 
         onnx_candidates: list[Tuple[str, str]] = []  # (date_str, key)
         pkl_candidates: list[Tuple[str, str]] = []
+        int8_keys: Dict[str, str] = {}               # {date_str: key}
 
         for page in pages:
             for obj in page.get("Contents", []):
@@ -265,11 +306,21 @@ class ONNXModelLoader:
                     onnx_candidates.append((m_onnx.group(1), key))
                     continue
 
+                m_int8 = _ONNX_INT8_PATTERN.search(filename)
+                if m_int8:
+                    int8_keys[m_int8.group(1)] = key
+                    continue
+
                 m_pkl = _PKL_PATTERN.search(filename)
                 if m_pkl:
                     pkl_candidates.append((m_pkl.group(1), key))
 
-        latest_onnx = max(onnx_candidates, key=lambda x: x[0])[1] if onnx_candidates else None
+        latest_onnx = None
+        if onnx_candidates:
+            latest_date, latest_onnx = max(onnx_candidates, key=lambda x: x[0])
+            # 같은 날짜의 int8 양자화 버전이 있으면 우선 사용
+            if settings.prefer_int8_model and latest_date in int8_keys:
+                latest_onnx = int8_keys[latest_date]
         latest_pkl = max(pkl_candidates, key=lambda x: x[0])[1] if pkl_candidates else None
 
         if latest_onnx:
@@ -1,7 +1,12 @@
 import numpy as np
 from typing import Dict, List, Optional, Tuple
-from datetime import datetime, timedelta
+from datetime import datetime, date
+from collections import OrderedDict
+import hashlib
 import logging
+import sys
+import threading
+import weakref
 
 from .model_loader import get_model_loader
 from .lightweight_scaler import LightweightScaler
@@ -10,11 +15,29 @@ from app.config import settings
 logger = logging.getLogger(__name__)
 
 
+def _get_group_normalizer_class():
+    """
+    pytorch-forecasting의 GroupNormalizer 클래스 반환 (없으면 None)
+    
+    GroupNormalizer가 들어있는 PKL을 언피클하면 모듈이 이미 로드되어 있으므로
+    sys.modules에서 찾기만 하고, torch를 끌어오는 새 import는 하지 않습니다.
+    """
+    module = sys.modules.get('pytorch_forecasting.data.encoders')
+    return getattr(module, 'GroupNormalizer', None) if module is not None else None
+
+
+def _to_numpy(value) -> np.ndarray:
+    """torch tensor / 스칼라 / 시퀀스를 1차원 float64 ndarray로 변환"""
+    if hasattr(value, 'detach'):
+        value = value.detach().cpu().numpy()
+    return np.atleast_1d(np.asarray(value, dtype=np.float64))
+
+
 class TFTFeatureConfig:
     """TFT 모델의 Feature 구성 정보"""
     
     # Feature 순서 정의 (총 52개)
-    FEATURE_ORDER = [
+    FEATURE_ORDER: Tuple[str, ...] = (
         # Unknown Time-Varying (46개)
         'close', 'open', 'high', 'low', 'volume', 'EMA',  # 가격/거래량 6개
         *[f'news_pca_{i}' for i in range(32)],  # 뉴스 PCA 32개
@@ -26,13 +49,13 @@ class TFTFeatureConfig:
         'time_idx', 'day_of_year', 'relative_time_idx',
         # Static (3개)
         'encoder_length', 'close_center', 'close_scale'
-    ]
+    )
     
     # 시계열 관련 Feature (동적 생성 필요)
-    TIME_FEATURES = {'time_idx', 'day_of_year', 'relative_time_idx'}
+    TIME_FEATURES = frozenset({'time_idx', 'day_of_year', 'relative_time_idx'})
     
     # Static Feature (모든 시점에서 동일)
-    STATIC_FEATURES = {'encoder_length', 'close_center', 'close_scale'}
+    STATIC_FEATURES = frozenset({'encoder_length', 'close_center', 'close_scale'})
     
     # Known Future Features (미래 시점에도 알 수 있는 Feature)
     KNOWN_FEATURES = TIME_FEATURES | STATIC_FEATURES
@@ -51,20 +74,67 @@ class TFTFeatureConfig:
     NORMALIZATION_EXCLUDE = TIME_FEATURES | STATIC_FEATURES | {'relative_time_idx'}
 
 
+# Feature 열 채우기 방식 (FEATURE_ORDER 인덱스별로 초기화 시 한 번만 결정)
+_FEAT_ENCODER_LENGTH = 0   # static: encoder 길이
+_FEAT_CLOSE_SCALE = 1      # static: close scale 기본값
+_FEAT_CLOSE_CENTER = 2     # static: close 값
+_FEAT_TIME_IDX = 3         # known: 시점 인덱스
+_FEAT_DAY_OF_YEAR = 4      # known: 연중 일자
+_FEAT_RELATIVE_TIME = 5    # known: 상대 시점
+_FEAT_DATA = 6             # unknown: 데이터 조회 (decoder에서는 0)
+
+_STATIC_FEATURE_HANDLERS = {
+    'encoder_length': _FEAT_ENCODER_LENGTH,
+    'close_scale': _FEAT_CLOSE_SCALE,
+    'close_center': _FEAT_CLOSE_CENTER,
+    'time_idx': _FEAT_TIME_IDX,
+    'day_of_year': _FEAT_DAY_OF_YEAR,
+    'relative_time_idx': _FEAT_RELATIVE_TIME,
+}
+
+
 class ONNXPredictionService:
     """ONNX 기반 TFT 모델 예측 서비스"""
     
+    # 예측 결과 LRU 캐시 크기
+    PREDICTION_CACHE_SIZE = 128
+    
     def __init__(self):
+        # 세션은 모델 로더가 ORT_ENABLE_ALL로 생성합니다.
+        # 최초 로드 시 `<model>.opt.onnx`가 생성되고, 이후 시작 시에는 재최적화 없이 이를 로드합니다.
         self.model_loader = get_model_loader()
         self.feature_config = TFTFeatureConfig()
         # 정규화 파라미터 캐시 (commodity별로 저장)
         self.normalization_params = {}
+        # 정규화 파라미터 SoA: (feature 이름 tuple, mean (F,), std (F,)) - NORMALIZATION_EXCLUDE 제외
+        self._norm_state: Tuple[Tuple[str, ...], np.ndarray, np.ndarray] = (
+            (), np.empty(0, dtype=np.float32), np.empty(0, dtype=np.float32)
+        )
         # PKL에서 로드한 scaler 캐시
         self.pkl_scaler = None
         # LightweightScaler 캐시 (GroupNormalizer용)
         self.lightweight_scaler = None
         # 사용 중인 정규화 방식
         self.normalization_method = None  # 'group_normalizer', 'standard_scaler', 'dynamic'
+        # 예측 결과 LRU 캐시: key → (session, result)
+        self._prediction_cache: "OrderedDict[tuple, Tuple[object, Dict[str, List[float]]]]" = OrderedDict()
+        self._prediction_cache_lock = threading.Lock()
+        # 정규화 상태(normalization_method/_norm_state 등)는 입력 준비 시 설정되고 결과 파싱 시 사용되므로,
+        # 싱글톤을 여러 요청이 공유할 때 준비 → 추론 → 파싱을 한 단위로 직렬화 (캐시 적중 시에는 잠그지 않음)
+        self._inference_lock = threading.RLock()
+        # 세션 → 배치 축 가변 여부 (batch=1 고정 모델은 배치 예측 시 요청별 추론)
+        self._batchable_sessions: "weakref.WeakKeyDictionary[object, bool]" = weakref.WeakKeyDictionary()
+        # 세션 → {배치 크기: (IOBinding, 출력 버퍼)} - 모델 로더가 세션을 교체하면 함께 해제
+        self._io_bindings: "weakref.WeakKeyDictionary[object, Dict[int, Tuple[object, List[np.ndarray]]]]" = weakref.WeakKeyDictionary()
+        # commodity → (normalization_params, target_scale) - StandardScaler PKL 기반 target_scale 캐시
+        self._target_scale_cache: Dict[str, Tuple[Dict, np.ndarray]] = {}
+        # commodity → (preprocessing_info, method, lightweight_scaler, normalization_params, pkl_scaler, norm_state)
+        self._scaler_cache: Dict[str, Tuple[dict, str, Optional[LightweightScaler], Dict, object, tuple]] = {}
+        # FEATURE_ORDER 열별 (처리 방식, feature 이름) 테이블 - 문자열 비교 체인 대신 사용
+        self._feature_handlers: Tuple[Tuple[int, str], ...] = tuple(
+            (_STATIC_FEATURE_HANDLERS.get(fname, _FEAT_DATA), fname)
+            for fname in self.feature_config.FEATURE_ORDER
+        )
         logger.info("TFT 예측 서비스 초기화 완료")
     
     def predict_tft(
@@ -105,26 +175,207 @@ class ONNXPredictionService:
         # ONNX 세션 로드
         session = self.model_loader.load_session(commodity)
         
-        # TFT 입력 형식으로 변환
-        model_inputs = self._prepare_model_inputs(historical_data, feature_overrides)
+        # 동일 입력(같은 모델/날짜/feature/override)이면 캐시된 결과 반환
+        cache_key = self._make_prediction_cache_key(commodity, historical_data, feature_overrides)
+        cached = self._get_cached_prediction(cache_key, session)
+        if cached is not None:
+            return cached
         
-        # 로깅
-        self._log_inference_info(model_inputs)
+        with self._inference_lock:
+            # TFT 입력 형식으로 변환
+            model_inputs = self._prepare_model_inputs(historical_data, feature_overrides, commodity)
+            
+            # 로깅
+            self._log_inference_info(model_inputs)
+            
+            # 추론 실행
+            outputs = self._run_session(session, model_inputs)
+            
+            # 결과 파싱
+            result = self._parse_predictions(outputs)
         
-        # 추론 실행
-        outputs = session.run(None, model_inputs)
+        logger.info("예측 완료 - 7일 예측: %s", result['predictions'])
         
-        # 결과 파싱
-        result = self._parse_predictions(outputs)
+        self._store_prediction(cache_key, session, result)
+        return result
+    
+    def predict_tft_batch(
+        self,
+        requests: List[Tuple[str, Dict[str, any], Optional[Dict[str, float]]]]
+    ) -> List[Dict[str, List[float]]]:
+        """
+        여러 예측 요청을 commodity별로 묶어 한 번의 추론으로 실행
         
-        logger.info(f"예측 완료 - 7일 예측: {result['predictions']}")
+        Args:
+            requests: [(commodity, historical_data, feature_overrides), ...]
         
-        return result
+        Returns:
+            요청 순서대로의 예측 결과 리스트 (각 항목은 predict_tft 결과와 동일)
+        """
+        results: List[Optional[Dict[str, List[float]]]] = [None] * len(requests)
+        
+        # commodity별 (요청 인덱스, 캐시 키) 그룹핑 - 캐시 적중 요청은 추론에서 제외
+        groups: Dict[str, List[Tuple[int, tuple]]] = {}
+        sessions = {}
+        for i, (commodity, historical_data, feature_overrides) in enumerate(requests):
+            if commodity not in sessions:
+                sessions[commodity] = self.model_loader.load_session(commodity)
+            cache_key = self._make_prediction_cache_key(commodity, historical_data, feature_overrides)
+            cached = self._get_cached_prediction(cache_key, sessions[commodity])
+            if cached is not None:
+                results[i] = cached
+            else:
+                groups.setdefault(commodity, []).append((i, cache_key))
+        
+        for commodity, members in groups.items():
+            session = sessions[commodity]
+            with self._inference_lock:
+                if len(members) > 1 and not self._supports_batching(session):
+                    # 배치 축이 1로 고정된 모델: 요청별로 따로 추론
+                    member_results = [
+                        self._parse_predictions(self._run_session(
+                            session, self._prepare_model_inputs(requests[i][1], requests[i][2], commodity)
+                        ))
+                        for i, _ in members
+                    ]
+                else:
+                    prepared = [
+                        self._prepare_model_inputs(requests[i][1], requests[i][2], commodity)
+                        for i, _ in members
+                    ]
+                    
+                    # 배치 축(axis 0)으로 쌓아 한 번에 추론
+                    batch_inputs = {
+                        name: np.concatenate([inputs[name] for inputs in prepared], axis=0)
+                        for name in prepared[0]
+                    }
+                    self._log_inference_info(batch_inputs)
+                    outputs = self._run_session(session, batch_inputs)
+                    
+                    # 같은 commodity는 정규화 상태가 같으므로 샘플별로 나눠 파싱
+                    member_results = [
+                        self._parse_predictions([output[b:b + 1] for output in outputs])
+                        for b in range(len(members))
+                    ]
+            
+            for (i, cache_key), result in zip(members, member_results):
+                self._store_prediction(cache_key, session, result)
+                results[i] = result
+            
+            logger.info("배치 예측 완료 - %s: %d건", commodity, len(members))
+        
+        return results
+    
+    def _supports_batching(self, session) -> bool:
+        """
+        모델 입력의 배치 축(axis 0)이 가변인지 확인 (세션별로 한 번만 검사)
+        
+        batch=1로 고정되어 export된 모델은 predict_tft_batch에서 요청별 추론으로 대체합니다.
+        """
+        supported = self._batchable_sessions.get(session)
+        if supported is None:
+            supported = all(
+                not isinstance(inp.shape[0], int) or inp.shape[0] != 1
+                for inp in session.get_inputs()
+                if inp.shape
+            )
+            if not supported:
+                logger.warning("ONNX 모델의 배치 축이 1로 고정되어 있어 배치 예측을 요청별 추론으로 실행합니다")
+            self._batchable_sessions[session] = supported
+        return supported
+    
+    def _get_cached_prediction(self, cache_key: tuple, session) -> Optional[Dict[str, List[float]]]:
+        """예측 캐시 조회 (같은 세션에서 계산된 결과만 유효)"""
+        with self._prediction_cache_lock:
+            cached = self._prediction_cache.get(cache_key)
+            if cached is None or cached[0] is not session:
+                return None
+            self._prediction_cache.move_to_end(cache_key)
+        logger.info("예측 캐시 적중 - %s", cache_key[0])
+        return {name: list(values) for name, values in cached[1].items()}
+    
+    def _store_prediction(self, cache_key: tuple, session, result: Dict[str, List[float]]):
+        """예측 결과를 LRU 캐시에 저장"""
+        with self._prediction_cache_lock:
+            self._prediction_cache[cache_key] = (
+                session, {name: list(values) for name, values in result.items()}
+            )
+            self._prediction_cache.move_to_end(cache_key)
+            while len(self._prediction_cache) > self.PREDICTION_CACHE_SIZE:
+                self._prediction_cache.popitem(last=False)
+    
+    def _run_session(self, session, model_inputs: Dict[str, np.ndarray]) -> List[np.ndarray]:
+        """
+        IOBinding으로 추론 실행
+        
+        입력 ndarray를 ORT에 복사 없이 바인딩합니다.
+        (세션, 배치 크기)별 IOBinding과 출력 버퍼를 한 번 만들어 재사용하므로,
+        두 번째 실행부터는 ORT가 미리 할당된 numpy 버퍼에 출력을 직접 씁니다.
+        반환 배열은 다음 추론에서 덮어쓰이므로 _inference_lock 안에서 바로 파싱해야 합니다.
+        """
+        batch_size = len(model_inputs['encoder_lengths'])
+        per_session = self._io_bindings.get(session)
+        if per_session is None:
+            per_session = self._io_bindings[session] = {}
+        entry = per_session.get(batch_size)
+        
+        if entry is None:
+            binding = session.io_binding()
+            for output in session.get_outputs():
+                binding.bind_output(output.name, 'cpu')
+            buffers = None
+        else:
+            binding, buffers = entry
+            binding.clear_binding_inputs()
+        
+        for name, array in model_inputs.items():
+            binding.bind_cpu_input(name, np.ascontiguousarray(array))
+        
+        session.run_with_iobinding(binding)
+        if buffers is not None:
+            return buffers
+        
+        # 첫 실행: ORT가 할당한 출력과 같은 shape의 버퍼를 만들어 이후 실행의 출력으로 바인딩
+        buffers = [np.ascontiguousarray(output) for output in binding.copy_outputs_to_cpu()]
+        binding.clear_binding_outputs()
+        for output, buffer in zip(session.get_outputs(), buffers):
+            binding.bind_output(output.name, 'cpu', 0, buffer.dtype.type, buffer.shape, buffer.ctypes.data)
+        per_session[batch_size] = (binding, buffers)
+        return buffers
+    
+    def invalidate(self, commodity: Optional[str] = None):
+        """예측 캐시 무효화 (commodity 미지정 시 전체)"""
+        with self._prediction_cache_lock:
+            if commodity is None:
+                self._prediction_cache.clear()
+                return
+            for key in [k for k in self._prediction_cache if k[0] == commodity]:
+                del self._prediction_cache[key]
+    
+    @staticmethod
+    def _make_prediction_cache_key(
+        commodity: str,
+        historical_data: Dict[str, any],
+        feature_overrides: Optional[Dict[str, float]]
+    ) -> tuple:
+        """
+        예측 캐시 키 생성
+        
+        (commodity, 오늘 날짜, 전체 feature 값의 해시, override) 조합.
+        day_of_year가 오늘 날짜 기준이므로 날짜도 키에 포함합니다.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for name in sorted(historical_data['features']):
+            digest.update(name.encode())
+            digest.update(np.ascontiguousarray(historical_data['features'][name], dtype=np.float32).tobytes())
+        overrides_key = tuple(sorted((feature_overrides or {}).items()))
+        return (commodity, date.today().toordinal(), digest.digest(), overrides_key)
     
     def _prepare_model_inputs(
         self, 
         historical_data: Dict[str, any],
-        feature_overrides: Optional[Dict[str, float]] = None
+        feature_overrides: Optional[Dict[str, float]] = None,
+        commodity: str = "corn"
     ) -> Dict[str, np.ndarray]:
         """
         과거 데이터를 TFT 모델 입력 형식으로 변환
@@ -141,23 +392,25 @@ class ONNXPredictionService:
         Returns:
             ONNX 모델 입력 텐서 딕셔너리
         """
-        # 🔥 중요: Deep copy를 해야 원본 데이터가 변경되지 않음!
-        import copy
-        features = copy.deepcopy(historical_data['features'])
+        # 🔥 중요: 원본 데이터가 변경되지 않도록 feature별로 새 ndarray를 만들어 사용
+        # (deepcopy로 float 객체를 하나씩 복사하는 대신 feature당 한 번의 배열 생성)
+        features = {
+            name: np.array(values, dtype=np.float32)
+            for name, values in historical_data['features'].items()
+        }
         
         # 🔥 추가: 모델 입력용 로그 변환 (data_fetcher에서 제거했으므로 여기서 수행)
         # 가격 관련 변수는 log1p 변환하여 모델에 입력
         log_cols = ['close', 'open', 'high', 'low', 'volume', 'EMA']
         for col in log_cols:
-            if col in features and features[col]:
-                # 리스트를 numpy로 변환하여 벡터 연산 후 다시 리스트로
-                arr = np.array(features[col], dtype=np.float64)
+            if col in features and len(features[col]) > 0:
+                # 위에서 새로 만든 배열이므로 제자리(in-place) 변환 후 배열 그대로 정규화 단계로 전달
                 # 이미 로그 변환된 값이 아닌 경우에만 변환 (값의 범위로 추정)
                 # 옥수수 가격은 보통 400~600이므로 log값은 6.0~6.5
                 # 만약 평균이 10 미만이라면 이미 로그 변환된 것으로 간주할 수도 있지만,
                 # data_fetcher가 원본을 주도록 수정했으므로 무조건 변환
-                features[col] = np.log1p(arr).tolist()
-                logger.debug(f"   {col}: Log1p 변환 완료 (first={features[col][0]:.2f})")
+                np.log1p(features[col], out=features[col])
+                logger.debug("   %s: Log1p 변환 완료 (first=%.2f)", col, features[col][0])
         
         # Feature override 적용
         if feature_overrides:
@@ -166,14 +419,14 @@ class ONNXPredictionService:
         # 🔥 정규화 파라미터 로드 또는 계산
         # 1순위: PKL 파일의 scaler 사용 (학습 시와 동일)
         # 2순위: 동적 계산 (encoder 데이터 기반)
-        self._load_or_compute_normalization_params(features)
+        self._load_or_compute_normalization_params(features, commodity)
         
         # 🔥 Feature 정규화 적용
         normalized_features = self._normalize_features(features)
         
-        # Encoder/Decoder 데이터 생성
-        encoder_cont = self._build_encoder_features(normalized_features)
-        decoder_cont = self._build_decoder_features(normalized_features)
+        # Encoder/Decoder 데이터 생성 (day_of_year는 요청당 한 번만 계산)
+        day_of_year = self._get_day_of_year_vector()
+        encoder_cont, decoder_cont = self._build_feature_tensors(normalized_features, day_of_year)
         
         # 범주형 데이터 (group_id)
         encoder_cat = np.zeros([1, self.feature_config.ENCODER_LENGTH, 1], dtype=np.int64)
@@ -184,7 +437,7 @@ class ONNXPredictionService:
         decoder_lengths = np.array([self.feature_config.DECODER_LENGTH], dtype=np.int64)
         
         # Target scale (정규화된 close 값 기반)
-        target_scale = self._get_target_scale(features)
+        target_scale = self._get_target_scale(features, commodity)
         
         return {
             'encoder_cat': encoder_cat,
@@ -196,7 +449,11 @@ class ONNXPredictionService:
             'target_scale': target_scale
         }
     
-    def _load_or_compute_normalization_params(self, features: Dict[str, List[float]]):
+    def _load_or_compute_normalization_params(
+        self,
+        features: Dict[str, List[float]],
+        commodity: str = "corn"
+    ):
         """
         정규화 파라미터 로드 또는 계산
         
@@ -204,17 +461,34 @@ class ONNXPredictionService:
         1. GroupNormalizer (pytorch-forecasting) - LightweightScaler 사용
         2. StandardScaler (sklearn) - PKL에서 mean_/scale_ 추출
         3. 동적 계산 (fallback) - Encoder 데이터로 계산
+        
+        PKL 기반 결과(1, 2순위)는 commodity별로 캐시하며,
+        모델 로더가 PKL을 다시 로드하면(객체가 바뀌면) 새로 추출합니다.
         """
+        preprocessing_info = self.model_loader.get_preprocessing_info(commodity)
+        
+        cached = self._scaler_cache.get(commodity)
+        if cached is not None and cached[0] is preprocessing_info:
+            (_, self.normalization_method, self.lightweight_scaler,
+             self.normalization_params, self.pkl_scaler, self._norm_state) = cached
+            return
+        
+        # 싱글톤이 여러 commodity를 처리하므로 이전 commodity의 정규화 상태를 비우고 시작
+        # (각 방식은 자신에게 필요한 속성만 설정하므로, 남은 값이 섞여 캐시되지 않도록)
+        self._reset_normalization_state()
+        
         # 1순위: GroupNormalizer 시도
-        if self._load_group_normalizer_from_pkl():
+        if self._load_group_normalizer_from_pkl(preprocessing_info):
             logger.info("✅ GroupNormalizer 사용 (pytorch-forecasting 방식)")
             self.normalization_method = 'group_normalizer'
+            self._cache_scaler_state(commodity, preprocessing_info)
             return
         
         # 2순위: StandardScaler 시도
-        if self._load_normalization_params_from_pkl():
+        if self._load_normalization_params_from_pkl(preprocessing_info):
             logger.info("✅ StandardScaler 사용 (sklearn 방식)")
             self.normalization_method = 'standard_scaler'
+            self._cache_scaler_state(commodity, preprocessing_info)
             return
         
         # 3순위: 동적 계산 (fallback)
@@ -222,16 +496,53 @@ class ONNXPredictionService:
         self._compute_normalization_params(features)
         self.normalization_method = 'dynamic'
     
-    def _load_group_normalizer_from_pkl(self) -> bool:
+    def _reset_normalization_state(self):
+        """정규화 상태 초기화 (scaler 없음, 파라미터 없음)"""
+        self.normalization_method = None
+        self.lightweight_scaler = None
+        self.pkl_scaler = None
+        self._set_normalization_params({})
+    
+    def _cache_scaler_state(self, commodity: str, preprocessing_info: dict):
+        """PKL에서 얻은 정규화 상태를 commodity별로 캐시"""
+        self._scaler_cache[commodity] = (
+            preprocessing_info,
+            self.normalization_method,
+            self.lightweight_scaler,
+            self.normalization_params,
+            self.pkl_scaler,
+            self._norm_state,
+        )
+    
+    def _set_normalization_params(self, params: Dict[str, Dict[str, float]]):
+        """
+        정규화 파라미터 저장
+        
+        dict(이름 → mean/std)와 함께 연속된 float32 (F,) mean/std 벡터(SoA)를 만들어
+        정규화 시 행렬 단위 broadcast 연산에 사용합니다.
+        """
+        self.normalization_params = params
+        names = tuple(
+            name for name in params
+            if name not in self.feature_config.NORMALIZATION_EXCLUDE
+        )
+        self._norm_state = (
+            names,
+            np.array([params[name]['mean'] for name in names], dtype=np.float32),
+            np.array([params[name]['std'] for name in names], dtype=np.float32),
+        )
+    
+    def _load_group_normalizer_from_pkl(self, preprocessing_info: dict) -> bool:
         """
         PKL 파일에서 GroupNormalizer 로드 (pytorch-forecasting)
         
+        Args:
+            preprocessing_info: 모델 로더가 로드한 전처리 정보
+        
         Returns:
             성공 여부
         """
         try:
-            preprocessing_info = self.model_loader.get_preprocessing_info()
-            
             if not preprocessing_info:
                 logger.debug("전처리 정보가 없습니다")
                 return False
@@ -251,9 +562,14 @@ class ONNXPredictionService:
                 return False
             
             # GroupNormalizer 타입 확인
-            normalizer_type = type(normalizer).__name__
-            if 'GroupNormalizer' not in normalizer_type:
-                logger.debug(f"GroupNormalizer가 아님: {normalizer_type}")
+            # (pytorch-forecasting이 로드되어 있으면 isinstance, 아니면 클래스 이름으로 판별)
+            group_normalizer_cls = _get_group_normalizer_class()
+            if group_normalizer_cls is not None:
+                is_group_normalizer = isinstance(normalizer, group_normalizer_cls)
+            else:
+                is_group_normalizer = 'GroupNormalizer' in type(normalizer).__name__
+            if not is_group_normalizer:
+                logger.debug("GroupNormalizer가 아님: %s", type(normalizer).__name__)
                 return False
             
             # LightweightScaler로 변환
@@ -299,32 +615,25 @@ class ONNXPredictionService:
                 'normalizer_params': {}
             }
             
-            # Center & Scale 추출
-            if hasattr(normalizer, 'center_'):
-                center = normalizer.center_
-                if hasattr(center, 'cpu'):
-                    center = center.cpu().numpy()
-                scaler_params['normalizer_params']['center'] = center.tolist() if hasattr(center, 'tolist') else [float(center)]
+            # Center & Scale 추출 (ndarray 그대로 전달 - LightweightScaler가 직접 해석)
+            center = getattr(normalizer, 'center_', None)
+            if center is not None:
+                scaler_params['normalizer_params']['center'] = _to_numpy(center)
             
-            if hasattr(normalizer, 'scale_'):
-                scale = normalizer.scale_
-                if hasattr(scale, 'cpu'):
-                    scale = scale.cpu().numpy()
-                scaler_params['normalizer_params']['scale'] = scale.tolist() if hasattr(scale, 'tolist') else [float(scale)]
+            scale = getattr(normalizer, 'scale_', None)
+            if scale is not None:
+                scaler_params['normalizer_params']['scale'] = _to_numpy(scale)
             
             # 그룹별 통계 추출 (있는 경우)
             group_statistics = {}
-            if hasattr(normalizer, 'group_centers_') and hasattr(normalizer, 'group_scales_'):
-                group_centers = normalizer.group_centers_
-                group_scales = normalizer.group_scales_
-                
+            group_centers = getattr(normalizer, 'group_centers_', None)
+            group_scales = getattr(normalizer, 'group_scales_', None)
+            if group_centers is not None and group_scales is not None:
                 groups = preprocessing_info.get('group_ids', [])
-                for i, group in enumerate(groups):
-                    if i < len(group_centers) and i < len(group_scales):
-                        group_statistics[str(group)] = {
-                            'mean': float(group_centers[i]) if hasattr(group_centers[i], 'item') else float(group_centers[i]),
-                            'std': float(group_scales[i]) if hasattr(group_scales[i], 'item') else float(group_scales[i])
-                        }
+                centers = _to_numpy(group_centers).tolist()
+                scales = _to_numpy(group_scales).tolist()
+                for group, mean_val, std_val in zip(groups, centers, scales):
+                    group_statistics[str(group)] = {'mean': mean_val, 'std': std_val}
             
             if group_statistics:
                 scaler_params['normalizer_params']['group_statistics'] = group_statistics
@@ -335,17 +644,17 @@ class ONNXPredictionService:
             logger.error(f"GroupNormalizer 파라미터 추출 실패: {e}")
             return None
     
-    def _load_normalization_params_from_pkl(self) -> bool:
+    def _load_normalization_params_from_pkl(self, preprocessing_info: dict) -> bool:
         """
         PKL 파일에서 정규화 파라미터 로드
         
+        Args:
+            preprocessing_info: 모델 로더가 로드한 전처리 정보
+        
         Returns:
             성공 여부
         """
         try:
-            # 전처리 정보 가져오기
-            preprocessing_info = self.model_loader.get_preprocessing_info()
-            
             if not preprocessing_info:
                 logger.debug("전처리 정보가 없습니다")
                 return False
@@ -401,7 +710,7 @@ class ONNXPredictionService:
                         idx += 1
             
             # 캐시에 저장
-            self.normalization_params = params
+            self._set_normalization_params(params)
             self.pkl_scaler = scaler
             
             logger.info(f"✅ PKL scaler 로드 성공: {len(params)}개 feature")
@@ -419,36 +728,36 @@ class ONNXPredictionService:
         
         Fallback: PKL 로드 실패 시 사용
         """
-        params = {}
+        encoder_length = self.feature_config.ENCODER_LENGTH
         
-        for feature_name in self.feature_config.FEATURE_ORDER:
-            # 정규화 제외 대상은 건너뛰기
-            if feature_name in self.feature_config.NORMALIZATION_EXCLUDE:
-                continue
-            
-            # feature가 존재하고 encoder 범위 내에 충분한 데이터가 있는 경우
-            if feature_name in features and len(features[feature_name]) >= self.feature_config.ENCODER_LENGTH:
-                # Encoder 구간만 사용 (과거 60일)
-                encoder_values = features[feature_name][:self.feature_config.ENCODER_LENGTH]
-                
-                # numpy 배열로 변환
-                values_array = np.array(encoder_values, dtype=np.float32)
-                
-                # mean과 std 계산
-                mean_val = np.mean(values_array)
-                std_val = np.std(values_array)
-                
-                # std가 0이면 1로 대체 (division by zero 방지)
-                if std_val == 0 or np.isnan(std_val):
-                    std_val = 1.0
-                
-                params[feature_name] = {
-                    'mean': float(mean_val),
-                    'std': float(std_val)
-                }
+        # 정규화 대상 중 encoder 범위(과거 60일)에 충분한 데이터가 있는 feature
+        names = tuple(
+            name for name in self.feature_config.FEATURE_ORDER
+            if name not in self.feature_config.NORMALIZATION_EXCLUDE
+            and name in features and len(features[name]) >= encoder_length
+        )
         
-        # 캐시에 저장
+        if names:
+            # (F, ENCODER_LENGTH) 행렬로 쌓아 한 번에 mean/std 계산
+            matrix = np.stack([
+                np.asarray(features[name][:encoder_length], dtype=np.float32) for name in names
+            ])
+            mean_vec = matrix.mean(axis=1)
+            std_vec = matrix.std(axis=1)
+            # std가 0 또는 NaN이면 1로 대체 (division by zero 방지)
+            std_vec = np.where((std_vec == 0) | np.isnan(std_vec), np.float32(1.0), std_vec)
+        else:
+            mean_vec = np.empty(0, dtype=np.float32)
+            std_vec = np.empty(0, dtype=np.float32)
+        
+        params = {
+            name: {'mean': float(mean), 'std': float(std)}
+            for name, mean, std in zip(names, mean_vec.tolist(), std_vec.tolist())
+        }
+        
+        # 캐시에 저장 (SoA 벡터는 이미 계산했으므로 그대로 사용)
         self.normalization_params = params
+        self._norm_state = (names, mean_vec, std_vec)
         
         logger.info(f"📊 정규화 파라미터 동적 계산 완료: {len(params)}개 feature")
         logger.debug(f"   예시: close = mean:{params.get('close', {}).get('mean', 0):.2f}, "
@@ -471,34 +780,12 @@ class ONNXPredictionService:
             return self._normalize_with_group_normalizer(features)
         
         # StandardScaler 또는 Dynamic (동일한 Z-score 방식)
-        normalized = {}
-        
-        for feature_name, values in features.items():
-            # 정규화 제외 대상은 그대로 사용
-            if feature_name in self.feature_config.NORMALIZATION_EXCLUDE:
-                normalized[feature_name] = values
-                continue
-            
-            # 정규화 파라미터가 있는 경우 적용
-            if feature_name in self.normalization_params:
-                params = self.normalization_params[feature_name]
-                mean_val = params['mean']
-                std_val = params['std']
-                
-                # 정규화 적용: (x - mean) / std
-                normalized_values = [
-                    (val - mean_val) / std_val 
-                    for val in values
-                ]
-                normalized[feature_name] = normalized_values
-                
-                logger.debug(f"   {feature_name} 정규화: mean={mean_val:.2f}, std={std_val:.2f}")
-            else:
-                # 파라미터가 없으면 원본 사용
-                normalized[feature_name] = values
+        # 정규화 제외 대상 / 파라미터가 없는 feature는 원본 사용
+        normalized = dict(features)
+        normalized.update(self._zscore_features(features))
         
-        logger.info(f"✅ Feature 정규화 완료 ({self.normalization_method}): "
-                   f"{len(self.normalization_params)}개 정규화됨")
+        logger.info("✅ Feature 정규화 완료 (%s): %d개 정규화됨",
+                    self.normalization_method, len(self.normalization_params))
         return normalized
     
     def _normalize_with_group_normalizer(self, features: Dict[str, List[float]]) -> Dict[str, List[float]]:
@@ -515,215 +802,204 @@ class ONNXPredictionService:
             logger.error("LightweightScaler가 초기화되지 않았습니다")
             return features
         
-        normalized = {}
         group_id = "corn"  # 기본값, 필요시 파라미터로 전달
         
-        for feature_name, values in features.items():
-            # 정규화 제외 대상
-            if feature_name in self.feature_config.NORMALIZATION_EXCLUDE:
-                normalized[feature_name] = values
-                continue
-            
-            # Target feature (close)는 GroupNormalizer 적용
-            if feature_name == 'close':
-                try:
-                    values_array = np.array(values, dtype=np.float32)
-                    normalized_array = self.lightweight_scaler.transform(
-                        values_array, 
-                        group_id=group_id
-                    )
-                    normalized[feature_name] = normalized_array.tolist()
-                    logger.debug(f"   {feature_name}: GroupNormalizer 적용")
-                except Exception as e:
-                    logger.warning(f"   {feature_name}: GroupNormalizer 적용 실패 ({e}), 원본 사용")
-                    normalized[feature_name] = values
-            else:
-                # 다른 features는 일반 정규화 (있는 경우)
-                if feature_name in self.normalization_params:
-                    params = self.normalization_params[feature_name]
-                    mean_val = params['mean']
-                    std_val = params['std']
-                    
-                    normalized_values = [
-                        (val - mean_val) / std_val 
-                        for val in values
-                    ]
-                    normalized[feature_name] = normalized_values
-                else:
-                    normalized[feature_name] = values
+        # 다른 features는 일반 정규화 (있는 경우), 나머지는 원본 사용
+        normalized = dict(features)
+        normalized.update(self._zscore_features(features, skip='close'))
+        
+        # Target feature (close)는 GroupNormalizer 적용
+        if 'close' in features and 'close' not in self.feature_config.NORMALIZATION_EXCLUDE:
+            try:
+                values_array = np.asarray(features['close'], dtype=np.float32)
+                normalized_array = self.lightweight_scaler.transform(
+                    values_array, 
+                    group_id=group_id
+                )
+                # scaler 내부는 float64로 계산하므로 모델 입력 dtype(float32)으로 맞춤
+                normalized['close'] = np.asarray(normalized_array, dtype=np.float32)
+                logger.debug("   close: GroupNormalizer 적용")
+            except Exception as e:
+                logger.warning("   close: GroupNormalizer 적용 실패 (%s), 원본 사용", e)
         
-        logger.info(f"✅ Feature 정규화 완료 (GroupNormalizer + StandardScaler)")
+        logger.info("✅ Feature 정규화 완료 (GroupNormalizer + StandardScaler)")
         return normalized
     
+    def _zscore_features(
+        self,
+        features: Dict[str, np.ndarray],
+        skip: Optional[str] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        SoA mean/std 벡터로 Z-score 정규화
+        
+        파라미터가 있는 feature들을 (F, T) 행렬로 쌓아
+        (M - mean[:, None]) / std[:, None] 한 번으로 계산합니다.
+        길이가 서로 다르면 feature 단위로 계산합니다.
+        """
+        names, mean_vec, std_vec = self._norm_state
+        idx = [i for i, name in enumerate(names) if name in features and name != skip]
+        if not idx:
+            return {}
+        
+        present = [names[i] for i in idx]
+        columns = [np.asarray(features[name], dtype=np.float32) for name in present]
+        mean_sel = mean_vec[idx]
+        std_sel = std_vec[idx]
+        
+        if len({len(col) for col in columns}) == 1:
+            matrix = np.stack(columns)
+            matrix -= mean_sel[:, None]
+            matrix /= std_sel[:, None]
+            return dict(zip(present, matrix))
+        
+        return {
+            name: (col - mean_sel[k]) / std_sel[k]
+            for k, (name, col) in enumerate(zip(present, columns))
+        }
+    
     def _apply_feature_overrides(
         self, 
         features: Dict[str, List[float]], 
         overrides: Dict[str, float]
     ) -> Dict[str, List[float]]:
         """Feature override를 적용 (원본은 수정하지 않음)"""
-        print(f"\n{'='*80}")
-        print(f"🔧 Feature override 적용 시작: {overrides}")
-        logger.info(f"🔧 Feature override 적용 시작: {overrides}")
+        logger.info("🔧 Feature override 적용 시작: %s", overrides)
         
-        # 이미 deep copy된 features를 받지만, 명확성을 위해 다시 한 번 확인
+        # 호출 측에서 새로 만든 feature 배열을 받으므로, override 값은 새 배열로 교체
         for key, value in overrides.items():
             if key in features:
-                original_value = features[key][-1] if features[key] else 0.0
-                original_length = len(features[key])
+                original = features[key]
+                original_value = float(original[-1]) if len(original) > 0 else 0.0
                 
-                # 🔥 중요: 새로운 리스트 생성 (모든 시점에 동일한 값 적용)
-                features[key] = [value] * original_length
+                # 🔥 중요: 새로운 배열 생성 (모든 시점에 동일한 값 적용)
+                features[key] = np.full(np.shape(original), np.float32(value), dtype=np.float32)
                 
-                msg = f"  ✓ {key}: {original_value:.2f} → {value:.2f} (변화: {value - original_value:.2f}, {original_length}일)"
-                print(msg)
-                logger.info(msg)
+                logger.info("  ✓ %s: %.2f → %.2f (변화: %.2f, %d일)",
+                            key, original_value, value, value - original_value, len(original))
             else:
-                msg = f"  ⚠️  {key}: features에 없음 (무시됨)"
-                print(msg)
-                logger.warning(msg)
-        
-        msg = f"🔧 Feature override 적용 완료: {len(overrides)}개 feature 변경됨"
-        print(msg)
-        print(f"{'='*80}\n")
-        logger.info(msg)
+                logger.warning("  ⚠️  %s: features에 없음 (무시됨)", key)
+        
+        logger.info("🔧 Feature override 적용 완료: %d개 feature 변경됨", len(overrides))
         return features
     
-    def _build_encoder_features(self, features: Dict[str, List[float]]) -> np.ndarray:
-        """Encoder용 feature 배열 생성 (과거 60일)"""
-        encoder_data = []
-        
-        for i in range(self.feature_config.ENCODER_LENGTH):
-            feature_vector = self._get_feature_vector_at_index(features, i, is_encoder=True)
-            encoder_data.append(feature_vector)
+    def _build_feature_tensors(
+        self,
+        features: Dict[str, List[float]],
+        day_of_year: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Encoder/Decoder feature 텐서를 한 번에 생성
         
-        return np.array([encoder_data], dtype=np.float32)  # [1, 60, 52]
-    
-    def _build_decoder_features(self, features: Dict[str, List[float]]) -> np.ndarray:
-        """Decoder용 feature 배열 생성 (미래 7일)"""
-        decoder_data = []
+        전체 구간(60 + 7일)을 [1, 67, 52] 버퍼 하나에 feature(열) 단위로 채운 뒤
+        시간 축으로 나눠 encoder [1, 60, 52] / decoder [1, 7, 52]를 반환합니다.
+        두 결과 모두 버퍼의 연속된 구간이므로 추가 복사 없이 모델 입력으로 사용됩니다.
+        """
+        cfg = self.feature_config
+        encoder_length = cfg.ENCODER_LENGTH
+        total_length = cfg.ENCODER_LENGTH + cfg.DECODER_LENGTH
+        tensor = np.zeros((1, total_length, len(cfg.FEATURE_ORDER)), dtype=np.float32)
+        time_idx = np.arange(total_length, dtype=np.float32)
         
-        for i in range(self.feature_config.DECODER_LENGTH):
-            feature_vector = self._get_feature_vector_at_index(
-                features, 
-                self.feature_config.ENCODER_LENGTH + i, 
-                is_encoder=False
-            )
-            decoder_data.append(feature_vector)
+        for col, (handler, fname) in enumerate(self._feature_handlers):
+            # 일반 Features (Encoder 구간만 채움 - Decoder와 데이터가 부족한 시점은 0)
+            if handler == _FEAT_DATA:
+                if fname in features:
+                    tensor[0, :encoder_length, col] = self._slice_feature(
+                        features[fname], 0, encoder_length, 0.0
+                    )
+            
+            # Static Features
+            elif handler == _FEAT_ENCODER_LENGTH:
+                tensor[0, :, col] = float(encoder_length)
+            elif handler == _FEAT_CLOSE_SCALE:
+                tensor[0, :, col] = cfg.DEFAULT_SCALE_VALUE
+            elif handler == _FEAT_CLOSE_CENTER:
+                tensor[0, :, col] = self._slice_feature(
+                    features.get('close'), 0, total_length, cfg.DEFAULT_CLOSE_VALUE
+                )
+            
+            # Time Features
+            elif handler == _FEAT_TIME_IDX:
+                tensor[0, :, col] = time_idx
+            elif handler == _FEAT_DAY_OF_YEAR:
+                tensor[0, :, col] = day_of_year[:total_length]
+            elif handler == _FEAT_RELATIVE_TIME:
+                tensor[0, :, col] = time_idx / float(total_length)
         
-        return np.array([decoder_data], dtype=np.float32)  # [1, 7, 52]
+        return tensor[:, :encoder_length], tensor[:, encoder_length:]  # [1, 60, 52], [1, 7, 52]
     
-    def _get_feature_vector_at_index(
-        self, 
-        features: Dict[str, List[float]], 
-        time_idx: int, 
-        is_encoder: bool
-    ) -> List[float]:
-        """특정 시점의 feature 벡터 생성"""
-        feature_vector = []
-        
-        for fname in self.feature_config.FEATURE_ORDER:
-            value = self._get_feature_value(features, fname, time_idx, is_encoder)
-            feature_vector.append(value)
-        
-        return feature_vector
+    @staticmethod
+    def _slice_feature(values, start: int, length: int, fill: float) -> np.ndarray:
+        """values[start:start+length]를 길이 length 배열로 반환 (부족한 부분은 fill)"""
+        out = np.full(length, fill, dtype=np.float32)
+        if values is not None:
+            chunk = np.asarray(values[start:start + length], dtype=np.float32)
+            out[:len(chunk)] = chunk
+        return out
     
-    def _get_feature_value(
-        self, 
-        features: Dict[str, List[float]], 
-        feature_name: str, 
-        time_idx: int, 
-        is_encoder: bool
-    ) -> float:
-        """개별 feature 값 계산"""
-        # Static Features
-        if feature_name == 'encoder_length':
-            return float(self.feature_config.ENCODER_LENGTH)
-        elif feature_name == 'close_scale':
-            return self.feature_config.DEFAULT_SCALE_VALUE
-        elif feature_name == 'close_center':
-            return self._get_close_value(features, time_idx)
-        
-        # Time Features
-        elif feature_name == 'time_idx':
-            return float(time_idx)
-        elif feature_name == 'day_of_year':
-            return self._get_day_of_year(time_idx, is_encoder)
-        elif feature_name == 'relative_time_idx':
-            total_length = self.feature_config.ENCODER_LENGTH + self.feature_config.DECODER_LENGTH
-            return float(time_idx) / float(total_length)
-        
-        # Unknown Features (Decoder에서는 0)
-        elif not is_encoder and feature_name not in self.feature_config.KNOWN_FEATURES:
-            return 0.0
-        
-        # 일반 Features
-        elif feature_name in features:
-            if time_idx < len(features[feature_name]):
-                return features[feature_name][time_idx]
-            return 0.0
-        
-        # 기본값
-        return 0.0
-    
-    def _get_close_value(self, features: Dict[str, List[float]], time_idx: int) -> float:
-        """Close 가격 값 가져오기"""
-        if 'close' in features and time_idx < len(features['close']):
-            return features['close'][time_idx]
-        return self.feature_config.DEFAULT_CLOSE_VALUE
-    
-    def _get_day_of_year(self, time_idx: int, is_encoder: bool) -> float:
-        """연중 몇 번째 날인지 계산"""
-        if is_encoder:
-            # 과거 날짜
-            days_ago = self.feature_config.ENCODER_LENGTH - time_idx
-            target_date = datetime.now() - timedelta(days=days_ago)
-        else:
-            # 미래 날짜
-            days_ahead = time_idx - self.feature_config.ENCODER_LENGTH
-            target_date = datetime.now() + timedelta(days=days_ahead)
+    def _get_day_of_year_vector(self) -> np.ndarray:
+        """
+        전체 구간(encoder 60일 + decoder 7일)의 연중 일자 벡터 계산
         
-        return float(target_date.timetuple().tm_yday)
+        time_idx t의 날짜는 오늘 + (t - ENCODER_LENGTH)일 (과거: encoder, 미래: decoder)
+        """
+        today = np.datetime64(datetime.now().date(), 'D')
+        offsets = np.arange(-self.feature_config.ENCODER_LENGTH, self.feature_config.DECODER_LENGTH)
+        dates = today + offsets
+        return ((dates - dates.astype('datetime64[Y]')).astype(np.int64) + 1).astype(np.float32)
     
-    def _get_target_scale(self, features: Dict[str, List[float]]) -> np.ndarray:
+    def _get_target_scale(self, features: Dict[str, List[float]], commodity: str = "corn") -> np.ndarray:
         """
         Target scale 파라미터 생성
         
         정규화 파라미터를 사용하여 동적으로 계산
         - center: close의 평균값
         - scale: close의 표준편차
+        
+        StandardScaler(PKL) 값은 고정이므로 commodity별로 캐시합니다.
+        (PKL이 다시 로드되면 normalization_params 객체가 바뀌어 새로 계산)
         """
         # 1순위: GroupNormalizer (LightweightScaler) 사용
         if self.lightweight_scaler and 'close' in features:
-            close_values = np.array(features['close'])
+            close_values = np.asarray(features['close'], dtype=np.float32)
             center = float(np.mean(close_values))
             scale = float(np.std(close_values))
             
-            logger.debug(f"📊 Target scale: center={center:.2f}, scale={scale:.2f} (GroupNormalizer)")
+            logger.debug("📊 Target scale: center=%.2f, scale=%.2f (GroupNormalizer)", center, scale)
             return np.array([[center, scale]], dtype=np.float32)
         
         # 2순위: StandardScaler 파라미터 사용
         if 'close' in self.normalization_params:
+            cacheable = self.normalization_method == 'standard_scaler'
+            cached = self._target_scale_cache.get(commodity)
+            if cacheable and cached is not None and cached[0] is self.normalization_params:
+                return cached[1]
+            
             params = self.normalization_params['close']
             center = params['mean']
             scale = params['std']
             
-            logger.debug(f"📊 Target scale: center={center:.2f}, scale={scale:.2f} (StandardScaler)")
-            return np.array([[center, scale]], dtype=np.float32)
+            logger.debug("📊 Target scale: center=%.2f, scale=%.2f (StandardScaler)", center, scale)
+            target_scale = np.array([[center, scale]], dtype=np.float32)
+            if cacheable:
+                self._target_scale_cache[commodity] = (self.normalization_params, target_scale)
+            return target_scale
         
         # 3순위: 동적 계산 (현재 데이터 기반)
         if 'close' in features:
-            close_values = np.array(features['close'])
+            close_values = np.asarray(features['close'], dtype=np.float32)
             center = float(np.mean(close_values))
             scale = float(np.std(close_values))
             
-            logger.debug(f"📊 Target scale: center={center:.2f}, scale={scale:.2f} (동적 계산)")
+            logger.debug("📊 Target scale: center=%.2f, scale=%.2f (동적 계산)", center, scale)
             return np.array([[center, scale]], dtype=np.float32)
         
         # 4순위 fallback: 기본값 사용
         center = self.feature_config.DEFAULT_TARGET_CENTER
         scale = self.feature_config.DEFAULT_TARGET_SCALE
         
-        logger.warning(f"⚠️ Target scale: 기본값 사용 (center={center}, scale={scale})")
+        logger.warning("⚠️ Target scale: 기본값 사용 (center=%s, scale=%s)", center, scale)
         return np.array([[center, scale]], dtype=np.float32)
     
     def _parse_predictions(self, outputs: List[np.ndarray]) -> Dict[str, List[float]]:
@@ -734,50 +1010,62 @@ class ONNXPredictionService:
         """
         predictions = outputs[0]  # shape: [1, 7, 3]
         
-        # 기본 예측값
-        pred_median = predictions[0, :, 0]  # 중앙값
-        pred_lower = predictions[0, :, 1]   # 하한
-        pred_upper = predictions[0, :, 2]   # 상한
+        # (3, 7) float64 버퍼 하나에 median/lower/upper를 행으로 복사 - 이후 연산은 모두 in-place
+        # (역변환/expm1은 float64로 계산: float32 로그 가격의 expm1은 달러 값 정밀도가 떨어짐)
+        buffer = np.empty((3, predictions.shape[1]), dtype=np.float64)
+        np.copyto(buffer, predictions[0, :, :3].T)
+        pred_median, pred_lower, pred_upper = buffer  # 중앙값, 하한, 상한 (버퍼의 행 view)
         
-        logger.info(f"🔍 예측값 (역변환 전): median[0]={pred_median[0]:.4f}, method={self.normalization_method}")
+        logger.info("🔍 예측값 (역변환 전): median[0]=%.4f, method=%s", pred_median[0], self.normalization_method)
         
         # GroupNormalizer 역변환
         if self.normalization_method == 'group_normalizer' and self.lightweight_scaler is not None:
             try:
                 group_id = "corn"  # 기본값
                 
-                # 역변환 적용
-                pred_median = self.lightweight_scaler.inverse_transform(pred_median, group_id=group_id)
-                pred_lower = self.lightweight_scaler.inverse_transform(pred_lower, group_id=group_id)
-                pred_upper = self.lightweight_scaler.inverse_transform(pred_upper, group_id=group_id)
+                # 역변환 적용 - (3, 7) 행렬 전체를 한 번에 in-place 변환
+                self.lightweight_scaler.inverse_transform(buffer, group_id=group_id, out=buffer)
                 
-                logger.info(f"✅ GroupNormalizer 역변환 완료: median[0]={pred_median[0]:.4f}")
+                logger.info("✅ GroupNormalizer 역변환 완료: median[0]=%.4f", pred_median[0])
             except Exception as e:
-                logger.warning(f"GroupNormalizer 역변환 실패: {e}, 원본 사용")
+                # 부분적으로 변환된 값이 남지 않도록 원본으로 복구
+                np.copyto(buffer, predictions[0, :, :3].T)
+                logger.warning("GroupNormalizer 역변환 실패: %s, 원본 사용", e)
         else:
-            logger.warning(f"⚠️ 역변환 미적용: method={self.normalization_method}, scaler={'있음' if self.lightweight_scaler else '없음'}")
+            logger.warning("⚠️ 역변환 미적용: method=%s, scaler=%s",
+                           self.normalization_method, '있음' if self.lightweight_scaler else '없음')
         
         # 🔥 중요: log1p 역변환 (데이터가 log1p로 변환되었으므로)
         # 배치 서버의 predict.py에서도 log1p 변환을 하므로, 역변환 필요
-        pred_median = np.expm1(pred_median)
-        pred_lower = np.expm1(pred_lower)
-        pred_upper = np.expm1(pred_upper)
+        np.expm1(buffer, out=buffer)
         
-        logger.info(f"✅ Log1p 역변환 완료: median[0]=${pred_median[0]:.2f}")
+        logger.info("✅ Log1p 역변환 완료: median[0]=$%.2f", pred_median[0])
         
+        # (3, 7) 버퍼를 한 번에 리스트로 변환 → [중앙값, 하한, 상한]
+        median_list, lower_list, upper_list = buffer.tolist()
         return {
-            'predictions': pred_median.tolist() if hasattr(pred_median, 'tolist') else list(pred_median),
-            'lower_bounds': pred_lower.tolist() if hasattr(pred_lower, 'tolist') else list(pred_lower),
-            'upper_bounds': pred_upper.tolist() if hasattr(pred_upper, 'tolist') else list(pred_upper)
+            'predictions': median_list,
+            'lower_bounds': lower_list,
+            'upper_bounds': upper_list
         }
     
     def _log_inference_info(self, model_inputs: Dict[str, np.ndarray]):
         """추론 정보 로깅"""
         logger.info("TFT 추론 실행")
         for name, array in model_inputs.items():
-            logger.info(f"  {name}: {array.shape}")
+            logger.info("  %s: %s", name, array.shape)
+
+
+# 전역 인스턴스 (정규화/예측 캐시를 요청 간에 재사용)
+_service_instance: Optional[ONNXPredictionService] = None
+_service_lock = threading.Lock()
 
 
 def get_prediction_service() -> ONNXPredictionService:
-    """예측 서비스 인스턴스 반환"""
-    return ONNXPredictionService()
+    """예측 서비스 싱글톤 인스턴스 반환 (동시 요청에서도 1개만 생성)"""
+    global _service_instance
+    if _service_instance is None:
+        with _service_lock:
+            if _service_instance is None:
+                _service_instance = ONNXPredictionService()
+    return _service_instance
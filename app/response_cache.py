@@ -0,0 +1,82 @@
+"""
+API 응답 캐시 (TTL + stale fallback)
+
+같은 (endpoint, commodity, date) 요청이 반복되면 DB 조회 / 외부 API 호출 없이 직전 응답을 재사용합니다.
+- fresh: TTL 이내 응답은 그대로 반환
+- stale: TTL이 지나도 마지막 응답을 보관했다가, DB/외부 API 오류 시 fallback으로 반환
+쓰기 경로(crud)에서 해당 품목/날짜 키를 무효화합니다.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Optional, Tuple
+
+# TTL (초) - 예측 응답 TTL은 settings.predictions_cache_ttl_seconds
+MARKET_METRICS_TTL_SECONDS = 30
+
+# 엔드포인트 키
+MARKET_METRICS = "market-metrics"
+PREDICTIONS = "predictions"
+
+# stale 응답까지 포함한 최대 보관 개수 (초과 시 가장 오래 안 쓴 항목부터 제거)
+_MAXSIZE = 512
+
+_lock = threading.Lock()
+_entries: "OrderedDict[tuple, Tuple[float, Any]]" = OrderedDict()  # {key: (stale_at, response)}
+
+
+def make_key(endpoint: str, commodity: str, target_date: date, *params: Any) -> tuple:
+    """캐시 키 (endpoint, commodity, date, *추가 조회 조건)"""
+    return (endpoint, commodity.lower(), target_date, *params)
+
+
+def get_fresh(key: tuple) -> Optional[Any]:
+    """TTL 이내의 캐시된 응답 반환 (없거나 만료되면 None)"""
+    with _lock:
+        entry = _entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        _entries.move_to_end(key)
+        return entry[1]
+
+
+def get_stale(key: tuple) -> Optional[Any]:
+    """만료 여부와 관계없이 마지막 응답 반환 (오류 시 fallback용)"""
+    with _lock:
+        entry = _entries.get(key)
+        return entry[1] if entry is not None else None
+
+
+def put(key: tuple, response: Any, ttl_seconds: float) -> None:
+    with _lock:
+        _entries[key] = (time.monotonic() + ttl_seconds, response)
+        _entries.move_to_end(key)
+        while len(_entries) > _MAXSIZE:
+            _entries.popitem(last=False)
+
+
+def invalidate(endpoint: str, commodity: str, target_date: Optional[date] = None) -> None:
+    """해당 엔드포인트/품목(/날짜)의 캐시 제거 (날짜를 모르면 품목 전체)"""
+    commodity = commodity.lower()
+    with _lock:
+        for key in [
+            k for k in _entries
+            if k[0] == endpoint and k[1] == commodity and (target_date is None or k[2] == target_date)
+        ]:
+            del _entries[key]
+
+
+def invalidate_market_metrics(commodity: str, target_date: Optional[date] = None) -> None:
+    invalidate(MARKET_METRICS, commodity, target_date)
+
+
+def invalidate_predictions(commodity: Optional[str] = None) -> None:
+    """예측 응답 캐시 제거 (commodity 미지정 시 전체 예측 응답)"""
+    if commodity is not None:
+        invalidate(PREDICTIONS, commodity)
+        return
+    with _lock:
+        for key in [k for k in _entries if k[0] == PREDICTIONS]:
+            del _entries[key]
@@ -1,16 +1,84 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.routing import APIRoute
 from sqlalchemy.orm import Session
 from datetime import date
+from typing import Callable
 import logging
+import zlib
 
 from .. import crud, dataschemas
 from ..database import get_db
 
 logger = logging.getLogger(__name__)
 
+
+# gzip 요청 본문의 압축 해제 후 최대 크기 (gzip bomb 방지)
+MAX_DECOMPRESSED_BODY_BYTES = 64 * 1024 * 1024
+
+
+def _gunzip_body(body: bytes, max_size: int = MAX_DECOMPRESSED_BODY_BYTES) -> bytes:
+    """
+    gzip 본문을 최대 max_size 바이트까지만 풀어서 반환
+
+    - 압축 해제 결과가 max_size를 넘으면 413
+    - 잘못되었거나 잘린 gzip 데이터는 400
+    (여러 gzip 멤버가 이어진 본문도 gzip.decompress와 동일하게 처리)
+    """
+    chunks = []
+    remaining = max_size
+    data = body
+    try:
+        while data:
+            decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            chunk = decompressor.decompress(data, remaining + 1)
+            if not decompressor.unconsumed_tail:
+                chunk += decompressor.flush()
+            if len(chunk) > remaining or decompressor.unconsumed_tail:
+                raise HTTPException(status_code=413, detail=f"압축 해제 후 요청 본문이 너무 큽니다 (최대 {max_size} bytes)")
+            if not decompressor.eof:
+                raise HTTPException(status_code=400, detail="gzip 요청 본문이 잘렸습니다")
+            chunks.append(chunk)
+            remaining -= len(chunk)
+            data = decompressor.unused_data
+    except zlib.error as e:
+        raise HTTPException(status_code=400, detail=f"gzip 요청 본문을 해제할 수 없습니다: {e}")
+    return b"".join(chunks)
+
+
+class GzipRequest(Request):
+    """Content-Encoding: gzip 요청 본문을 풀어서 전달"""
+
+    async def body(self) -> bytes:
+        if not hasattr(self, "_body"):
+            body = await super().body()
+            if "gzip" in self.headers.getlist("Content-Encoding"):
+                body = _gunzip_body(body)
+            self._body = body
+        return self._body
+
+
+class GzipRoute(APIRoute):
+    """
+    gzip 압축 요청을 받을 수 있는 라우트
+
+    배치 서버가 임베딩(1536차원)/feature 등 큰 페이로드를 압축해서 보낼 수 있도록 합니다.
+    압축하지 않은 요청은 기존과 동일하게 처리됩니다.
+    """
+
+    def get_route_handler(self) -> Callable:
+        original_route_handler = super().get_route_handler()
+
+        async def custom_route_handler(request: Request) -> Response:
+            request = GzipRequest(request.scope, request.receive)
+            return await original_route_handler(request)
+
+        return custom_route_handler
+
+
 router = APIRouter(
     prefix="/api",
-    tags=["Batch Write"]
+    tags=["Batch Write"],
+    route_class=GzipRoute
 )
 
 
@@ -66,6 +134,17 @@ def create_explanation(
     return record
 
 
+@router.post("/explanations/bulk", response_model=dataschemas.BatchResult)
+def create_explanations_bulk(
+    data: dataschemas.ExpPredBulkCreate,
+    db: Session = Depends(get_db)
+):
+    """예측 설명 벌크 저장"""
+    count = crud.create_explanations_bulk(db, data.explanations)
+    logger.info(f"설명 벌크 저장 완료: {count}건")
+    return dataschemas.BatchResult(success=True, message=f"{count}건 저장 완료", count=count)
+
+
 @router.delete("/explanations/{pred_id}", response_model=dataschemas.BatchResult)
 def delete_explanation(
     pred_id: int,
@@ -1,11 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from typing import Optional, List
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+from typing import Optional, List, Tuple
 from datetime import date, datetime
 import logging
 
-from .. import crud, dataschemas
-from ..database import get_db
+import numpy as np
+
+from .. import crud, dataschemas, response_cache
+from ..database import get_async_read_db, AsyncSessionLocal
 from ..config import settings
 
 logger = logging.getLogger(__name__)
@@ -15,17 +19,62 @@ router = APIRouter(
     tags=["Market Metrics"]
 )
 
+# trend 부호 인덱스(0: 하락, 1: 중립, 2: 상승) → impact 라벨
+_IMPACT_LABELS = np.array(["하락", "중립", "상승"], dtype=object)
+
+
+def _compute_trend_impact(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    전일 대비 변화율(%)과 impact를 배열 단위로 계산
+    
+    - trend[i] = (values[i] - values[i-1]) / values[i-1] * 100 (첫 시점 / 전일 값이 0이면 0)
+    - impact: trend > 2 → 상승, trend < -2 → 하락, 그 외 중립
+    """
+    trend = np.zeros_like(values)
+    if values.size > 1:
+        prev = values[:-1]
+        np.divide(values[1:] - prev, prev, out=trend[1:], where=prev != 0)
+        trend[1:] *= 100
+    impact = _IMPACT_LABELS[(trend > 2).astype(np.int8) - (trend < -2).astype(np.int8) + 1]
+    return trend, impact
+
 # GET /api/market-metrics?commodity=corn&date=2026-02-03
 @router.get("/market-metrics", response_model=dataschemas.MarketMetricsResponse)
-def get_market_metrics(
+async def get_market_metrics(
     commodity: str = Query(..., description="품목명"),
     date: Optional[date] = Query(None, description="조회 날짜 (기본값: 오늘)"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     target_date = date if date else datetime.now().date()
     
+    # 같은 품목/날짜의 최근 응답이 있으면 재사용
+    cache_key = response_cache.make_key(response_cache.MARKET_METRICS, commodity, target_date)
+    cached = response_cache.get_fresh(cache_key)
+    if cached is not None:
+        return cached
+    
+    try:
+        response = await _build_market_metrics_response(db, commodity, target_date)
+    except (SQLAlchemyError, HTTPException) as e:
+        # DB/외부 API 오류 시 마지막으로 캐시된 응답으로 대체
+        stale = response_cache.get_stale(cache_key)
+        if stale is None:
+            raise
+        logger.warning(f"시장 지표 조회 실패, 캐시된 응답 반환: {commodity} {target_date} ({e})")
+        return stale
+    
+    response_cache.put(cache_key, response, response_cache.MARKET_METRICS_TTL_SECONDS)
+    return response
+
+
+async def _build_market_metrics_response(
+    db: AsyncSession,
+    commodity: str,
+    target_date: date
+) -> dataschemas.MarketMetricsResponse:
+    """DB 조회 (부족하면 실시간 수집) 후 시장 지표 응답 생성"""
     # 1. DB에서 데이터 조회 시도
-    metrics = crud.get_market_metrics(db, commodity, target_date)
+    metrics = await crud.get_market_metrics_async(db, commodity, target_date)
     
     # 2. 데이터가 없거나 부족하면 실시간으로 API에서 가져오기
     # 최소 10개 이상의 지표가 있어야 유효한 데이터로 간주 (가격 5개 + 경제지표 2개 등)
@@ -42,14 +91,14 @@ def get_market_metrics(
             )
         
         try:
-            from ..data_fetcher import fetch_realtime_features
+            from ..data_fetcher import fetch_realtime_features_async
             from datetime import timedelta
             
             # 어제 날짜 계산 (trend 계산용)
             yesterday = target_date - timedelta(days=1)
             
-            # 2일치 데이터 수집 (오늘 + 어제)
-            result = fetch_realtime_features(
+            # 2일치 데이터 수집 (오늘 + 어제) - 외부 API 호출은 워커 스레드에서 동시 실행
+            result = await fetch_realtime_features_async(
                 commodity=commodity,
                 end_date=target_date,
                 days=2,
@@ -72,33 +121,20 @@ def get_market_metrics(
             dates = result['dates']
             
             for feature_name, values in features.items():
-                if values and len(values) >= 1:
-                    # 오늘 값 (마지막 값)
-                    today_value = float(values[-1])
-                    
-                    # Trend 계산 (2일치 데이터가 있으면)
-                    trend = 0.0
-                    if len(values) >= 2:
-                        yesterday_value = float(values[-2])
-                        if yesterday_value != 0:
-                            trend = ((today_value - yesterday_value) / yesterday_value) * 100
-                    
-                    # Impact 결정
-                    if trend > 2:
-                        impact = "상승"
-                    elif trend < -2:
-                        impact = "하락"
-                    else:
-                        impact = "중립"
+                if values is not None and len(values) >= 1:
+                    # 오늘 값 (마지막 값) + 어제 대비 trend/impact (2일치 데이터가 있으면)
+                    last_two = np.asarray(values[-2:], dtype=np.float64)
+                    trends, impacts = _compute_trend_impact(last_two)
+                    today_value = float(last_two[-1])
                     
                     metrics_list.append(
-                        dataschemas.MarketMetricItem(
+                        dataschemas.MarketMetricItem.model_construct(
                             metric_id=feature_name,
                             label=_get_feature_label(feature_name),
                             value=str(today_value),
                             numeric_value=today_value,
-                            trend=round(trend, 2),
-                            impact=impact
+                            trend=round(float(trends[-1]), 2),
+                            impact=impacts[-1]
                         )
                     )
             
@@ -115,19 +151,21 @@ def get_market_metrics(
                     real_metrics = [m for m in metrics_list if m.metric_id in real_features]
                     
                     if real_metrics:
-                        crud.create_market_metrics_bulk(db, commodity, target_date, real_metrics)
-                        logger.info(f"✅ DB 저장 완료: {target_date} - {len(real_metrics)}개 지표")
-                        
-                        # Historical prices도 저장
-                        if 'close' in features and len(features['close']) > 0:
-                            close_price = float(features['close'][-1])
-                            _save_historical_price(db, commodity, target_date, close_price)
-                            logger.info(f"✅ Historical price 저장 완료: {target_date} - ${close_price:.2f}")
+                        # 조회 세션(복제본)이 아닌 주 DB 세션으로 저장
+                        async with AsyncSessionLocal() as write_db:
+                            await write_db.run_sync(crud.create_market_metrics_bulk, commodity, target_date, real_metrics)
+                            logger.info(f"✅ DB 저장 완료: {target_date} - {len(real_metrics)}개 지표")
+                            
+                            # Historical prices도 저장
+                            if 'close' in features and len(features['close']) > 0:
+                                close_price = float(features['close'][-1])
+                                await write_db.run_sync(_save_historical_price, commodity, target_date, close_price)
+                                logger.info(f"✅ Historical price 저장 완료: {target_date} - ${close_price:.2f}")
                 except Exception as e:
                     logger.error(f"DB 저장 실패: {e}")
                     # 저장 실패해도 데이터는 반환
             
-            return dataschemas.MarketMetricsResponse(
+            return dataschemas.MarketMetricsResponse.model_construct(
                 commodity=commodity,
                 date=target_date.isoformat(),
                 metrics=metrics_list
@@ -143,8 +181,9 @@ def get_market_metrics(
             )
     
     # 3. DB 데이터 + 실시간 더미 데이터 반환
+    # (DB 행은 이미 스키마에 맞게 저장된 값이므로 검증 없이 model_construct로 변환)
     metrics_list = [
-        dataschemas.MarketMetricItem(
+        dataschemas.MarketMetricItem.model_construct(
             metric_id=m.metric_id,
             label=m.label,
             value=m.value,
@@ -166,7 +205,7 @@ def get_market_metrics(
             if dummy.metric_id not in existing_ids:
                 metrics_list.append(dummy)
     
-    return dataschemas.MarketMetricsResponse(
+    return dataschemas.MarketMetricsResponse.model_construct(
         commodity=commodity,
         date=target_date.isoformat(),
         metrics=metrics_list
@@ -184,19 +223,14 @@ def _save_historical_price(db: Session, commodity: str, target_date: date, price
         price: 가격
     """
     try:
-        # 이미 존재하는지 확인
-        existing = crud.get_historical_prices(db, commodity, target_date, target_date)
-        if existing:
-            logger.debug(f"Historical price 이미 존재: {target_date}")
-            return
-        
-        # 저장
-        price_item = dataschemas.HistoricalPriceItem(
+        # 저장 (이미 존재하면 건너뜀 - 별도 존재 여부 조회 없이 INSERT ... WHERE NOT EXISTS)
+        price_item = dataschemas.HistoricalPriceItem.model_construct(
             date=target_date.isoformat(),
             actual_price=price,
             is_trading_day=True
         )
-        crud.create_historical_prices_bulk(db, commodity, [price_item])
+        if not crud.insert_missing_historical_prices(db, commodity, [price_item]):
+            logger.debug(f"Historical price 이미 존재: {target_date}")
     except Exception as e:
         logger.error(f"Historical price 저장 실패: {e}")
 
@@ -238,60 +272,40 @@ def _save_to_database_old(db: Session, commodity: str, end_date: date):
             '10Y_Yield', 'USD_Index'  # 경제 지표
         }
         
-        # 날짜별로 데이터 저장
+        # 전체 날짜의 행을 모은 뒤 COPY로 한 번에 적재
+        # (날짜별 존재 여부 조회 없이 ON CONFLICT DO NOTHING으로 이미 있는 지표는 건너뜀)
         from datetime import datetime
-        saved_count = 0
+        parsed_dates = [datetime.strptime(date_str, '%Y-%m-%d').date() for date_str in dates]
+        rows = []
         
-        for i, date_str in enumerate(dates):
-            current_date = datetime.strptime(date_str, '%Y-%m-%d').date()
-            
-            # 이미 DB에 있는 날짜는 스킵
-            existing = crud.get_market_metrics(db, commodity, current_date)
-            if existing:
+        # 실제 데이터 feature별로 전체 기간의 trend/impact를 한 번에 계산
+        for feature_name, values in features.items():
+            if feature_name not in real_features:
                 continue
             
-            # 실제 데이터만 metrics 생성
-            metrics_items = []
-            for feature_name, values in features.items():
-                # 실제 데이터만 저장
-                if feature_name not in real_features:
-                    continue
-                
-                if i < len(values):
-                    numeric_value = float(values[i])
-                    
-                    # Trend 계산 (이전 날짜와 비교)
-                    trend = 0.0
-                    if i > 0:
-                        prev_value = float(values[i-1])
-                        if prev_value != 0:
-                            trend = ((numeric_value - prev_value) / prev_value) * 100
-                    
-                    # Impact 결정
-                    if trend > 2:
-                        impact = "상승"
-                    elif trend < -2:
-                        impact = "하락"
-                    else:
-                        impact = "중립"
-                    
-                    metrics_items.append(
-                        dataschemas.MarketMetricItem(
-                            metric_id=feature_name,
-                            label=_get_feature_label(feature_name),
-                            value=str(numeric_value),
-                            numeric_value=numeric_value,
-                            trend=round(trend, 2),
-                            impact=impact
-                        )
-                    )
+            numeric_values = np.asarray(values[:len(parsed_dates)], dtype=np.float64)
+            trends, impacts = _compute_trend_impact(numeric_values)
+            label = _get_feature_label(feature_name)
             
-            # DB에 저장
-            if metrics_items:
-                crud.create_market_metrics_bulk(db, commodity, current_date, metrics_items)
-                saved_count += 1
+            rows.extend(
+                {
+                    'commodity': commodity,
+                    'date': current_date,
+                    'metric_id': feature_name,
+                    'label': label,
+                    'value': str(numeric_value),
+                    'numeric_value': numeric_value,
+                    'trend': trend,
+                    'impact': impact
+                }
+                for current_date, numeric_value, trend, impact in zip(
+                    parsed_dates, numeric_values.tolist(), np.round(trends, 2).tolist(), impacts.tolist()
+                )
+            )
         
-        logger.info(f"✅ DB 저장 완료: {saved_count}일치 데이터 (실제 데이터만)")
+        # DB에 저장
+        saved_count = crud.copy_market_metric_rows(db, rows)
+        logger.info(f"✅ DB 저장 완료: {saved_count}개 지표 ({len(dates)}일치, 실제 데이터만)")
         
         # Historical prices도 저장
         _save_historical_prices(db, commodity, dates, features)
@@ -314,7 +328,7 @@ def _save_historical_prices(db: Session, commodity: str, dates: list, features:
         for i, date_str in enumerate(dates):
             if i < len(features['close']):
                 prices_items.append(
-                    dataschemas.HistoricalPriceItem(
+                    dataschemas.HistoricalPriceItem.model_construct(
                         date=date_str,
                         actual_price=float(features['close'][i]),
                         is_trading_day=True
@@ -322,122 +336,86 @@ def _save_historical_prices(db: Session, commodity: str, dates: list, features:
                 )
         
         if prices_items:
-            crud.create_historical_prices_bulk(db, commodity, prices_items)
-            logger.info(f"✅ Historical prices 저장 완료: {len(prices_items)}일치")
+            saved_count = crud.copy_missing_historical_prices(db, commodity, prices_items)
+            logger.info(f"✅ Historical prices 저장 완료: {saved_count}일치 (기존 날짜 제외)")
             
     except Exception as e:
         logger.error(f"Historical prices 저장 실패: {e}")
 
 
+# Feature ID → 한글 라벨 (import 시 한 번 생성, 뉴스 PCA는 news_pca_0 ~ news_pca_127까지 미리 생성)
+_FEATURE_LABELS = {
+    'close': '종가',
+    'open': '시가',
+    'high': '고가',
+    'low': '저가',
+    'volume': '거래량',
+    'EMA': '지수이동평균',
+    '10Y_Yield': '미국 10년물 국채 금리',
+    'USD_Index': '달러 인덱스',
+    'pdsi': 'Palmer 가뭄 지수',
+    'spi30d': '표준 강수 지수 (30일)',
+    'spi90d': '표준 강수 지수 (90일)',
+    'lambda_price': 'Hawkes 가격 강도',
+    'lambda_news': 'Hawkes 뉴스 강도',
+    'news_count': '뉴스 개수',
+    **{f'news_pca_{i}': f'뉴스 PCA {i}' for i in range(128)},
+}
+
+
+def _get_feature_label(feature_id: str) -> str:
+    """Feature ID를 한글 라벨로 변환"""
+    label = _FEATURE_LABELS.get(feature_id)
+    if label is not None:
+        return label
+    
+    # 미리 만들지 않은 뉴스 PCA 인덱스는 동적으로 처리
+    if feature_id.startswith('news_pca_'):
+        return f"뉴스 PCA {feature_id[len('news_pca_'):]}"
+    
+    return feature_id
+
+
+# 더미 지표 템플릿 (import 시 한 번 생성): (metric_id, label, value 문자열)
+# 뉴스 PCA (32개) - 표준정규분포
+_DUMMY_NEWS_PCA = tuple((f'news_pca_{i}', _FEATURE_LABELS[f'news_pca_{i}'], '0.0') for i in range(32))
+# 기후 지수 (3개) + Hawkes Intensity (2개) - 균등분포 [low, high)
+_DUMMY_UNIFORM = tuple(
+    (metric_id, _FEATURE_LABELS[metric_id], '0.0')
+    for metric_id in ('pdsi', 'spi30d', 'spi90d', 'lambda_price', 'lambda_news')
+)
+_DUMMY_UNIFORM_LOW = np.array([-3.0, -1.0, -1.0, 0.1, 0.1])
+_DUMMY_UNIFORM_HIGH = np.array([3.0, 1.0, 1.0, 0.5, 0.5])
+# 뉴스 카운트 (1개) - 정수 [5, 15)
+_DUMMY_NEWS_COUNT = ('news_count', _FEATURE_LABELS['news_count'], '0')
+_DUMMY_TEMPLATE = _DUMMY_NEWS_PCA + _DUMMY_UNIFORM + (_DUMMY_NEWS_COUNT,)
+
+_dummy_rng = np.random.default_rng()
+
+
 def _generate_dummy_metrics() -> List[dataschemas.MarketMetricItem]:
     """
     더미 데이터 실시간 생성
     
+    모듈 템플릿에 분포별로 한 번씩 샘플링한 값을 채웁니다 (검증 없이 model_construct).
+    
     Returns:
         더미 metrics 리스트
     """
-    import numpy as np
-    
-    dummy_metrics = []
-    
-    # 뉴스 PCA (32개)
-    for i in range(32):
-        dummy_metrics.append(
-            dataschemas.MarketMetricItem(
-                metric_id=f'news_pca_{i}',
-                label=f'뉴스 PCA {i}',
-                value='0.0',
-                numeric_value=float(np.random.normal(0, 1)),
-                trend=0.0,
-                impact='중립'
-            )
-        )
-    
-    # 기후 지수 (3개)
-    dummy_metrics.extend([
-        dataschemas.MarketMetricItem(
-            metric_id='pdsi',
-            label='Palmer 가뭄 지수',
-            value='0.0',
-            numeric_value=float(np.random.uniform(-3, 3)),
-            trend=0.0,
-            impact='중립'
-        ),
-        dataschemas.MarketMetricItem(
-            metric_id='spi30d',
-            label='표준 강수 지수 (30일)',
-            value='0.0',
-            numeric_value=float(np.random.uniform(-1, 1)),
-            trend=0.0,
-            impact='중립'
-        ),
-        dataschemas.MarketMetricItem(
-            metric_id='spi90d',
-            label='표준 강수 지수 (90일)',
-            value='0.0',
-            numeric_value=float(np.random.uniform(-1, 1)),
-            trend=0.0,
-            impact='중립'
-        )
-    ])
-    
-    # Hawkes Intensity (2개)
-    dummy_metrics.extend([
-        dataschemas.MarketMetricItem(
-            metric_id='lambda_price',
-            label='Hawkes 가격 강도',
-            value='0.0',
-            numeric_value=float(np.random.uniform(0.1, 0.5)),
-            trend=0.0,
-            impact='중립'
-        ),
-        dataschemas.MarketMetricItem(
-            metric_id='lambda_news',
-            label='Hawkes 뉴스 강도',
-            value='0.0',
-            numeric_value=float(np.random.uniform(0.1, 0.5)),
-            trend=0.0,
-            impact='중립'
-        )
-    ])
+    values = (
+        _dummy_rng.standard_normal(len(_DUMMY_NEWS_PCA)).tolist()
+        + _dummy_rng.uniform(_DUMMY_UNIFORM_LOW, _DUMMY_UNIFORM_HIGH).tolist()
+        + [float(_dummy_rng.integers(5, 15))]
+    )
     
-    # 뉴스 카운트 (1개)
-    dummy_metrics.append(
-        dataschemas.MarketMetricItem(
-            metric_id='news_count',
-            label='뉴스 개수',
-            value='0',
-            numeric_value=float(np.random.randint(5, 15)),
+    return [
+        dataschemas.MarketMetricItem.model_construct(
+            metric_id=metric_id,
+            label=label,
+            value=value_str,
+            numeric_value=numeric_value,
             trend=0.0,
             impact='중립'
         )
-    )
-    
-    return dummy_metrics
-
-
-def _get_feature_label(feature_id: str) -> str:
-    """Feature ID를 한글 라벨로 변환"""
-    label_map = {
-        'close': '종가',
-        'open': '시가',
-        'high': '고가',
-        'low': '저가',
-        'volume': '거래량',
-        'EMA': '지수이동평균',
-        '10Y_Yield': '미국 10년물 국채 금리',
-        'USD_Index': '달러 인덱스',
-        'pdsi': 'Palmer 가뭄 지수',
-        'spi30d': '표준 강수 지수 (30일)',
-        'spi90d': '표준 강수 지수 (90일)',
-        'lambda_price': 'Hawkes 가격 강도',
-        'lambda_news': 'Hawkes 뉴스 강도',
-        'news_count': '뉴스 개수',
-    }
-    
-    # 뉴스 PCA는 동적으로 처리
-    if feature_id.startswith('news_pca_'):
-        idx = feature_id.replace('news_pca_', '')
-        return f'뉴스 PCA {idx}'
-    
-    return label_map.get(feature_id, feature_id)
+        for (metric_id, label, value_str), numeric_value in zip(_DUMMY_TEMPLATE, values)
+    ]
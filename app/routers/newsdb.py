@@ -2,6 +2,8 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from typing import List
 import logging
+import threading
+import time
 
 from .. import crud, dataschemas, database
 from ..dummy_data_generator import get_generator
@@ -13,13 +15,44 @@ router = APIRouter(
     tags=["News Data"]
 )
 
+# 더미 뉴스 캐시 (DB에 뉴스가 없을 때 사용)
+# 서버 시작 시 미리 생성하고, 요청에서는 슬라이스만 수행합니다.
+# created_at이 "최근 7일" 기준이므로 일정 시간이 지나면 다시 생성합니다.
+DUMMY_NEWS_COUNT = 20
+DUMMY_NEWS_REFRESH_SECONDS = 600
+
+_dummy_news_lock = threading.Lock()
+_dummy_news_cache: List[dataschemas.NewsResponse] = []
+_dummy_news_generated_at = 0.0
+
+
+def warm_dummy_news_cache() -> List[dataschemas.NewsResponse]:
+    """더미 뉴스 목록을 (다시) 생성하여 캐시에 저장"""
+    global _dummy_news_cache, _dummy_news_generated_at
+    news = get_generator().generate_news_list(n=DUMMY_NEWS_COUNT)
+    with _dummy_news_lock:
+        _dummy_news_cache = news
+        _dummy_news_generated_at = time.monotonic()
+    return news
+
+
+def _get_dummy_news() -> List[dataschemas.NewsResponse]:
+    """캐시된 더미 뉴스 반환 (비어 있거나 오래되었으면 재생성)"""
+    with _dummy_news_lock:
+        news = _dummy_news_cache
+        expired = time.monotonic() - _dummy_news_generated_at > DUMMY_NEWS_REFRESH_SECONDS
+    if not news or expired:
+        news = warm_dummy_news_cache()
+    return news
+
+
 # URL: GET /api/newsdb?skip=0&limit=10
 # embedding 제외 목록 조회, skip ~ limit까지만 조회
 @router.get("", response_model=List[dataschemas.NewsResponse])
 def get_news_list(
     skip: int = 0, 
     limit: int = 10, 
-    db: Session = Depends(database.get_db)
+    db: Session = Depends(database.get_read_db)
 ):
     """
     뉴스 목록 조회
@@ -33,19 +66,14 @@ def get_news_list(
         logger.info(f"✅ DB에서 뉴스 조회 성공: {len(news)}개 (skip={skip}, limit={limit})")
         return news
     
-    # 2. DB에 없으면 더미 데이터 생성
-    logger.warning(f"⚠️ DB에 뉴스 없음, 더미 생성: skip={skip}, limit={limit}")
+    # 2. DB에 없으면 미리 생성해 둔 더미 뉴스 반환
+    logger.warning(f"⚠️ DB에 뉴스 없음, 더미 반환: skip={skip}, limit={limit}")
     
     try:
-        generator = get_generator()
-        
-        # 전체 더미 뉴스 생성 (20개)
-        all_dummy_news = generator.generate_news_list(n=20)
-        
-        # skip과 limit 적용
-        dummy_news = all_dummy_news[skip:skip+limit]
+        # 전체 더미 뉴스 (20개)에 skip과 limit 적용
+        dummy_news = _get_dummy_news()[skip:skip+limit]
         
-        logger.info(f"✅ 더미 뉴스 생성 완료: {len(dummy_news)}개")
+        logger.info(f"✅ 더미 뉴스 반환 완료: {len(dummy_news)}개")
         return dummy_news
         
     except Exception as e:
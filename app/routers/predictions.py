@@ -1,11 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
-from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+from typing import List, Optional
 from datetime import date, datetime, timedelta
+import asyncio
 import logging
 
-from .. import crud, dataschemas
-from ..database import get_db
+import pandas as pd
+
+from .. import crud, dataschemas, response_cache
+from ..config import settings
+from ..database import get_read_db, get_async_read_db, AsyncSessionLocal, AsyncReadSessionLocal
 from ..dummy_data_generator import get_generator
 
 logger = logging.getLogger(__name__)
@@ -17,44 +23,106 @@ router = APIRouter(
 
 # --- [예측 (Predictions)] ---
 
+# 실제 가격 조회 기간 (기본: 과거 30일 ~ 오늘, 최대 1년)
+DEFAULT_PRICE_WINDOW_DAYS = 30
+MAX_PRICE_WINDOW_DAYS = 365
+
+
 # GET /api/predictions?commodity=corn
+# GET /api/predictions?commodity=corn&start_date=2026-01-01&end_date=2026-01-31
 @router.get("/predictions", response_model=dataschemas.PredictionsWithPricesResponse)
-def get_predictions(
+async def get_predictions(
     commodity: str,
-    db: Session = Depends(get_db)
+    start_date: Optional[date] = Query(None, description="실제 가격 조회 시작일 (기본: 종료일-30일)"),
+    end_date: Optional[date] = Query(None, description="실제 가격 조회 종료일 (기본: 오늘)"),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """
-    최신 배치의 예측 데이터 + 과거 30일 실제 가격 반환
+    최신 배치의 예측 데이터 + 실제 가격 반환
     - predictions: 각 target_date별 created_at 최신 (오늘-30일 ~ 오늘+60일)
-    - historical_prices: 과거 30일 ~ 오늘까지의 실제 가격
+    - historical_prices: start_date ~ end_date의 실제 가격 (기본: 과거 30일 ~ 오늘)
+    """
+    today = datetime.now().date()
+    end_date = end_date or today
+    start_date = start_date or end_date - timedelta(days=DEFAULT_PRICE_WINDOW_DAYS)
+    if start_date > end_date:
+        raise HTTPException(status_code=400, detail="start_date는 end_date보다 이후일 수 없습니다.")
+    if (end_date - start_date).days > MAX_PRICE_WINDOW_DAYS:
+        raise HTTPException(status_code=400, detail=f"조회 기간은 최대 {MAX_PRICE_WINDOW_DAYS}일입니다.")
+    
+    # 같은 품목/기간의 오늘자 응답이 있으면 재사용 (예측/가격 저장 시 무효화됨)
+    # 캐시에는 직렬화된 JSON bytes를 보관 → 적중 시 DB 조회/응답 검증/직렬화 모두 생략
+    cache_key = response_cache.make_key(response_cache.PREDICTIONS, commodity, today, start_date, end_date)
+    cached = response_cache.get_fresh(cache_key)
+    if cached is not None:
+        return _json_response(cached)
+    
+    try:
+        response = await _build_predictions_response(db, commodity, start_date, end_date)
+    except SQLAlchemyError as e:
+        # DB 오류 시 마지막으로 캐시된 응답으로 대체
+        stale = response_cache.get_stale(cache_key)
+        if stale is None:
+            raise
+        logger.warning(f"예측 조회 실패, 캐시된 응답 반환: {commodity} ({e})")
+        return _json_response(stale)
+    
+    body = response.model_dump_json().encode()
+    response_cache.put(cache_key, body, settings.predictions_cache_ttl_seconds)
+    return _json_response(body)
+
+
+def _json_response(body: bytes) -> Response:
+    """이미 직렬화된 PredictionsWithPricesResponse JSON을 그대로 반환 (response_model 재검증 없음)"""
+    return Response(content=body, media_type="application/json")
+
+
+async def _get_historical_prices_in_own_session(commodity: str, start_date: date, end_date: date):
+    """
+    가격 조회를 별도 세션(커넥션)에서 실행
+    
+    AsyncSession 하나로는 쿼리를 동시에 실행할 수 없으므로,
+    예측 조회와 gather로 겹치려면 가격 조회는 자체 세션을 사용합니다.
     """
-    pred = crud.get_latest_predictions(db, commodity)
+    async with AsyncReadSessionLocal() as price_db:
+        return await crud.get_historical_prices_projection_async(price_db, commodity, start_date, end_date)
+
+
+async def _build_predictions_response(
+    db: AsyncSession,
+    commodity: str,
+    start_date: date,
+    end_date: date
+) -> dataschemas.PredictionsWithPricesResponse:
+    """최신 예측 + 기간 내 실제 가격(부족하면 실시간 수집)으로 응답 생성"""
+    # 최신 예측 + start_date ~ end_date의 실제 가격을 동시에 조회 (휴장일 처리는 아래에서)
+    pred, price_rows = await asyncio.gather(
+        crud.get_latest_predictions_async(db, commodity),
+        _get_historical_prices_in_own_session(commodity, start_date, end_date)
+    )
     if not pred:
         raise HTTPException(
             status_code=404,
             detail=f"{commodity}의 최신 예측 데이터가 없습니다."
         )
     
-    # 과거 30일 ~ 오늘까지의 실제 가격 조회 (휴장일 처리 포함)
-    today = datetime.now().date()
-    start_date = today - timedelta(days=30)
-    prices = crud.get_historical_prices(db, commodity, start_date, today)
-    
-    # DB에서 가져온 거래일 데이터를 dict로 변환
-    price_dict = {p.date: float(p.actual_price) for p in prices} if prices else {}
+    # DB에서 가져온 거래일 (date, price) 행을 dict로 변환
+    price_dict = dict(price_rows)
     
     # DB에 데이터가 없으면 실시간으로 수집
-    if not prices or len(price_dict) < 20:  # 최소 20일 이상 데이터 필요
+    window_days = (end_date - start_date).days
+    min_trading_days = (window_days + 1) * 2 // 3  # 기간의 2/3 이상 필요 (기본 30일 기간 → 20일)
+    if not price_dict or len(price_dict) < min_trading_days:
         logger.warning(f"DB에 {commodity}의 historical prices가 부족합니다. 실시간 수집합니다.")
         try:
-            from ..data_fetcher import fetch_realtime_features
+            from ..data_fetcher import fetch_realtime_features_async
             from ..config import settings
             
-            # 30일치 가격 데이터 수집
-            result = fetch_realtime_features(
+            # 조회 기간의 가격 데이터 수집 (외부 API 호출은 워커 스레드에서 동시 실행)
+            result = await fetch_realtime_features_async(
                 commodity=commodity,
-                end_date=today,
-                days=30,
+                end_date=end_date,
+                days=max(window_days, 1),
                 fred_api_key=settings.fred_api_key
             )
             
@@ -66,43 +134,38 @@ def get_predictions(
                 price_items = []
                 for i, date_str in enumerate(dates):
                     if i < len(prices_data):
-                        price_items.append(dataschemas.HistoricalPriceItem(
+                        price_items.append(dataschemas.HistoricalPriceItem.model_construct(
                             date=date_str,
                             actual_price=float(prices_data[i]),
                             is_trading_day=True
                         ))
                 
                 if price_items:
-                    crud.create_historical_prices_bulk(db, commodity, price_items)
-                    logger.info(f"✅ Historical prices 저장 완료: {len(price_items)}일치")
+                    # 주 DB 세션으로 저장 (DB에 일부 날짜가 이미 있을 수 있으므로 없는 날짜만 저장)
+                    async with AsyncSessionLocal() as write_db:
+                        saved_count = await write_db.run_sync(crud.insert_missing_historical_prices, commodity, price_items)
+                    logger.info(f"✅ Historical prices 저장 완료: {saved_count}일치")
                     
-                    # 다시 조회
-                    prices = crud.get_historical_prices(db, commodity, start_date, today)
-                    price_dict = {p.date: float(p.actual_price) for p in prices} if prices else {}
+                    # 다시 조회하지 않고 방금 저장한 값으로 보완 (이미 DB에 있던 날짜는 DB 값 유지 - 저장 시에도 건너뜀)
+                    for item in price_items:
+                        item_date = date.fromisoformat(item.date)
+                        if start_date <= item_date <= end_date:
+                            price_dict.setdefault(item_date, round(item.actual_price, 2))  # DB 컬럼 Numeric(10, 2)과 동일
         except Exception as e:
             logger.error(f"Historical prices 실시간 수집 실패: {e}")
     
     # 모든 날짜에 대해 연속된 리스트 생성 (휴장일 포함)
-    prices_list = []
-    
-    current_date = start_date
-    while current_date <= today:
-        if current_date in price_dict:
-            # 거래일: 실제 가격
-            prices_list.append(dataschemas.HistoricalPriceItem(
-                date=current_date.isoformat(),
-                actual_price=price_dict[current_date],
-                is_trading_day=True
-            ))
-        else:
-            # 휴장일: null
-            prices_list.append(dataschemas.HistoricalPriceItem(
-                date=current_date.isoformat(),
-                actual_price=None,
-                is_trading_day=False
-            ))
-        
-        current_date += timedelta(days=1)
+    # 일 단위 달력(date 배열)을 한 번에 만들고 거래일 가격은 dict.get으로 매칭 → 없으면 휴장일(null)
+    # (값은 서버에서 만든 것이므로 검증 없이 생성)
+    calendar = pd.date_range(start_date, end_date, freq='D').date
+    prices_list = [
+        dataschemas.HistoricalPriceItem.model_construct(
+            date=day.isoformat(),
+            actual_price=price,
+            is_trading_day=price is not None
+        )
+        for day, price in zip(calendar, map(price_dict.get, calendar))
+    ]
     
     return dataschemas.PredictionsWithPricesResponse(
         predictions=pred,
@@ -111,12 +174,12 @@ def get_predictions(
 
 # GET /api/predictions/2025-12-01?commodity=corn
 @router.get("/predictions/{target_date}", response_model=dataschemas.TftPredResponse)
-def get_prediction_by_date(
+async def get_prediction_by_date(
     target_date: date, 
     commodity: str, 
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
-    pred = crud.get_prediction_by_date(db, commodity, target_date)
+    pred = await crud.get_prediction_by_date_async(db, commodity, target_date)
     if not pred:
         raise HTTPException(status_code=404, detail="해당 날짜의 데이터가 없습니다.")
     return pred
@@ -129,7 +192,7 @@ def get_prediction_by_date(
 def get_explanation_by_date(
     target_date: date, 
     commodity: str, 
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     특정 날짜의 예측 설명 조회
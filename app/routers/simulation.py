@@ -5,6 +5,8 @@ from datetime import timedelta, date
 import logging
 import math
 
+import numpy as np
+
 from ..ml.prediction_service import get_prediction_service
 from .. import crud, dataschemas
 from ..database import get_db
@@ -66,21 +68,23 @@ class SimulationValidator:
     """시뮬레이션 요청 검증"""
     
     # 조정 가능한 Features (5개)
-    VALID_FEATURES = {
+    VALID_FEATURES = frozenset({
         '10Y_Yield', 'USD_Index', 'pdsi', 'spi30d', 'spi90d'
-    }
+    })
     
     @staticmethod
     def validate_feature_overrides(feature_overrides: Dict[str, float]) -> None:
         """Feature override 유효성 검증"""
-        invalid_features = set(feature_overrides.keys()) - SimulationValidator.VALID_FEATURES
+        # 정상 요청은 임시 set 생성 없이 포함 여부만 확인
+        if SimulationValidator.VALID_FEATURES.issuperset(feature_overrides):
+            return
         
-        if invalid_features:
-            raise HTTPException(
-                status_code=400,
-                detail=f"조정 불가능한 feature: {invalid_features}. "
-                       f"가능한 features: {SimulationValidator.VALID_FEATURES}"
-            )
+        invalid_features = feature_overrides.keys() - SimulationValidator.VALID_FEATURES
+        raise HTTPException(
+            status_code=400,
+            detail=f"조정 불가능한 feature: {invalid_features}. "
+                   f"가능한 features: {set(SimulationValidator.VALID_FEATURES)}"
+        )
 
 
 class FeatureImpactCalculator:
@@ -293,9 +297,9 @@ def _run_60day_predictions(
     predictions = []
     
     try:
-        # 원본 및 시뮬레이션용 historical data 복사
-        original_hist = _copy_historical_data(historical_data)
-        simulated_hist = _copy_historical_data(historical_data)
+        # 원본 및 시뮬레이션용 rolling window (feature별 float32 버퍼)
+        original_window = _RollingFeatureWindow(historical_data)
+        simulated_window = _RollingFeatureWindow(historical_data)
         
         # 🔄 현재 ONNX 모델이 7일용이므로 9번 반복 필요
         # TODO: 60일 ONNX 모델로 교체 후 num_cycles = 1로 변경
@@ -307,28 +311,13 @@ def _run_60day_predictions(
             
             logger.info(f"Rolling prediction cycle {cycle + 1}/{num_cycles}")
             
-            # 원본 예측 (override 없이)
-            print(f"\n{'='*80}")
-            print(f"📊 Cycle {cycle + 1}/{num_cycles}: 원본 예측 수행 (override 없음)")
-            print(f"{'='*80}")
-            logger.info(f"📊 원본 예측 수행 (override 없음)")
-            original_result = pred_service.predict_tft(
-                request.commodity, 
-                original_hist,
-                feature_overrides=None
-            )
-            
-            # 시뮬레이션 예측 (override 적용)
-            print(f"\n{'='*80}")
-            print(f"📊 Cycle {cycle + 1}/{num_cycles}: 시뮬레이션 예측 수행")
-            print(f"   Override: {request.feature_overrides}")
-            print(f"{'='*80}")
-            logger.info(f"📊 시뮬레이션 예측 수행 (override 적용: {request.feature_overrides})")
-            simulated_result = pred_service.predict_tft(
-                request.commodity,
-                simulated_hist,
-                feature_overrides=request.feature_overrides
-            )
+            # 원본 예측 (override 없이) + 시뮬레이션 예측 (override 적용)
+            # 두 입력을 배치 2로 묶어 한 번의 ONNX 추론으로 실행
+            logger.info(f"📊 원본/시뮬레이션 예측 수행 (override 적용: {request.feature_overrides})")
+            original_result, simulated_result = pred_service.predict_tft_batch([
+                (request.commodity, original_window.as_historical_data(), None),
+                (request.commodity, simulated_window.as_historical_data(), request.feature_overrides),
+            ])
             
             # 결과 비교 로깅
             original_avg = sum(original_result['predictions']) / len(original_result['predictions'])
@@ -370,7 +359,7 @@ def _run_60day_predictions(
                 else:
                     change_percent = 0.0
                 
-                predictions.append(dataschemas.SimulationPredictionItem(
+                predictions.append(dataschemas.SimulationPredictionItem.model_construct(
                     date=pred_date.isoformat(),
                     original_price=round(original_price, 2),
                     simulated_price=round(simulated_price, 2),
@@ -383,13 +372,13 @@ def _run_60day_predictions(
                 logger.info(f"🔄 Rolling window 업데이트 시작 (cycle {cycle + 1})")
                 logger.info(f"   원본: 예측 {len(original_prices)}일을 다음 입력으로 추가")
                 _update_historical_data_with_predictions(
-                    original_hist, 
+                    original_window, 
                     original_prices, 
                     None
                 )
                 logger.info(f"   시뮬레이션: 예측 {len(simulated_prices)}일을 다음 입력으로 추가 (override: {list(request.feature_overrides.keys())})")
                 _update_historical_data_with_predictions(
-                    simulated_hist, 
+                    simulated_window, 
                     simulated_prices, 
                     request.feature_overrides
                 )
@@ -407,22 +396,77 @@ def _run_60day_predictions(
         )
 
 
-def _copy_historical_data(historical_data: Dict) -> Dict:
-    """Historical data 깊은 복사"""
-    import copy
-    return {
-        'dates': historical_data['dates'].copy(),
-        'features': {k: v.copy() for k, v in historical_data['features'].items()}
-    }
+class _RollingFeatureWindow:
+    """
+    Rolling window용 feature 버퍼 (feature별 float32 배열)
+    
+    feature마다 window 길이의 2배 버퍼에 현재 구간 [start, start + length)을 유지합니다.
+    - 예측된 N일은 현재 구간 바로 뒤에 N개만 기록하고 start를 N만큼 이동
+    - 버퍼 끝에 도달했을 때만 최근 (length - N)일을 앞으로 한 번 옮김
+    매 cycle마다 feature 리스트를 복사/슬라이싱/이어붙이지 않고, 예측기는 현재 구간 view를 그대로 사용합니다.
+    """
+    
+    def __init__(self, historical_data: Dict):
+        self.dates = historical_data['dates']
+        self._buffers: Dict[str, np.ndarray] = {}
+        self._starts: Dict[str, int] = {}
+        self._lengths: Dict[str, int] = {}
+        
+        for name, values in historical_data['features'].items():
+            values = np.asarray(values, dtype=np.float32)
+            length = len(values)
+            buffer = np.empty(2 * length, dtype=np.float32)
+            buffer[:length] = values
+            self._buffers[name] = buffer
+            self._starts[name] = 0
+            self._lengths[name] = length
+    
+    def __iter__(self):
+        return iter(self._buffers)
+    
+    def __len__(self) -> int:
+        return len(self._buffers)
+    
+    def __contains__(self, name: str) -> bool:
+        return name in self._buffers
+    
+    def view(self, name: str) -> np.ndarray:
+        """현재 window 구간 (복사 없는 view)"""
+        start = self._starts[name]
+        return self._buffers[name][start:start + self._lengths[name]]
+    
+    def as_historical_data(self) -> Dict:
+        """predict_tft 입력 형식 ({'dates', 'features'})으로 현재 window 반환"""
+        return {
+            'dates': self.dates,
+            'features': {name: self.view(name) for name in self._buffers}
+        }
+    
+    def push(self, name: str, new_values) -> None:
+        """가장 오래된 N일을 밀어내고 새 N일을 추가 (N <= window 길이)"""
+        num_days = len(new_values)
+        buffer = self._buffers[name]
+        start = self._starts[name]
+        length = self._lengths[name]
+        
+        if start + length + num_days > len(buffer):
+            # 버퍼 끝 도달: 남길 (length - N)일을 맨 앞으로 이동
+            buffer[:length - num_days] = buffer[start + num_days:start + length]
+            start = 0
+        else:
+            start += num_days
+        
+        buffer[start + length - num_days:start + length] = new_values
+        self._starts[name] = start
 
 
 def _update_historical_data_with_predictions(
-    historical_data: Dict,
+    window: _RollingFeatureWindow,
     predicted_prices: List[float],
     feature_overrides: Optional[Dict[str, float]]
 ):
     """
-    예측된 가격으로 historical data 업데이트 (rolling window)
+    예측된 가격으로 rolling window 업데이트
     
     - 가장 오래된 N일 제거
     - 예측된 N일 추가
@@ -434,75 +478,56 @@ def _update_historical_data_with_predictions(
     if feature_overrides:
         logger.info(f"     Override 적용: {feature_overrides}")
     
-    # 날짜 업데이트 (가장 오래된 N일 제거하고 새 날짜 추가)
-    old_dates_count = len(historical_data['dates'])
-    historical_data['dates'] = historical_data['dates'][num_days:]
-    logger.debug(f"     날짜: {old_dates_count}일 → {len(historical_data['dates'])}일 (최근 {num_days}일 제거)")
+    predicted = np.asarray(predicted_prices, dtype=np.float32)
     
-    # 슬라이싱 전에 필요한 값들을 미리 저장 (순서 문제 방지)
-    old_features = {
-        name: values.copy() 
-        for name, values in historical_data['features'].items()
-    }
+    # open/high/low 비율은 close 갱신 전의 마지막 값 기준
+    close_values = window.view('close') if 'close' in window else None
+    old_close_last = float(close_values[-1]) if close_values is not None and len(close_values) > 0 else 0.0
     
     # 각 feature 업데이트
-    for feature_name in historical_data['features']:
-        feature_values = old_features[feature_name]
+    for feature_name in window:
+        feature_values = window.view(feature_name)
         
         # 최소 필요 길이 확인 (60일 유지 필요)
         if len(feature_values) < num_days:
             logger.warning(f"⚠️ feature '{feature_name}'의 데이터가 {len(feature_values)}일로 부족합니다 (최소 {num_days}일 필요). 원본 유지")
-            historical_data['features'][feature_name] = feature_values
             continue
         
-        # 가장 오래된 N일 제거
-        feature_values_trimmed = feature_values[num_days:]
-        
         # 예측 기반 새 값 생성
         if feature_name == 'close':
             # 가격: 예측값 사용
-            new_values = predicted_prices
+            new_values = predicted
         elif feature_name in ['open', 'high', 'low']:
             # 가격 관련: close 기반으로 생성
             # 최근 close와의 비율을 유지
-            old_close_last = old_features['close'][-1]
-            old_feature_last = feature_values[-1]
-            
             if old_close_last != 0:
-                ratio = old_feature_last / old_close_last
-                new_values = [p * ratio for p in predicted_prices]
+                new_values = predicted * (float(feature_values[-1]) / old_close_last)
             else:
-                new_values = predicted_prices
+                new_values = predicted
         elif feature_name == 'volume':
             # 거래량: 최근 평균 유지
-            recent_values = feature_values[-min(7, len(feature_values)):]
-            avg_volume = sum(recent_values) / len(recent_values) if recent_values else 0
-            new_values = [avg_volume] * num_days
+            new_values = float(feature_values[-min(7, len(feature_values)):].mean())
         elif feature_overrides and feature_name in feature_overrides:
             # Override된 feature: 고정값 사용
-            override_value = feature_overrides[feature_name]
-            new_values = [override_value] * num_days
-            logger.debug(f"  🔧 Rolling window - {feature_name}: override 값 {override_value} 적용 ({num_days}일)")
+            new_values = feature_overrides[feature_name]
+            logger.debug(f"  🔧 Rolling window - {feature_name}: override 값 {new_values} 적용 ({num_days}일)")
         else:
             # 기타 feature: 마지막 값 유지
-            last_value = feature_values[-1] if len(feature_values) > 0 else 0
-            new_values = [last_value] * num_days
+            new_values = feature_values[-1]
         
-        # 업데이트 후 길이 확인
-        updated_values = feature_values_trimmed + new_values
-        historical_data['features'][feature_name] = updated_values
+        if np.ndim(new_values) == 0:
+            # 스칼라는 N일 구간 전체에 채움
+            new_values = np.full(num_days, new_values, dtype=np.float32)
+        window.push(feature_name, new_values)
         
         # 디버깅: 주요 feature 로그
         if feature_name == 'close':
-            logger.debug(f"     close: {len(feature_values)} → {len(updated_values)}일 (제거 {num_days}, 추가 {num_days})")
-            logger.debug(f"           추가된 값: {[round(v, 2) for v in new_values[:3]]}...")
-        elif feature_overrides and feature_name in feature_overrides:
-            logger.debug(f"     {feature_name}: override 값 {feature_overrides[feature_name]} 적용됨 ({num_days}일)")
+            logger.debug(f"     close: {len(feature_values)}일 유지 (제거 {num_days}, 추가 {num_days})")
+            logger.debug(f"           추가된 값: {[round(float(v), 2) for v in new_values[:3]]}...")
     
     # 업데이트 완료 로그
-    total_features = len(historical_data['features'])
     override_count = len(feature_overrides) if feature_overrides else 0
-    logger.debug(f"  ✅ Rolling window 업데이트 완료: {total_features}개 feature, {override_count}개 override 적용")
+    logger.debug(f"  ✅ Rolling window 업데이트 완료: {len(window)}개 feature, {override_count}개 override 적용")
 
 
 def _calculate_summary(predictions: List[dataschemas.SimulationPredictionItem]) -> dict:
@@ -510,36 +535,35 @@ def _calculate_summary(predictions: List[dataschemas.SimulationPredictionItem])
     if not predictions:
         return {}
     
-    # 안전한 합계 계산 (inf/nan 필터링)
-    total_change = sum(sanitize_float(p.change) for p in predictions)
-    avg_change = total_change / len(predictions) if len(predictions) > 0 else 0
-    
-    total_change_percent = sum(sanitize_float(p.change_percent) for p in predictions)
-    avg_change_percent = total_change_percent / len(predictions) if len(predictions) > 0 else 0
-    
-    avg_original = sum(sanitize_float(p.original_price) for p in predictions) / len(predictions) if len(predictions) > 0 else 0
-    avg_simulated = sum(sanitize_float(p.simulated_price) for p in predictions) / len(predictions) if len(predictions) > 0 else 0
+    # 한 번의 순회로 (N, 4) 배열 구성: change, change_percent, original_price, simulated_price
+    values = np.array(
+        [(p.change, p.change_percent, p.original_price, p.simulated_price) for p in predictions],
+        dtype=np.float64
+    )
     
-    # 안전한 min/max 계산
-    changes = [sanitize_float(p.change) for p in predictions]
-    max_change = max(changes) if changes else 0
-    min_change = min(changes) if changes else 0
+    # inf/nan은 0으로 대체 (sanitize_float와 동일)
+    non_finite = ~np.isfinite(values)
+    if non_finite.any():
+        logger.warning(f"무한대/NaN 값 감지: {int(non_finite.sum())}개 -> 0.0으로 대체")
+        values[non_finite] = 0.0
     
-    # max/min date 찾기
-    max_pred = max(predictions, key=lambda p: sanitize_float(p.change))
-    min_pred = min(predictions, key=lambda p: sanitize_float(p.change))
+    changes = values[:, 0]
+    totals = values.sum(axis=0)
+    means = totals / len(predictions)
+    max_idx = int(changes.argmax())
+    min_idx = int(changes.argmin())
     
     return {
         "total_days": len(predictions),
-        "avg_original_price": round(sanitize_float(avg_original), 2),
-        "avg_simulated_price": round(sanitize_float(avg_simulated), 2),
-        "avg_change": round(sanitize_float(avg_change), 2),
-        "avg_change_percent": round(sanitize_float(avg_change_percent), 2),
-        "total_change": round(sanitize_float(total_change), 2),
-        "max_change": round(sanitize_float(max_change), 2),
-        "min_change": round(sanitize_float(min_change), 2),
-        "max_change_date": max_pred.date,
-        "min_change_date": min_pred.date
+        "avg_original_price": round(sanitize_float(float(means[2])), 2),
+        "avg_simulated_price": round(sanitize_float(float(means[3])), 2),
+        "avg_change": round(sanitize_float(float(means[0])), 2),
+        "avg_change_percent": round(sanitize_float(float(means[1])), 2),
+        "total_change": round(sanitize_float(float(totals[0])), 2),
+        "max_change": round(float(changes[max_idx]), 2),
+        "min_change": round(float(changes[min_idx]), 2),
+        "max_change_date": predictions[max_idx].date,
+        "min_change_date": predictions[min_idx].date
     }
 
 
@@ -570,7 +594,7 @@ def _get_original_predictions_response(
     for i, pred in enumerate(original_predictions):
         if i >= 60: break
         price = float(pred.price_pred)
-        predictions.append(dataschemas.SimulationPredictionItem(
+        predictions.append(dataschemas.SimulationPredictionItem.model_construct(
             date=pred.target_date.isoformat(),
             original_price=price,
             simulated_price=price,
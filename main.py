@@ -1,12 +1,21 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from app import datatable
-from app.database import engine
+from app.database import engine, async_engine, read_async_engine
+from app.http_cache import ETagMiddleware
 from app.routers import predictions, newsdb, market_metrics, simulation, batch
 from app.ml.model_loader import start_model_update_scheduler
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse
 import logging
 
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    DefaultResponse = JSONResponse
+
 # 로그 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -34,6 +43,7 @@ async def lifespan(app: FastAPI):
     # --- Startup ---
     logger.info("🚀 서버 시작 중...")
     _scheduler = start_model_update_scheduler()
+    newsdb.warm_dummy_news_cache()
     
     yield
     
@@ -41,13 +51,20 @@ async def lifespan(app: FastAPI):
     if _scheduler:
         _scheduler.shutdown(wait=False)
         logger.info("📅 모델 업데이트 스케줄러 종료")
+    await async_engine.dispose()
+    await read_async_engine.dispose()
     logger.info("👋 서버 종료")
 
 
 # DB에 테이블이 없으면 자동 생성 (CREATE TABLE IF NOT EXISTS)
 datatable.Base.metadata.create_all(bind=engine)
 
-app = FastAPI(title="Commodity Price AI Server", lifespan=lifespan)
+# 응답 직렬화는 orjson 사용 (예측+가격, 시장 지표, 뉴스 목록 등 큰 JSON 응답의 CPU 절감)
+app = FastAPI(
+    title="Commodity Price AI Server",
+    lifespan=lifespan,
+    default_response_class=DefaultResponse
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -57,6 +74,18 @@ app.add_middleware(
     allow_headers=["*"],   
 )
 
+# 반복 조회되는 GET 응답에 Cache-Control + ETag (본문이 같으면 304)
+# GZip보다 먼저 등록 → 안쪽에서 압축 전 본문으로 ETag 계산
+app.add_middleware(
+    ETagMiddleware,
+    path_prefixes=("/api/predictions", "/api/market-metrics", "/api/newsdb"),
+    max_age=30,
+    stale_while_revalidate=60,
+)
+
+# 응답 압축 (예측 60일치, 시뮬레이션, 뉴스 목록 등 1KB 이상 JSON)
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
 # 라우터 등록
 app.include_router(predictions.router)
 app.include_router(newsdb.router)
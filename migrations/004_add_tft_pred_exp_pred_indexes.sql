@@ -0,0 +1,26 @@
+-- ===================================================================
+-- 마이그레이션: tft_pred / exp_pred 조회용 인덱스 추가
+-- 작성일: 2026-10-15
+-- 설명: crud.py의 예측 조회는 모두 commodity로 필터한 뒤 target_date로
+--       범위 조회/정렬하므로 복합 인덱스를 추가합니다.
+--       exp_pred는 pred_id(FK)로 조회하므로 단일 인덱스를 추가합니다.
+--       (create_all은 기존 테이블에 인덱스를 추가하지 않으므로 수동 실행 필요)
+-- ===================================================================
+
+-- 1. tft_pred: (commodity, target_date DESC)
+CREATE INDEX IF NOT EXISTS idx_tft_pred_commodity_target_date
+    ON tft_pred (commodity, target_date DESC);
+
+-- 2. exp_pred: pred_id
+CREATE INDEX IF NOT EXISTS ix_exp_pred_pred_id
+    ON exp_pred (pred_id);
+
+-- 3. 통계 갱신
+ANALYZE tft_pred;
+ANALYZE exp_pred;
+
+-- ===================================================================
+-- 롤백 (필요시 실행)
+-- ===================================================================
+-- DROP INDEX IF EXISTS ix_exp_pred_pred_id;
+-- DROP INDEX IF EXISTS idx_tft_pred_commodity_target_date;
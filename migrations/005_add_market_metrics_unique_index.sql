@@ -0,0 +1,29 @@
+-- ===================================================================
+-- 마이그레이션: market_metrics (commodity, date, metric_id) 유니크 인덱스 추가
+-- 작성일: 2026-10-15
+-- 설명: crud.upsert_market_metric_rows는 INSERT ... ON CONFLICT
+--       (commodity, date, metric_id) DO UPDATE로 벌크 저장하므로
+--       충돌 대상이 되는 유니크 인덱스가 필요합니다.
+--       기존에는 중복 저장이 가능했으므로, 먼저 중복 행을 정리(최신 id만 유지)합니다.
+--       (create_all은 기존 테이블에 인덱스를 추가하지 않으므로 수동 실행 필요)
+-- ===================================================================
+
+-- 1. 중복 지표 정리 (같은 commodity/date/metric_id 중 가장 최근 id만 유지)
+DELETE FROM market_metrics a
+    USING market_metrics b
+    WHERE a.commodity = b.commodity
+      AND a.date = b.date
+      AND a.metric_id = b.metric_id
+      AND a.id < b.id;
+
+-- 2. 유니크 인덱스
+CREATE UNIQUE INDEX IF NOT EXISTS uq_market_metrics_commodity_date_metric
+    ON market_metrics (commodity, date, metric_id);
+
+-- 3. 통계 갱신
+ANALYZE market_metrics;
+
+-- ===================================================================
+-- 롤백 (필요시 실행)
+-- ===================================================================
+-- DROP INDEX IF EXISTS uq_market_metrics_commodity_date_metric;
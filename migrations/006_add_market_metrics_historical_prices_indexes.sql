@@ -0,0 +1,31 @@
+-- ===================================================================
+-- 마이그레이션: market_metrics / historical_prices 조회용 복합 인덱스 추가
+-- 작성일: 2026-10-15
+-- 설명: 시장 지표는 (commodity, date)로, 실제 가격은 commodity + date 범위로
+--       조회하므로 복합 인덱스를 추가합니다.
+--       market_metrics는 응답에 필요한 컬럼을 INCLUDE한 커버링 인덱스로,
+--       crud.get_market_metrics(_async)의 load_only 컬럼과 일치시켜
+--       heap 접근 없이 index-only scan이 가능하게 합니다.
+--       (운영 중 테이블 잠금을 피하기 위해 CONCURRENTLY 사용 - 트랜잭션 밖에서 실행)
+--       (create_all은 기존 테이블에 인덱스를 추가하지 않으므로 수동 실행 필요)
+-- ===================================================================
+
+-- 1. market_metrics: (commodity, date) INCLUDE (응답 컬럼)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_market_metrics_commodity_date_covering
+    ON market_metrics (commodity, date)
+    INCLUDE (id, metric_id, label, value, numeric_value, trend, impact);
+
+-- 2. historical_prices: (commodity, date) INCLUDE (actual_price)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_historical_prices_commodity_date
+    ON historical_prices (commodity, date)
+    INCLUDE (actual_price);
+
+-- 3. 통계 갱신 (+ index-only scan을 위한 visibility map 갱신)
+VACUUM ANALYZE market_metrics;
+VACUUM ANALYZE historical_prices;
+
+-- ===================================================================
+-- 롤백 (필요시 실행)
+-- ===================================================================
+-- DROP INDEX CONCURRENTLY IF EXISTS ix_historical_prices_commodity_date;
+-- DROP INDEX CONCURRENTLY IF EXISTS ix_market_metrics_commodity_date_covering;
@@ -0,0 +1,112 @@
+"""
+ONNX 모델 int8 동적 양자화 + FP32 대비 출력 검증
+
+모델 배포 시점에 실행하여 `<name>.int8.onnx`를 생성합니다.
+모델 로더는 같은 폴더(또는 S3 prefix)에 int8 모델이 있으면 이를 우선 사용합니다.
+FP32 출력과의 차이가 임계값을 넘으면 int8 파일을 삭제하여 FP32 모델을 계속 사용하게 합니다.
+
+사용법:
+    python scripts/quantize_onnx_model.py temp/60d_20260206.onnx [--threshold 0.05]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+import onnxruntime as ort
+from onnxruntime.quantization import QuantType, quantize_dynamic
+
+ENCODER_LENGTH = 60
+DECODER_LENGTH = 7
+
+
+def build_sample_inputs(session, num_samples: int, seed: int = 0) -> dict:
+    """모델 입력 shape에 맞는 검증용 샘플 입력 생성"""
+    rng = np.random.default_rng(seed)
+    inputs = {}
+    for inp in session.get_inputs():
+        name = inp.name
+        if name.endswith("_lengths"):
+            length = ENCODER_LENGTH if name.startswith("encoder") else DECODER_LENGTH
+            inputs[name] = np.full(num_samples, length, dtype=np.int64)
+            continue
+
+        length = ENCODER_LENGTH if name.startswith("encoder") else DECODER_LENGTH
+        last_dim = inp.shape[-1] if isinstance(inp.shape[-1], int) else 1
+        if name == "target_scale":
+            inputs[name] = np.tile(np.array([[6.0, 0.2]], dtype=np.float32), (num_samples, 1))
+        elif "cat" in name:
+            inputs[name] = np.zeros((num_samples, length, last_dim), dtype=np.int64)
+        else:
+            inputs[name] = rng.standard_normal((num_samples, length, last_dim)).astype(np.float32)
+    return inputs
+
+
+def supports_batching(session) -> bool:
+    """입력의 배치 축(axis 0)이 가변인지 확인 (prediction_service._supports_batching과 동일 기준)"""
+    return all(
+        not isinstance(inp.shape[0], int) or inp.shape[0] != 1
+        for inp in session.get_inputs()
+        if inp.shape
+    )
+
+
+def quantize_and_validate(model_path: Path, threshold: float, num_samples: int, batch_size: int = 2) -> bool:
+    """
+    int8 양자화 후 FP32 대비 최대 오차 검증
+
+    시뮬레이션 API는 원본/시뮬레이션 입력을 배치 2로 묶어 추론하므로 같은 배치 크기로 검증합니다.
+    배치 축이 1로 고정된 모델은 서비스도 요청별로 추론하므로 배치 1로 검증합니다.
+    """
+    int8_path = model_path.with_name(f"{model_path.stem}.int8.onnx")
+    # 검증 전에는 모델 로더가 찾는 `*.int8.onnx` 이름을 쓰지 않음 (검증 실패/예외 시 미검증 모델이 배포되지 않도록)
+    tmp_path = model_path.with_name(f"{model_path.stem}.int8.onnx.tmp")
+
+    try:
+        print(f"🔧 동적 양자화: {model_path.name} → {tmp_path.name}")
+        quantize_dynamic(str(model_path), str(tmp_path), weight_type=QuantType.QInt8)
+
+        fp32_session = ort.InferenceSession(str(model_path), providers=["CPUExecutionProvider"])
+        int8_session = ort.InferenceSession(str(tmp_path), providers=["CPUExecutionProvider"])
+
+        if batch_size > 1 and not supports_batching(fp32_session):
+            print(f"   배치 축이 1로 고정된 모델: 배치 {batch_size} 대신 1로 검증")
+            batch_size = 1
+
+        max_delta = 0.0
+        for i in range(0, num_samples, batch_size):
+            sample = build_sample_inputs(fp32_session, batch_size, seed=i)
+            fp32_out = fp32_session.run(None, sample)[0]
+            int8_out = int8_session.run(None, sample)[0]
+            max_delta = max(max_delta, float(np.max(np.abs(fp32_out - int8_out))))
+
+        size_fp32 = model_path.stat().st_size
+        size_int8 = tmp_path.stat().st_size
+        print(f"   크기: {size_fp32:,} → {size_int8:,} bytes ({size_int8 / size_fp32:.1%})")
+        print(f"   FP32 대비 최대 오차: {max_delta:.6f} (임계값 {threshold})")
+
+        if max_delta > threshold:
+            int8_path.unlink(missing_ok=True)
+            print("❌ 오차가 임계값을 초과하여 int8 모델을 삭제했습니다 (FP32 유지)")
+            return False
+
+        # 검증 통과 후에만 로더가 사용하는 이름으로 교체
+        tmp_path.replace(int8_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+    print(f"✅ int8 모델 생성 완료: {int8_path}")
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="ONNX 모델 int8 동적 양자화")
+    parser.add_argument("model_path", type=Path, help="FP32 ONNX 모델 경로")
+    parser.add_argument("--threshold", type=float, default=0.05, help="허용 최대 오차 (정규화된 출력 기준)")
+    parser.add_argument("--samples", type=int, default=32, help="검증 샘플 수")
+    parser.add_argument("--batch-size", type=int, default=2, help="검증 배치 크기 (시뮬레이션 추론과 동일하게 2, 배치 1 고정 모델은 자동으로 1)")
+    args = parser.parse_args()
+
+    ok = quantize_and_validate(args.model_path, args.threshold, args.samples, args.batch_size)
+    sys.exit(0 if ok else 1)
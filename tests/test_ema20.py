@@ -0,0 +1,40 @@
+"""
+data_fetcher.ema20 ↔ pandas ewm(span=20, adjust=False) 동등성 검증 + 간단한 벤치마크
+
+실행:
+    python -m pytest tests/test_ema20.py -q
+    PYTHONPATH=. python tests/test_ema20.py   # 벤치마크 출력
+"""
+
+import timeit
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.data_fetcher import ema20
+
+
+def _pandas_ema20(values: np.ndarray) -> np.ndarray:
+    return pd.Series(values).ewm(span=20, adjust=False).mean().to_numpy()
+
+
+@pytest.mark.parametrize("length", [0, 1, 2, 63, 64, 65, 128, 1000, 5000])
+def test_ema20_matches_pandas(length):
+    rng = np.random.default_rng(length)
+    prices = 450.0 + np.cumsum(rng.standard_normal(length))
+
+    np.testing.assert_allclose(ema20(prices), _pandas_ema20(prices), rtol=1e-12, atol=1e-9)
+
+
+def test_ema20_accepts_lists_and_mixed_sign_values():
+    values = [1.0, -2.0, 3.5, 0.0, -7.25, 10.0] * 30
+
+    np.testing.assert_allclose(ema20(values), _pandas_ema20(np.array(values)), rtol=1e-12, atol=1e-9)
+
+
+if __name__ == "__main__":
+    prices = 450.0 + np.cumsum(np.random.default_rng(0).standard_normal(120))
+    for name, fn in [("ema20", lambda: ema20(prices)), ("pandas ewm", lambda: _pandas_ema20(prices))]:
+        seconds = min(timeit.repeat(fn, number=1000, repeat=5)) / 1000
+        print(f"{name:12s}: {seconds * 1e6:8.1f} µs (120개)")